@@ -12,10 +12,17 @@ from chzzkpy.unofficial.chat import ChatClient as UnofficialChatClient
 from chzzkpy import Client, UserClient, UserPermission
 from chzzkpy.message import Message, Donation, Subscription
 from chzzkpy.unofficial.chat import MissionDonation, MissionParticipationDonation, SubscriptionGiftMessage, SubscriptionMessage
-from chzzkpy.error import HTTPException, ChatConnectFailed, NotFoundException
+from chzzkpy.error import HTTPException, ChatConnectFailed
 import secrets # For OAuth state
 
 from app.constants import USERPATH, AUTH_REDIRECT_URI, AUTH_FILE_PATH
+from app.core.chat_event import (ChatEvent, ANONYMOUS_NICK, anonymous_id, SUBSCRIPTION, SUBSCRIPTION_GIFT_RANDOM, SUBSCRIPTION_GIFT_TARGET,
+                                 MISSION_SUCCESS, MISSION_FAIL, MISSION_PENDING, MISSION_COST, MISSION_APPROVED, MISSION_REJECTED,
+                                 VIDEO_DONATION, CHEESE_DONATION, CHEESE_DONATION_MSG, OTHER_DONATION)
+from app.services.chat_log_writer import ChatLogWriter, DEFAULT_FLUSH_INTERVAL
+from app.services.chat_event_recorder import ChatEventRecorder
+from app.services.subscriber_store import get_subscriber_store
+from app.services.profile_lookup import get_profile_lookup_service, PROFILE_TTL
 
 class AsyncWorker(QThread):
     finished = pyqtSignal()
@@ -56,7 +63,7 @@ class Chatroom_Connector(QObject):
     run_chat_popup = pyqtSignal()
     two_tier_add = pyqtSignal()
     reconnect = pyqtSignal()
-    message = pyqtSignal(str, dict)
+    message = pyqtSignal(object) # ChatEvent
     update_connection_status = pyqtSignal(str)
     login_success = pyqtSignal()
     login_failure = pyqtSignal(str)
@@ -91,8 +98,8 @@ class Chatroom_Connector(QObject):
         
         self.unofficial_client_thread: threading.Thread | None = None
         
-        self.log_file_handle = None 
-        self.current_log_path = None
+        self.chat_log_writer: ChatLogWriter | None = None # 로그 파일 쓰기 전용 스레드
+        self.event_recorder: ChatEventRecorder | None = None # 이벤트 녹화 (BCU.ini chat_capture)
 
     def start_async_operations(self, instance):
         """Starts the main async worker thread."""
@@ -293,6 +300,15 @@ class Chatroom_Connector(QObject):
                 self.append_result_chat.emit(f"❗ 로그 파일 설정 오류: {e}")
                 self.log_file_path = ""
 
+            # --- 이벤트 녹화 (채팅 재생 벤치마크용) ---
+            settings = QSettings(os.path.join(USERPATH, "BCU", "BCU.ini"), QSettings.Format.IniFormat)
+            if settings.value('chat_capture', False, type=bool) and self.event_recorder is None:
+                try:
+                    self.event_recorder = ChatEventRecorder.for_channel(self.streamer_ID)
+                    self.append_result_chat.emit(f"⏺ 채팅 이벤트 녹화 중: {self.event_recorder.path}")
+                except Exception as e:
+                    self.append_result_chat.emit(f"❗ 채팅 이벤트 녹화 시작 오류: {e}")
+
             await self.check_live_status_unofficial(self.instance, is_periodic=True) 
             await self._connect_chat_socket()
 
@@ -310,20 +326,24 @@ class Chatroom_Connector(QObject):
 
         self.unofficial_client = UnofficialChatClient(channel_id=self.streamer_ID)
 
+        def mission_user(mission):
+            """미션 후원자 (닉네임, 아이디) - 익명이면 익명 토큰"""
+            if mission.is_anonymous == True:
+                try:
+                    return ANONYMOUS_NICK, mission.anonymous_token
+                except:
+                    return ANONYMOUS_NICK, "anon"
+            return mission.nickname, mission.user_id_hash
+
         @self.unofficial_client.event
         async def on_subscription(message: SubscriptionMessage):
-            time = (message.time+timedelta(hours=9)).strftime("%Y-%m-%d %H:%M:%S")
-            nick = message.profile.nickname
-            id = message.profile.user_id_hash
-            month = message.extras.month
-            tier_no = message.extras.tier_no
-            chatmsg = message.content.replace("\n"," ")
-            chat = (f"[{time}] <{nick} ({id})> 🟥⭐ {nick}님이 {tier_no}티어 {month}개월 정기구독을 갱신하였습니다! ⭐🟥 기념 메시지: {chatmsg}")
-            self.message.emit(chat, {'donation_type': '구독', 'time': time, 'nick': nick, 'id': id, 'tier': tier_no, 'month': month, 'msg': chatmsg})
-            await self.logWrite(self.instance, chat, self.log_file_path)
+            event = ChatEvent('구독', message.time+timedelta(hours=9), message.profile.nickname, message.profile.user_id_hash, SUBSCRIPTION,
+                              msg=message.content.replace("\n"," "), tier=message.extras.tier_no, month=message.extras.month)
+            await self.emit_event(event)
 
         @self.unofficial_client.event
         async def on_subscription_gift(message: SubscriptionGiftMessage):
+            created = message.time+timedelta(hours=9)
             gift_tier_no = message.extras.gift_tier_no
             sender_user_id = message.extras.sender_user_id
             sender_user_nick = ""
@@ -331,16 +351,10 @@ class Chatroom_Connector(QObject):
             if gift_quantity == None: gift_quantity = 1
 
             if sender_user_id == None or message.profile == None:
-                sender_user_nick = "익명의 후원자"
-                sec = (message.time+timedelta(hours=9)).strftime("%H%M%S")
-                sender_user_id = f"anon{sec}"
+                sender_user_nick = ANONYMOUS_NICK
+                sender_user_id = anonymous_id(created)
             else: sender_user_nick = message.profile.nickname
 
-            try:
-                receiver_user_id = message.extras.receiver_user_id
-            except:
-                receiver_user_id = "(받은이 아이디)"
-            
             try:
                 receiver_user_nick = message.extras.receiver_user
             except:
@@ -351,124 +365,48 @@ class Chatroom_Connector(QObject):
             except:
                 selection_type = "RANDOM"
 
-            time = (message.time+timedelta(hours=9)).strftime("%Y-%m-%d %H:%M:%S")
-
             if selection_type == "RANDOM": # 랜덤 선물
-                chat = (f"[{time}] <{sender_user_nick} ({sender_user_id})> 🟥⭐ {sender_user_nick}님이 {gift_tier_no}티어 구독권 {gift_quantity}개를 선물했습니다! ⭐🟥")
-                self.message.emit(chat, {'donation_type': '구독선물', 'time': time, 'nick': sender_user_nick, 'id': sender_user_id, 'selection_type': selection_type, 'quantity': gift_quantity, 'tier': gift_tier_no})
+                event = ChatEvent('구독선물', created, sender_user_nick, sender_user_id, SUBSCRIPTION_GIFT_RANDOM,
+                                  selection_type=selection_type, quantity=gift_quantity, tier=gift_tier_no)
             else: # 지정 선물
-                chat = (f"[{time}] <{sender_user_nick} ({sender_user_id})> 🟥⭐ {sender_user_nick}님이 {gift_tier_no}티어 구독권을 {receiver_user_nick}에게 선물했습니다! ⭐🟥")
-                self.message.emit(chat, {'donation_type': '구독선물', 'time': time, 'nick': sender_user_nick, 'id': sender_user_id, 'selection_type': selection_type, 'receiver_nick': receiver_user_nick, 'quantity': gift_quantity, 'tier': gift_tier_no})
-            await self.logWrite(self.instance, chat, self.log_file_path)
+                event = ChatEvent('구독선물', created, sender_user_nick, sender_user_id, SUBSCRIPTION_GIFT_TARGET,
+                                  selection_type=selection_type, receiver_nick=receiver_user_nick, quantity=gift_quantity, tier=gift_tier_no)
+            await self.emit_event(event)
 
         @self.unofficial_client.event
         async def on_mission_completed(mission: MissionDonation): # 미션 성공/실패
-            chat = ""
-            time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            sec = datetime.now().strftime("%H%M%S")
-            if mission.is_anonymous == True:
-                nick = "익명의 후원자"
-                id = "anon"
-                try:
-                    id = mission.anonymous_token
-                except:
-                    None
-            else:
-                nick = mission.nickname
-                id = mission.user_id_hash
-            cheese_num = mission.total_pay_amount
-            pnum = mission.participation_count
-
+            nick, id = mission_user(mission)
             if mission.success == True: # 성공
-                chat = (f"[{time}] <{nick} ({id})> 🟥⭐ {nick}님 외 {pnum}명의 미션 성공! {cheese_num}치즈 획득! ⭐🟥 미션 내용: {mission.mission_text}")
-                self.message.emit(chat, {'donation_type': '미션성공', 'time': time, 'nick': nick, 'id': id, 'cheese': cheese_num, 'pnum': pnum, 'msg': mission.mission_text})
-                await self.logWrite(self.instance, chat, self.log_file_path)
+                donation_type, template = '미션성공', MISSION_SUCCESS
             else: # 실패
-                chat = (f"[{time}] <{nick} ({id})> 🟥⭐ {nick}님 외 {pnum}명의 미션 실패.. {cheese_num}치즈 획득 실패.. ⭐🟥 미션 내용: {mission.mission_text}")
-                self.message.emit(chat, {'donation_type': '미션실패', 'time': time, 'nick': nick, 'id': id, 'cheese': cheese_num, 'pnum': pnum, 'msg': mission.mission_text})
-                await self.logWrite(self.instance, chat, self.log_file_path)
+                donation_type, template = '미션실패', MISSION_FAIL
+            await self.emit_event(ChatEvent(donation_type, datetime.now(), nick, id, template,
+                                            cheese=mission.total_pay_amount, pnum=mission.participation_count, msg=mission.mission_text))
 
         @self.unofficial_client.event
         async def on_mission_pending(mission: MissionDonation): # 미션 수락 대기중
-            chat = ""
-            time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            sec = datetime.now().strftime("%H%M%S")
-            if mission.is_anonymous == True:
-                nick = "익명의 후원자"
-                id = "anon"
-                try:
-                    id = mission.anonymous_token
-                except:
-                    None
-            else:
-                nick = mission.nickname
-                id = mission.user_id_hash
-            cheese_num = mission.total_pay_amount
-            chat = (f"[{time}] <{nick} ({id})> 🟥⭐ {nick}님의 미션 대기 중! {cheese_num}치즈 후원! ⭐🟥 미션 내용: {mission.mission_text}")
-            self.message.emit(chat, {'donation_type': '미션대기', 'time': time, 'nick': nick, 'id': id, 'cheese': cheese_num, 'msg': mission.mission_text})
-            await self.logWrite(self.instance, chat, self.log_file_path)
+            nick, id = mission_user(mission)
+            await self.emit_event(ChatEvent('미션대기', datetime.now(), nick, id, MISSION_PENDING,
+                                            cheese=mission.total_pay_amount, msg=mission.mission_text))
             self.auto_mission.emit()
         
         @self.unofficial_client.event
         async def on_mission_update_cost(mission: MissionParticipationDonation): # 미션 추가금
-            chat = ""
-            time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            sec = datetime.now().strftime("%H%M%S")
-            if mission.is_anonymous == True:
-                nick = "익명의 후원자"
-                id = "anon"
-                try:
-                    id =mission.anonymous_token
-                except:
-                    None
-            else:
-                nick = mission.nickname
-                id = mission.user_id_hash
-            cheese_num = mission.pay_amount
-            cheese_num_sum = mission.total_pay_amount
-            chat = (f"[{time}] <{nick} ({id})> 🟥⭐ {nick}님이 미션 추가금 {cheese_num}치즈 후원! 미션금 총 {cheese_num_sum}치즈 ⭐🟥 미션 내용: {mission.mission_text}")
-            self.message.emit(chat, {'donation_type': '미션', 'time': time, 'nick': nick, 'id': id, 'cheese': cheese_num, 'sum': cheese_num_sum, 'msg': mission.mission_text})
-            await self.logWrite(self.instance, chat, self.log_file_path)
+            nick, id = mission_user(mission)
+            await self.emit_event(ChatEvent('미션', datetime.now(), nick, id, MISSION_COST,
+                                            cheese=mission.pay_amount, sum=mission.total_pay_amount, msg=mission.mission_text))
         
         @self.unofficial_client.event
         async def on_mission_approved(mission: MissionDonation): # 미션 수락
-            chat = ""
-            time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            sec = datetime.now().strftime("%H%M%S")
-            if mission.is_anonymous == True:
-                nick = "익명의 후원자"
-                id = "anon"
-                try:
-                    id = mission.anonymous_token
-                except:
-                    None
-            else:
-                nick = mission.nickname
-                id = mission.user_id_hash
-            cheese_num = mission.total_pay_amount
-            chat = (f"[{time}] <{nick} ({id})> 🟥⭐ {nick}님의 미션 수락! 미션금 총 {cheese_num}치즈 ⭐🟥 미션 내용: {mission.mission_text}")
-            self.message.emit(chat, {'donation_type': '미션수락', 'time': time, 'nick': nick, 'id': id, 'cheese': cheese_num, 'msg': mission.mission_text})
-            await self.logWrite(self.instance, chat, self.log_file_path)
+            nick, id = mission_user(mission)
+            await self.emit_event(ChatEvent('미션수락', datetime.now(), nick, id, MISSION_APPROVED,
+                                            cheese=mission.total_pay_amount, msg=mission.mission_text))
         
         @self.unofficial_client.event
         async def on_mission_rejected(mission: MissionDonation): # 미션 거절
-            chat = ""
-            time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            sec = datetime.now().strftime("%H%M%S")
-            if mission.is_anonymous == True:
-                nick = "익명의 후원자"
-                id = "anon"
-                try:
-                    id = mission.anonymous_token
-                except:
-                    None
-            else:
-                nick = mission.nickname
-                id = mission.user_id_hash
-            cheese_num = mission.total_pay_amount
-            chat = (f"[{time}] <{nick} ({id})> 🟥⭐ {nick}님의 미션 거절! {cheese_num}치즈 획득 실패! ⭐🟥 미션 내용: {mission.mission_text}")
-            self.message.emit(chat, {'donation_type': '미션거절', 'time': time, 'nick': nick, 'id': id, 'cheese': cheese_num, 'msg': mission.mission_text})
-            await self.logWrite(self.instance, chat, self.log_file_path)
+            nick, id = mission_user(mission)
+            await self.emit_event(ChatEvent('미션거절', datetime.now(), nick, id, MISSION_REJECTED,
+                                            cheese=mission.total_pay_amount, msg=mission.mission_text))
         
         @self.unofficial_client.event
         async def on_connect():
@@ -516,23 +454,25 @@ class Chatroom_Connector(QObject):
             self.update_connection_status.emit("채팅창: 🔴연결 오류")
             
     def close_log_file(self):
-        """열려 있는 로그 파일을 안전하게 닫습니다."""
-        if self.log_file_handle:
+        """쓰기 대기 중인 로그를 모두 기록하고 로그 파일(과 이벤트 녹화 파일)을 닫습니다."""
+        writer = self.chat_log_writer
+        self.chat_log_writer = None
+        if writer:
             try:
-                self.log_file_handle.close()
+                writer.close()
                 print("Log file closed successfully.")
             except Exception as e:
                 print(f"Error closing log file: {e}")
-            finally:
-                self.log_file_handle = None
-                self.current_log_path = None
+        recorder = self.event_recorder
+        self.event_recorder = None
+        if recorder: recorder.close()
 
     async def cleanup_async(self):
         """모든 비동기 작업 및 연결 정리"""
         print("Running async cleanup...")
         self.is_running = False
         
-        self.close_log_file()
+        await asyncio.to_thread(self.close_log_file)
         
         if self.live_check_task and not self.live_check_task.done():
             self.live_check_task.cancel()
@@ -723,47 +663,38 @@ class Chatroom_Connector(QObject):
             self.append_result_chat.emit(f"❗ [비공식] 방송 상태 확인 중 오류: {e}")
             return True
 
-    async def periodic_live_check(self, instance):
-        """비공식 API로 주기적 라이브 상태 확인"""
-        print("Starting periodic live check task (unofficial).")
-        while self.is_running:
-            if self.streamer_ID:
-                await self.check_live_status_unofficial(instance, is_periodic=True)
-            await asyncio.sleep(60)
-        print("Stopping periodic live check task.")
+    def request_live_check(self):
+        """(GUI 스레드) 메인 윈도우 스케줄러가 주기적으로 호출 - 비공식 API 방송 상태 확인을 asyncio 루프에 요청"""
+        if not self.is_running or not self.streamer_ID: return
+        if self.async_worker and self.async_worker.loop and self.async_worker.loop.is_running():
+            self.async_worker.loop.call_soon_threadsafe(self._start_live_check)
+
+    def _start_live_check(self):
+        """(asyncio 스레드) 이전 확인이 끝났을 때만 새로 시작"""
+        if self.is_running and (self.live_check_task is None or self.live_check_task.done()):
+            self.live_check_task = asyncio.ensure_future(self.check_live_status_unofficial(self.instance, is_periodic=True))
+
+    async def emit_event(self, event):
+        """이벤트를 UI에 전달하고 로그 파일에 기록"""
+        if self.event_recorder: self.event_recorder.record(event)
+        self.message.emit(event)
+        if event.donation_type != '채팅' and event.nick != ANONYMOUS_NICK: # 후원자 프로필 미리 조회 (유저 검색 시 바로 표시)
+            get_profile_lookup_service().prefetch(self.unofficial_client, event.id)
+        await self.logWrite(self.instance, event.line, self.log_file_path)
 
     async def logWrite(self, instance, chat_string, log_file_path):
-        """로그 파일 작성 (최적화: 파일 핸들 유지)"""
+        """로그 파일 작성 요청 (실제 쓰기/flush/날짜 변경은 ChatLogWriter 스레드에서 처리)"""
         if not log_file_path or not self.streamer_ID: return
-        try:
-            path = os.path.dirname(log_file_path)
-            
-            # 날짜/ID 체크 및 경로 갱신 로직
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            target_log_path = log_file_path
-            
-            if current_date not in os.path.basename(log_file_path) or self.streamer_ID not in os.path.basename(log_file_path):
-                base_log_name = f"{current_date}_#{self.streamer_ID}.log"
-                target_log_path = os.path.join(path, base_log_name)
-                self.log_file_path = target_log_path # 멤버 변수 업데이트
-
-            # [핵심] 파일이 열려있지 않거나 경로가 바뀌었으면 새로 열기
-            if self.log_file_handle is None or self.current_log_path != target_log_path:
-                self.close_log_file() # 기존 파일 닫기
-                os.makedirs(path, exist_ok=True)
-                self.log_file_handle = open(target_log_path, "a", encoding="UTF8")
-                self.current_log_path = target_log_path
-
-            # 파일 쓰기 및 플러시(즉시 저장)
-            self.log_file_handle.write(chat_string + "\n")
-            self.log_file_handle.flush() 
-            
-            # QApplication.processEvents() # <- 렉 유발 원인이므로 제거함
-
-        except Exception as e:
-            print(f"Error writing to log file: {e}")
-            self.close_log_file() # 에러 발생 시 핸들 초기화
-            self.append_result_chat.emit(f"❗ 로그 쓰기 오류: {e}")
+        log_dir = os.path.dirname(log_file_path)
+        writer = self.chat_log_writer
+        if writer is None or writer.log_dir != log_dir or writer.streamer_id != self.streamer_ID:
+            if writer: writer.close()
+            settings = QSettings(os.path.join(USERPATH, "BCU", "BCU.ini"), QSettings.Format.IniFormat)
+            flush_interval = settings.value('chat_log_flush_interval', DEFAULT_FLUSH_INTERVAL, type=float)
+            writer = ChatLogWriter(log_dir, self.streamer_ID, flush_interval=flush_interval,
+                                   on_error=lambda e: self.append_result_chat.emit(f"❗ 로그 쓰기 오류: {e}"))
+            self.chat_log_writer = writer
+        writer.write(chat_string)
 
     def timedelta_to_hms(self, date_time):
         total_seconds = abs(int(date_time.total_seconds()))
@@ -826,10 +757,7 @@ class Chatroom_Connector(QObject):
             self.update_connection_status.emit("채팅창: 🟢연결됨")
             self.append_result_chat.emit("✅ [공식] 채팅 서버 연결 성공!")
 
-            #self.append_result_chat.emit("✅ [공식] 라이브 상태 확인 중...")
-            if self.async_worker and self.async_worker.loop:
-                if self.live_check_task is None or self.live_check_task.done():
-                    self.live_check_task = self.async_worker.loop.create_task(self.periodic_live_check(self.instance))
+            # (주기적인 방송 상태 확인은 메인 윈도우 스케줄러의 live_status 작업이 request_live_check 로 요청)
             
             if self.instance.settings_tab.auto_chat_popup_start.isChecked():
                 self.run_chat_popup.emit()
@@ -837,16 +765,8 @@ class Chatroom_Connector(QObject):
             try:
                 if self.user_client:
                     #self.append_result_chat.emit("📜 2티어 구독자 목록 조회 중...")
-                    QApplication.processEvents()
-                    page_no = 0
-                    tier2_nicks = []
-                    while True:
-                        sub_result = await self.user_client.get_subscribers(size=50, page=page_no)
-                        tier2_nicks.extend([sub.user_name for sub in sub_result.data if sub.tier_no == 2])
-                        if sub_result.data is None or len(sub_result.data) < 50:
-                            break
-                        page_no += 1
-                    self.instance.two_tier_user_list = tier2_nicks
+                    store = await self.refresh_subscribers()
+                    self.instance.two_tier_user_list = store.nicknames(tier=2)
                     self.two_tier_add.emit()
                     #self.append_result_chat.emit(f"✅ 2티어 구독자 {len(tier2_nicks)}명 로드 완료.")
             except Exception as e:
@@ -866,14 +786,8 @@ class Chatroom_Connector(QObject):
             try:
                 nick = message.profile.nickname if message.profile else "알수없음"
                 user_id = message.user_id
-                time_str = (message.created_time+timedelta(hours=9)).strftime("%Y-%m-%d %H:%M:%S")
                 msg = message.content.replace('\n', " ") if message.content else ""
-
-                chat_str = f"[{time_str}] <{nick} ({user_id})> {msg}"
-                chat_data = {'donation_type': '채팅', 'time': time_str, 'nick': nick, 'id': user_id, 'msg': msg}
-
-                self.message.emit(chat_str, chat_data)
-                await self.logWrite(self.instance, chat_str, self.log_file_path)
+                await self.emit_event(ChatEvent('채팅', message.created_time+timedelta(hours=9), nick, user_id, msg=msg))
                 
                 # # --- 자동 밴 로직 (공식 API 기준) ---
                 # settings = QSettings(os.path.join(USERPATH, "BCU", "bansettings.ini"))
@@ -944,42 +858,31 @@ class Chatroom_Connector(QObject):
         async def on_donation(donation: Donation):
             """공식 API 후원(치즈/영상) 메시지 수신"""
             try:
-                time_obj = (donation.created_time+timedelta(hours=9)) if hasattr(donation, 'created_time') else datetime.now()
-                time_str = time_obj.strftime("%Y-%m-%d %H:%M:%S")
-                sec_str = time_obj.strftime("%H%M%S")
+                created = (donation.created_time+timedelta(hours=9)) if hasattr(donation, 'created_time') else datetime.now()
                 
                 is_anonymous = not bool(donation.donator_name)
-                nick = donation.donator_name if not is_anonymous else "익명의 후원자"
-                user_id = donation.donator_id if not is_anonymous else f"anon{sec_str}"
+                nick = donation.donator_name if not is_anonymous else ANONYMOUS_NICK
+                user_id = donation.donator_id if not is_anonymous else anonymous_id(created)
                 cheese_num = donation.pay_amount
                 donation_type_str = donation.type
                 donation_text = donation.donation_text
 
-                chat_str = ""
-                donation_data = {}
-
                 if donation_type_str == 'VIDEO':
                     tier = "1"
                     try:
-                        if nick != "익명의 후원자":
+                        if nick != ANONYMOUS_NICK:
                             if nick in self.instance.two_tier_user_list:
                                 tier = "2"
                     except:
                         None
-                    videotitle = donation_text
-                    chat_str = f"[{time_str}] <{nick} ({user_id})> 🟥⭐ 영상후원 {cheese_num}치즈! ⭐🟥 영상 제목: {videotitle}"
-                    donation_data = {'donation_type': '영상후원', 'time': time_str, 'nick': nick, 'id': user_id, 'cheese': cheese_num, 'sec': cheese_num, 'title': videotitle, 'tier': tier}
+                    event = ChatEvent('영상후원', created, nick, user_id, VIDEO_DONATION, cheese=cheese_num, sec=cheese_num, title=donation_text, tier=tier)
                 elif donation_type_str == 'CHAT':
                     chatmsg = donation_text.replace('\n', " ") if donation_text else ""
-                    chat_str = f"[{time_str}] <{nick} ({user_id})> 🟥⭐ 치즈후원 {cheese_num}치즈! ⭐🟥"
-                    if chatmsg: chat_str += f" 메시지: {chatmsg}"
-                    donation_data = {'donation_type': '치즈', 'time': time_str, 'nick': nick, 'id': user_id, 'msg': chatmsg, 'cheese': cheese_num}
+                    event = ChatEvent('치즈', created, nick, user_id, CHEESE_DONATION_MSG if chatmsg else CHEESE_DONATION, msg=chatmsg, cheese=cheese_num)
                 else:
-                     chat_str = f"[{time_str}] <{nick} ({user_id})> 🟥⭐ 알 수 없는 후원 ({donation_type_str}) {cheese_num}치즈! ⭐🟥 내용: {donation_text}"
-                     donation_data = {'donation_type': '기타후원', 'time': time_str, 'nick': nick, 'id': id, 'cheese': cheese_num, 'msg': donation_text}
+                    event = ChatEvent('기타후원', created, nick, user_id, OTHER_DONATION, cheese=cheese_num, title=donation_type_str, msg=donation_text)
 
-                self.message.emit(chat_str, donation_data)
-                await self.logWrite(self.instance, chat_str, self.log_file_path)
+                await self.emit_event(event)
             except Exception as e: print(f"Error in on_donation handler: {e}"); traceback.print_exc()
 
 
@@ -1043,37 +946,23 @@ class Chatroom_Connector(QObject):
         else:
             self.append_result_chat.emit("❗ 구독자 목록 요청 실패: 연결되지 않음")
 
+    async def refresh_subscribers(self, full=False, max_age=0):
+        """(비동기) 저장된 구독자 목록을 새 구독만 받아 갱신 (필요하면 전체) 후 SubscriberStore 반환"""
+        store = get_subscriber_store(self.user_client.channel_id)
+        changed = await store.refresh(self.user_client, full=full, max_age=max_age)
+        if changed: print(f"[SubscriberStore] {changed} subscribers updated ({len(store)} total)")
+        return store
+
     async def _async_fetch_all_subscribers(self):
-        """(비동기) 전체 구독자 목록 순회 및 시그널 방출"""
+        """(비동기) 구독자 목록 갱신 및 시그널 방출 (pick_tab 은 닉네임으로 거름)"""
         if not self.user_client:
             self.append_result_chat.emit("❗ 구독자 목록 조회 실패: 인증되지 않음")
             return
 
         try:
-            self.append_result_chat.emit("📜 전체 구독자 목록 로딩 중... (시간이 걸릴 수 있습니다)")
-            all_subscribers = []
-            page_no = 0
-            while True:
-                # size=500 is unofficial limit? Safest is 50-100 usually, but let's try 50 loop
-                sub_result = await self.user_client.get_subscribers(size=50, page=page_no)
-                if not sub_result.data:
-                    break
-                
-                # Store necessary data. 
-                # We need nickname for filtering pick_list (which contains nicknames)
-                # But nicknames can change. ideally ID.
-                # But pick_tab stores nicknames.
-                # So we store nicknames.
-                for sub in sub_result.data:
-                    all_subscribers.append(sub.user_name)
-                    
-                if len(sub_result.data) < 50:
-                    break
-                page_no += 1
-                await asyncio.sleep(0.1) # Prevent rate limit
-            
-            self.append_result_chat.emit(f"✅ 전체 구독자 {len(all_subscribers)}명 로드 완료.")
-            self.subscribers_fetched.emit(all_subscribers)
+            store = await self.refresh_subscribers()
+            self.append_result_chat.emit(f"✅ 전체 구독자 {len(store)}명 로드 완료.")
+            self.subscribers_fetched.emit(store.nicknames())
             
         except HTTPException as e:
             self.append_result_chat.emit(f"❗ 구독자 목록 조회 실패 (HTTP {e.status}): {e.message}")
@@ -1089,27 +978,15 @@ class Chatroom_Connector(QObject):
         self.instance.ban_label_chat_log.setText("활동 제한 수: (정보 없음)")
         QApplication.processEvents()
 
-        found_sub = None
-        follow_date_str = "팔로우하지 않음 / 정보 없음"
         target_user_id = user_id_or_nick 
         target_user_nick = user_id_or_nick 
 
         is_searching_self = self.user_client and self.user_client.channel_id == self.streamer_ID
 
+        subscriber_store = None
         if self.user_client and is_searching_self:
             try:
-                sub_result = await self.user_client.get_subscribers(size=100) # Simplified
-                for sub in sub_result.data:
-                    if sub.user_name == user_id_or_nick or sub.user_id == user_id_or_nick:
-                        found_sub = sub
-                        target_user_nick = sub.user_name
-                        target_user_id = sub.user_id # Official ID
-                        break
-                if found_sub:
-                    subscribe_text = f"구독: {found_sub.tier_no}티어 {found_sub.month}개월 (플랫폼 구분 불가)"
-                    self.instance.subscribe_label_chat_log.setText(subscribe_text)
-                else:
-                    self.instance.subscribe_label_chat_log.setText("구독: 구독하지 않음 / 정보 없음")
+                subscriber_store = await self.refresh_subscribers(max_age=PROFILE_TTL)
             except Exception as e:
                  self.instance.subscribe_label_chat_log.setText("구독: (조회 오류)")
                  print(f"Error searching subscribers: {e}")
@@ -1125,22 +1002,28 @@ class Chatroom_Connector(QObject):
                 self.append_result_chat.emit(f"🔍 유저 정보 조회 완료: {target_user_nick} ({target_user_id})")
                 return
 
-        if self.unofficial_client:
-             try:
-                  user_profile_data = await self.unofficial_client.profile_card(user_id_or_nick) 
-                  if user_profile_data and user_profile_data.streaming_property and user_profile_data.streaming_property.following_date:
-                       follow_date_str = f"팔로우 날짜: {user_profile_data.streaming_property.following_date}"
-                       if target_user_nick == user_id_or_nick and user_profile_data.nickname:
-                            target_user_nick = user_profile_data.nickname
-                  else:
-                       follow_date_str = "팔로우 날짜: 팔로우하지 않음"
-                  self.instance.follow_date_label_chat_log.setText(follow_date_str)
-             except NotFoundException:
+        found_sub = subscriber_store.get(user_id_or_nick) if subscriber_store else None
+        try:
+             # 팔로우 날짜/닉네임은 ProfileLookupService 캐시 (같은 유저 반복 조회 시 API 재호출 없음)
+             profile = await get_profile_lookup_service().lookup(self.unofficial_client, user_id_or_nick, subscriber_store)
+             if profile.not_found:
                   self.instance.follow_date_label_chat_log.setText("팔로우 날짜: (사용자 정보 없음)")
-             except Exception as e:
-                  self.instance.follow_date_label_chat_log.setText("팔로우 날짜: (조회 오류)")
-                  print(f"Error fetching follow date (unofficial): {e}")
-        else:
-             self.instance.follow_date_label_chat_log.setText("팔로우 날짜: (조회 불가 - 내부 오류)")
+             elif profile.following_date:
+                  self.instance.follow_date_label_chat_log.setText(f"팔로우 날짜: {profile.following_date}")
+             else:
+                  self.instance.follow_date_label_chat_log.setText("팔로우 날짜: 팔로우하지 않음")
+             if target_user_nick == user_id_or_nick and profile.nick:
+                  target_user_nick = profile.nick
+             found_sub = profile.subscription or found_sub
+        except Exception as e:
+             self.instance.follow_date_label_chat_log.setText("팔로우 날짜: (조회 오류)")
+             print(f"Error fetching follow date (unofficial): {e}")
+
+        if found_sub:
+            target_user_nick = found_sub["nick"]
+            target_user_id = found_sub["user_id"] # Official ID
+            self.instance.subscribe_label_chat_log.setText(f"구독: {found_sub['tier']}티어 {found_sub['month']}개월 (플랫폼 구분 불가)")
+        elif subscriber_store is not None:
+            self.instance.subscribe_label_chat_log.setText("구독: 구독하지 않음 / 정보 없음")
 
         self.append_result_chat.emit(f"🔍 유저 정보 조회 완료: {target_user_nick} ({target_user_id})")
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+Chat Event
+
+Chatroom_Connector/ChatSimulator 가 만드는 채팅/후원/구독/미션 이벤트 한 건.
+- 이전의 (로그 문자열, dict) 쌍을 대신합니다. 커넥터에서 한 번 만들어 로그 기록, 채팅창 표시, 투표, 추첨, 후원 목록이 함께 사용합니다.
+- __slots__ 로 메시지마다 dict 를 만들지 않고, 시간 문자열/로그 줄/표시 줄은 처음 사용할 때 한 번만 만듭니다.
+- 기존 처리기 호환을 위해 event.get("nick", "") / event["id"] 처럼 dict 방식으로도 읽을 수 있습니다.
+"""
+
+from datetime import datetime
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+ANONYMOUS_NICK = "익명의 후원자"
+
+# 이벤트 본문 (로그 줄의 "<닉네임 (아이디)> " 뒤 부분) - {e.필드} 로 이벤트 값을 넣음
+CHAT = "{e.msg}"
+SUBSCRIPTION = "🟥⭐ {e.nick}님이 {e.tier}티어 {e.month}개월 정기구독을 갱신하였습니다! ⭐🟥 기념 메시지: {e.msg}"
+SUBSCRIPTION_GIFT_RANDOM = "🟥⭐ {e.nick}님이 {e.tier}티어 구독권 {e.quantity}개를 선물했습니다! ⭐🟥"
+SUBSCRIPTION_GIFT_TARGET = "🟥⭐ {e.nick}님이 {e.tier}티어 구독권을 {e.receiver_nick}에게 선물했습니다! ⭐🟥"
+MISSION_SUCCESS = "🟥⭐ {e.nick}님 외 {e.pnum}명의 미션 성공! {e.cheese}치즈 획득! ⭐🟥 미션 내용: {e.msg}"
+MISSION_FAIL = "🟥⭐ {e.nick}님 외 {e.pnum}명의 미션 실패.. {e.cheese}치즈 획득 실패.. ⭐🟥 미션 내용: {e.msg}"
+MISSION_PENDING = "🟥⭐ {e.nick}님의 미션 대기 중! {e.cheese}치즈 후원! ⭐🟥 미션 내용: {e.msg}"
+MISSION_COST = "🟥⭐ {e.nick}님이 미션 추가금 {e.cheese}치즈 후원! 미션금 총 {e.sum}치즈 ⭐🟥 미션 내용: {e.msg}"
+MISSION_APPROVED = "🟥⭐ {e.nick}님의 미션 수락! 미션금 총 {e.cheese}치즈 ⭐🟥 미션 내용: {e.msg}"
+MISSION_REJECTED = "🟥⭐ {e.nick}님의 미션 거절! {e.cheese}치즈 획득 실패! ⭐🟥 미션 내용: {e.msg}"
+VIDEO_DONATION = "🟥⭐ 영상후원 {e.cheese}치즈! ⭐🟥 영상 제목: {e.title}"
+CHEESE_DONATION = "🟥⭐ 치즈후원 {e.cheese}치즈! ⭐🟥"
+CHEESE_DONATION_MSG = "🟥⭐ 치즈후원 {e.cheese}치즈! ⭐🟥 메시지: {e.msg}"
+OTHER_DONATION = "🟥⭐ 알 수 없는 후원 ({e.title}) {e.cheese}치즈! ⭐🟥 내용: {e.msg}"
+
+# 녹화 파일 등에 저장할 때 쓰는 템플릿 이름
+TEMPLATES = {name: value for name, value in globals().items() if name.isupper() and name not in ("TIME_FORMAT", "ANONYMOUS_NICK")}
+TEMPLATE_NAMES = {value: name for name, value in TEMPLATES.items()}
+
+_last_time = (None, "") # (초 단위 datetime, 문자열) - 튜플 하나로 읽고 바꿔서 스레드 간에 어긋나지 않음
+
+
+def format_time(created):
+    """datetime -> "YYYY-MM-DD HH:MM:SS" (같은 초의 이벤트는 이전 결과를 재사용)"""
+    global _last_time
+    second = created.replace(microsecond=0)
+    last_second, time_str = _last_time
+    if second != last_second:
+        time_str = created.strftime(TIME_FORMAT)
+        _last_time = (second, time_str)
+    return time_str
+
+
+def anonymous_id(created):
+    """익명 후원자 아이디 (anon + 시분초)"""
+    return f"anon{created:%H%M%S}"
+
+
+class ChatEvent:
+    __slots__ = ("donation_type", "created", "nick", "id", "msg", "cheese", "sum", "pnum", "sec", "title", "tier",
+                 "month", "quantity", "selection_type", "receiver_nick", "template", "_time", "_body", "_line", "_display")
+    FIELDS = __slots__[:15] # dict 방식으로 읽을 수 있는 값 (template 이하는 내부용)
+
+    def __init__(self, donation_type, created, nick, id, template=CHAT, msg=None, cheese=None, sum=None, pnum=None,
+                 sec=None, title=None, tier=None, month=None, quantity=None, selection_type=None, receiver_nick=None):
+        self.donation_type = donation_type
+        self.created = created # datetime (한국 시간)
+        self.nick = nick
+        self.id = id
+        self.msg = msg
+        self.cheese = cheese
+        self.sum = sum
+        self.pnum = pnum
+        self.sec = sec
+        self.title = title # 영상 제목 (기타후원은 후원 종류)
+        self.tier = tier
+        self.month = month
+        self.quantity = quantity
+        self.selection_type = selection_type
+        self.receiver_nick = receiver_nick
+        self.template = template
+        self._time = None
+        self._body = None
+        self._line = None
+        self._display = None
+
+    @property
+    def time(self):
+        if self._time is None:
+            self._time = format_time(self.created)
+        return self._time
+
+    @property
+    def body(self):
+        if self._body is None:
+            self._body = self.template.format(e=self)
+        return self._body
+
+    @property
+    def line(self):
+        """로그 파일/채팅 모아보기 형식: [시간] <닉네임 (아이디)> 본문"""
+        if self._line is None:
+            self._line = f"[{self.time}] <{self.nick} ({self.id})> {self.body}"
+        return self._line
+
+    @property
+    def display(self):
+        """채팅창 표시 형식: [시간] <닉네임> 본문"""
+        if self._display is None:
+            self._display = f"[{self.time}] <{self.nick}> {self.body}"
+        return self._display
+
+    # --- dict 호환 ---
+    def get(self, key, default=None):
+        if key == "time": return self.time
+        if key not in ChatEvent.FIELDS: return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None: raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def to_dict(self):
+        data = {"donation_type": self.donation_type, "time": self.time}
+        for key in ChatEvent.FIELDS[2:]:
+            value = getattr(self, key)
+            if value is not None: data[key] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data, template=CHAT):
+        """to_dict() 결과로 이벤트를 다시 만듦"""
+        fields = {key: data[key] for key in ChatEvent.FIELDS[4:] if key in data}
+        created = datetime.strptime(data["time"], TIME_FORMAT)
+        return cls(data.get("donation_type", "채팅"), created, data.get("nick", ""), data.get("id", ""), template, **fields)
+
+    def __str__(self):
+        return self.line
+
+    def __repr__(self):
+        return f"ChatEvent({self.donation_type!r}, {self.line!r})"
@@ -0,0 +1,106 @@
+"""
+Message Batcher
+
+Chatroom_Connector(asyncio/비공식 클라이언트 스레드)에서 들어온 ChatEvent 를 모아 GUI 스레드에 묶음으로 전달합니다.
+- 메시지마다 GUI 이벤트 큐에 넣지 않고 묶음당 한 번만 GUI 스레드를 깨웁니다.
+  (첫 메시지 후 interval_ms 가 지나거나 max_batch 개가 모이면 batch 시그널 발생)
+- push() 는 어느 스레드에서나 호출할 수 있습니다. (connector.message 를 DirectConnection 으로 연결)
+- interval_ms 가 0 이면 메시지마다 바로 전달합니다. (이전 방식)
+- stats() 로 묶음 크기, 대기 시간(첫 메시지 도착 ~ 전달), 처리 시간을 확인할 수 있습니다.
+"""
+
+import time
+import threading
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+DEFAULT_INTERVAL_MS = 50
+DEFAULT_MAX_BATCH = 200
+SLOW_BATCH_MS = 500 # 대기+처리 시간이 이보다 길면 로그 출력
+
+
+class MessageBatcher(QObject):
+    batch = pyqtSignal(list) # [ChatEvent, ...]
+    _wake = pyqtSignal(bool) # 작업 스레드 -> GUI 스레드 (True: 바로 전달)
+
+    def __init__(self, interval_ms=DEFAULT_INTERVAL_MS, max_batch=DEFAULT_MAX_BATCH, parent=None):
+        """GUI 스레드에서 생성해야 합니다."""
+        super().__init__(parent)
+        self.interval_ms = max(0, int(interval_ms))
+        self.max_batch = max(1, int(max_batch))
+        self._lock = threading.Lock()
+        self._pending = []
+        self._first_time = 0.0 # 묶음의 첫 메시지가 도착한 시각 (perf_counter)
+        self._wake_sent = False
+        self._flush_sent = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self._wake.connect(self._on_wake, Qt.ConnectionType.QueuedConnection)
+
+        # 상태 카운터
+        self.batches = 0
+        self.messages = 0
+        self.last_batch_size = 0
+        self.last_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self.avg_latency_ms = 0.0 # 지수 이동 평균
+        self.last_handle_ms = 0.0
+        self.total_handle_ms = 0.0 # GUI 스레드에서 batch 처리에 쓴 시간 합계
+
+    # --- 호출 측 (아무 스레드) ---
+    def push(self, event):
+        with self._lock:
+            if not self._pending:
+                self._first_time = time.perf_counter()
+            self._pending.append(event)
+            urgent = self.interval_ms == 0 or len(self._pending) >= self.max_batch
+            if urgent:
+                if self._flush_sent: return
+                self._flush_sent = True
+            else:
+                if self._wake_sent: return
+                self._wake_sent = True
+        self._wake.emit(urgent)
+
+    # --- GUI 스레드 ---
+    def _on_wake(self, urgent):
+        if urgent:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start(self.interval_ms)
+
+    def flush(self):
+        """쌓인 메시지를 batch 시그널로 전달"""
+        self._timer.stop()
+        with self._lock:
+            pending, self._pending = self._pending, []
+            first_time = self._first_time
+            self._wake_sent = False
+            self._flush_sent = False
+        if not pending: return
+
+        started = time.perf_counter()
+        latency_ms = (started - first_time) * 1000
+        self.batches += 1
+        self.messages += len(pending)
+        self.last_batch_size = len(pending)
+        self.last_latency_ms = latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.avg_latency_ms = latency_ms if self.batches == 1 else self.avg_latency_ms * 0.9 + latency_ms * 0.1
+        self.batch.emit(pending)
+        self.last_handle_ms = (time.perf_counter() - started) * 1000
+        self.total_handle_ms += self.last_handle_ms
+        if latency_ms + self.last_handle_ms > SLOW_BATCH_MS:
+            print(f"[MessageBatcher] Slow batch: {len(pending)} messages, wait {latency_ms:.0f}ms, handle {self.last_handle_ms:.0f}ms")
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "messages": self.messages,
+            "last_batch_size": self.last_batch_size,
+            "last_latency_ms": round(self.last_latency_ms, 1),
+            "avg_latency_ms": round(self.avg_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+            "last_handle_ms": round(self.last_handle_ms, 1),
+            "total_handle_ms": round(self.total_handle_ms, 1),
+        }
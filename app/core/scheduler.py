@@ -0,0 +1,154 @@
+"""
+Scheduler
+
+앱의 주기 작업(방송 상태 확인, 업타임 표시, 채팅 모아보기, 데이터 저장, 영도/투표/추첨 타이머)을 하나의 타이머로 실행합니다.
+- 작업마다 타이머를 따로 두지 않고, 가장 먼저 실행할 작업 시각에 맞춰 단일 QTimer 를 다시 겁니다.
+- 시각은 모두 time.monotonic() 기준입니다. (시스템 시계 변경/절전 복귀에 영향받지 않음)
+- 방송 중/방송 꺼짐에 따라 주기를 다르게 줄 수 있고(live_interval / offline_interval), jitter 비율만큼 주기를 흔들어
+  네트워크 요청이 한 시각에 몰리지 않게 합니다.
+- stats() 로 작업별 실행 횟수와 실행 시간(마지막/평균/최대), 오류 횟수를 확인할 수 있습니다.
+- GUI 스레드에서 생성/사용해야 합니다.
+"""
+
+import time
+import random
+import traceback
+from PyQt6.QtCore import QObject, QTimer
+
+MIN_SLEEP_MS = 5
+SLOW_JOB_MS = 200 # 이보다 오래 걸린 작업은 로그 출력
+
+
+class ScheduledJob:
+    __slots__ = ("name", "func", "live_interval", "offline_interval", "jitter", "next_run",
+                 "runs", "errors", "last_ms", "total_ms", "max_ms", "last_run")
+
+    def __init__(self, name, func, live_interval, offline_interval, jitter):
+        self.name = name
+        self.func = func
+        self.live_interval = live_interval
+        self.offline_interval = offline_interval
+        self.jitter = jitter
+        self.next_run = 0.0
+        self.runs = 0
+        self.errors = 0
+        self.last_ms = 0.0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_run = None # monotonic
+
+    def interval(self, is_live):
+        return self.live_interval if is_live else self.offline_interval
+
+
+class Scheduler(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = {}
+        self.stopped_jobs = {} # 제거된 작업 (다시 등록하면 실행 기록을 이어감)
+        self.is_live = False
+        self._rng = random.Random()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_due)
+
+    @staticmethod
+    def now():
+        return time.monotonic()
+
+    def add_job(self, name, func, interval, offline_interval=None, jitter=0.0, run_now=False):
+        """
+        주기 작업 등록 (같은 이름이 있으면 교체)
+        interval: 방송 중 주기(초), offline_interval: 방송 꺼짐 주기(초, 없으면 interval), jitter: 주기에 더하는 무작위 비율 (0.1 = ±10%)
+        """
+        job = ScheduledJob(name, func, interval, offline_interval or interval, jitter)
+        old = self.jobs.get(name) or self.stopped_jobs.pop(name, None)
+        if old:
+            job.runs, job.errors, job.last_ms, job.total_ms, job.max_ms, job.last_run = old.runs, old.errors, old.last_ms, old.total_ms, old.max_ms, old.last_run
+        job.next_run = self.now() if run_now else self.now() + self._next_delay(job)
+        self.jobs[name] = job
+        self._reschedule()
+        return job
+
+    def remove_job(self, name):
+        job = self.jobs.pop(name, None)
+        if job is not None:
+            self.stopped_jobs[name] = job
+            self._reschedule()
+
+    def has_job(self, name):
+        return name in self.jobs
+
+    def set_live(self, is_live):
+        """방송 상태가 바뀌면 각 작업의 다음 실행 시각을 새 주기에 맞춤"""
+        is_live = bool(is_live)
+        if is_live == self.is_live: return
+        self.is_live = is_live
+        now = self.now()
+        for job in self.jobs.values():
+            job.next_run = min(job.next_run, now + self._next_delay(job))
+        self._reschedule()
+
+    def _next_delay(self, job):
+        delay = job.interval(self.is_live)
+        if job.jitter:
+            delay *= 1 + self._rng.uniform(-job.jitter, job.jitter)
+        return delay
+
+    def _reschedule(self):
+        if not self.jobs:
+            self._timer.stop()
+            return
+        wait = min(job.next_run for job in self.jobs.values()) - self.now()
+        self._timer.start(max(MIN_SLEEP_MS, int(wait * 1000)))
+
+    def _run_due(self):
+        now = self.now()
+        for job in sorted((job for job in self.jobs.values() if job.next_run <= now), key=lambda job: job.next_run):
+            if self.jobs.get(job.name) is not job: continue # 앞 작업이 제거/교체함
+            started = self.now()
+            try:
+                job.func()
+            except Exception as e:
+                job.errors += 1
+                print(f"[Scheduler] Job '{job.name}' failed: {e}")
+                traceback.print_exc()
+            finished = self.now()
+            elapsed_ms = (finished - started) * 1000
+            job.runs += 1
+            job.last_run = started
+            job.last_ms = elapsed_ms
+            job.total_ms += elapsed_ms
+            job.max_ms = max(job.max_ms, elapsed_ms)
+            if elapsed_ms > SLOW_JOB_MS:
+                print(f"[Scheduler] Slow job '{job.name}': {elapsed_ms:.0f}ms")
+            # 제때 실행했으면 예정 시각 기준으로(주기 유지), 밀렸으면 몰아서 실행하지 않고 지금 기준으로 다음 시각을 잡음
+            delay = self._next_delay(job)
+            job.next_run = job.next_run + delay if job.next_run + delay > finished else finished + delay
+        self._reschedule()
+
+    def stats(self):
+        """{작업 이름: {...}} - 실행 여부, 실행 횟수, 오류 횟수, 마지막/평균/최대 실행 시간(ms), 주기, 다음 실행까지 남은 초"""
+        now = self.now()
+        return {
+            name: {
+                "active": name in self.jobs,
+                "runs": job.runs,
+                "errors": job.errors,
+                "last_ms": round(job.last_ms, 2),
+                "avg_ms": round(job.total_ms / job.runs, 2) if job.runs else 0.0,
+                "max_ms": round(job.max_ms, 2),
+                "interval": job.interval(self.is_live),
+                "next_in": round(max(0.0, job.next_run - now), 2) if name in self.jobs else None,
+                "last_run_ago": round(now - job.last_run, 2) if job.last_run is not None else None,
+            }
+            for name, job in {**self.stopped_jobs, **self.jobs}.items()
+        }
+
+    def report(self):
+        """작업별 실행 현황 (한 줄에 한 작업)"""
+        lines = []
+        for name, stat in self.stats().items():
+            state = "" if stat["active"] else " (stopped)"
+            lines.append(f"{name + state:<20} runs={stat['runs']:<6} errors={stat['errors']:<3} avg={stat['avg_ms']}ms max={stat['max_ms']}ms every {stat['interval']}s")
+        return "\n".join(lines)
@@ -22,7 +22,10 @@ from app.constants import (USERPATH, AUTH_REDIRECT_URI, AUTH_FILE_PATH,
                            VERSION, BUILDNUMBER)
 from app.resources import resource_path
 from app.core.chat_connector import Chatroom_Connector
+from app.core.message_batcher import MessageBatcher, DEFAULT_INTERVAL_MS, DEFAULT_MAX_BATCH
+from app.core.scheduler import Scheduler
 from app.core.auth import OAuthHttpServerWorker
+from app.services.live_chat_buffer import live_chat_buffer
 from app.ui_widgets import QToggle, LabelButtonWidget, PopupWindow
 
 from app.tabs.chatroom_tab import ChatroomTab
@@ -53,12 +56,17 @@ class BetterCheeseUtil(QMainWindow):
             print(f"Failed to copy prediction_overlay.html: {e}")
 
         super().__init__()
+        self.scheduler = Scheduler(self) # 모든 주기 작업 (start_timer_main, 영도/투표/추첨 타이머)
         
         self.setWindowTitle(f'Better Cheese 유틸리티 V{VERSION}')
         self.setGeometry(100, 100, 600, 600)
         self.setWindowIcon(QIcon(resource_path(r'.\resources\icon\icon_BCU.ico')))
 
         self.chatroom_connector_instance = Chatroom_Connector()
+        # 채팅 메시지를 묶어서 GUI 스레드로 전달 (chat_batch_interval_ms = 0 이면 메시지마다 전달)
+        self.message_batcher = MessageBatcher(self.settings.value('chat_batch_interval_ms', DEFAULT_INTERVAL_MS, type=int),
+                                              self.settings.value('chat_batch_max', DEFAULT_MAX_BATCH, type=int), self)
+        self.message_batcher.batch.connect(self.message_batch)
 
         # 탭 간 공유 변수
         self.first_chat_date_fixed = None
@@ -185,7 +193,8 @@ class BetterCheeseUtil(QMainWindow):
             return
         try:
             # --- 1. 메인 윈도우가 직접 처리하는 시그널 ---
-            self.chatroom_connector_instance.message.connect(self.message) # 핵심: 메시지 분배기
+            # 핵심: 메시지 분배기 (보낸 스레드에서 바로 묶음에 추가 -> message_batch)
+            self.chatroom_connector_instance.message.connect(self.message_batcher.push, Qt.ConnectionType.DirectConnection)
             self.chatroom_connector_instance.auto_mission.connect(self.auto_mission)
             self.chatroom_connector_instance.update_connection_status.connect(self.update_chat_status) # 공용 상태 표시
             self.chatroom_connector_instance.start_temp_server.connect(self.start_oauth_server) # OAuth 스레드 관리
@@ -241,38 +250,52 @@ class BetterCheeseUtil(QMainWindow):
                 self.chatroom_tab.chatroom_signal.setText("")
                 self.chatroom_tab.channel_label.setText("연결된 채널: (연결 안 됨)")
 
-    @pyqtSlot(str, dict)
-    def message(self, msg_str, msg_dict):
+    @pyqtSlot(object)
+    def message(self, event):
         """
-        모든 메시지를 수신하여 각 탭의 처리기(handler)에 전달합니다.
+        메시지(ChatEvent) 하나를 각 탭의 처리기(handler)에 전달합니다.
+        """
+        self.message_batch([event])
+
+    @pyqtSlot(list)
+    def message_batch(self, events):
+        """
+        MessageBatcher 가 모은 ChatEvent 묶음을 각 탭의 처리기(handler)에 전달합니다.
+        채팅창 표시/투표/추첨은 묶음 단위로 처리하여 UI를 묶음당 한 번만 갱신합니다.
         """
         # --- 1. 공용 변수 업데이트 (총 모금액) ---
-        donation_type = msg_dict.get("donation_type", "")
-        cheese = msg_dict.get("cheese", 0)
-        if donation_type in ["영상후원", "치즈", "미션성공"]:
-            self.total_money += int(cheese)
-            if hasattr(self.remote_tab, 'show_total_money_dialog') and self.remote_tab.show_total_money_dialog:
-                self.remote_tab.show_total_money_dialog.setMoney(self.total_money, int(self.settings_tab.commision_rate.value()))
+        money_changed = False
+        for event in events:
+            if event.donation_type in ["영상후원", "치즈", "미션성공"]:
+                self.total_money += int(event.cheese or 0)
+                money_changed = True
+        if money_changed and hasattr(self.remote_tab, 'show_total_money_dialog') and self.remote_tab.show_total_money_dialog:
+            self.remote_tab.show_total_money_dialog.setMoney(self.total_money, int(self.settings_tab.commision_rate.value()))
+
+        # --- 1-1. 실시간 채팅 버퍼 갱신 (채팅 모아보기/당첨자 채팅 표시용) ---
+        for event in events:
+            live_chat_buffer.append(event.line, event.id or "", event.nick or "")
 
         # --- 2. 각 탭에 메시지 분배 ---
         
-        # 2-1. [ChatroomTab] : 모든 메시지를 채팅창에 표시
-        msg_str_without_id = msg_str.replace(" ("+msg_dict["id"]+")", "")
-        self.chatroom_tab.append_result_chat(msg_str_without_id)
-
-        # 2-2. [VideoDonationTab] : 영상후원 메시지 처리
-        if donation_type == "영상후원":
-            self.video_donation_tab.process_videodonation(msg_dict)
-
-        # 2-3. [RemoteTab] : 후원/구독/미션 메시지를 후원 목록/왕도네 목록에 처리
-        elif donation_type != "채팅": 
-            self.remote_tab.process_donation_message(msg_dict)
+        # 2-1. [ChatroomTab] : 모든 메시지를 채팅창에 표시 (아이디 없는 형식)
+        self.chatroom_tab.append_result_chats([event.display for event in events])
+
+        for event in events:
+            donation_type = event.donation_type
+            # 2-2. [VideoDonationTab] : 영상후원 메시지 처리
+            if donation_type == "영상후원":
+                self.video_donation_tab.process_videodonation(event)
+
+            # 2-3. [RemoteTab] : 후원/구독/미션 메시지를 후원 목록/왕도네 목록에 처리
+            elif donation_type != "채팅": 
+                self.remote_tab.process_donation_message(event)
         
         # 2-4. [VoteTab] : 채팅/도네이션 메시지를 투표 로직으로 처리
-        self.vote_tab.process_vote_message(msg_dict)
+        self.vote_tab.process_vote_messages(events)
         
         # 2-5. [PickTab] : 채팅 메시지를 추첨 로직으로 처리
-        self.pick_tab.process_pick_message(msg_dict)
+        self.pick_tab.process_pick_messages(events)
 
     # =================================================================
     # ==  공용 서비스 (Shared Services) ==
@@ -850,15 +873,17 @@ class BetterCheeseUtil(QMainWindow):
     def start_timer_main(self):
         QApplication.processEvents()
         self.chat_log_search_tab.chat_moa()
-        self.timer_chat_moa = QTimer(self)
-        self.timer_chat_moa.timeout.connect(self.chat_log_search_tab.chat_moa)
-        self.timer_chat_moa.start(1000)
-        self.timer_live_detail_check = QTimer(self)
-        self.timer_live_detail_check.timeout.connect(self.remote_tab.check_live_detail)
-        self.timer_live_detail_check.start(1000)
-        self.timer_saving_data = QTimer(self)
-        self.timer_saving_data.timeout.connect(self.save_all_data)
-        self.timer_saving_data.start(1000)
+        # (작업 이름, 함수, 방송 중 주기, 방송 꺼짐 주기, jitter)
+        self.scheduler.add_job("chat_moa", self.chat_log_search_tab.chat_moa, 1.0)
+        self.scheduler.add_job("live_detail", self.check_live_detail, 1.0, 5.0)
+        self.scheduler.add_job("save_data", self.save_all_data, 1.0)
+        if self.chatroom_connector_instance:
+            self.scheduler.add_job("live_status", self.chatroom_connector_instance.request_live_check, 30.0, 60.0, jitter=0.1)
+
+    def check_live_detail(self):
+        """방송 상태에 맞춰 주기 작업 간격을 바꾸고 업타임 표시"""
+        self.scheduler.set_live(self.is_live_started)
+        self.remote_tab.check_live_detail()
     
     def save_all_data(self):
         data = {}
@@ -0,0 +1,74 @@
+"""
+Chat Event Recorder
+
+방송 중 Chatroom_Connector 가 받은 채팅/후원/구독/구독선물/미션 이벤트를 시간과 함께 파일로 녹화합니다.
+- 설정(BCU.ini chat_capture=true)을 켜면 접속할 때마다 BCU/captures/<날짜_시간>_#<채널>.jsonl.gz 에 기록합니다.
+- 한 줄에 [접속 후 경과 초, 템플릿 이름, 이벤트 값] JSON 한 개 (gzip 압축)
+- app.utils.chat_replay 로 같은 처리 경로(MessageBatcher -> BetterCheeseUtil.message_batch)에 다시 흘려보낼 수 있습니다.
+"""
+
+import os
+import gzip
+import json
+import time
+import threading
+from datetime import datetime
+
+from app.constants import USERPATH
+from app.core.chat_event import ChatEvent, TEMPLATES, TEMPLATE_NAMES, CHAT
+
+CAPTURE_DIR = os.path.join(USERPATH, "BCU", "captures")
+CAPTURE_VERSION = 1
+
+
+class ChatEventRecorder:
+    def __init__(self, path, channel_id=""):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._handle = gzip.open(path, "wt", encoding="utf-8")
+        self._started = time.perf_counter()
+        self.events_written = 0
+        header = {"version": CAPTURE_VERSION, "channel": channel_id, "started": datetime.now().isoformat(timespec="seconds")}
+        self._handle.write(json.dumps(header, ensure_ascii=False) + "\n")
+
+    @classmethod
+    def for_channel(cls, channel_id, capture_dir=CAPTURE_DIR):
+        name = f"{datetime.now():%Y-%m-%d_%H%M%S}_#{channel_id}.jsonl.gz"
+        return cls(os.path.join(capture_dir, name), channel_id)
+
+    def record(self, event):
+        """이벤트 한 건 기록 (어느 스레드에서나 호출 가능)"""
+        offset = round(time.perf_counter() - self._started, 3)
+        line = json.dumps([offset, TEMPLATE_NAMES.get(event.template, "CHAT"), event.to_dict()], ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if self._handle is None: return
+            self._handle.write(line + "\n")
+            self.events_written += 1
+
+    def close(self):
+        with self._lock:
+            handle, self._handle = self._handle, None
+        if handle:
+            handle.close()
+            print(f"[ChatEventRecorder] Closed: {self.events_written} events -> {self.path}")
+
+    def stats(self):
+        return {"path": self.path, "events_written": self.events_written}
+
+
+def read_capture(path):
+    """녹화 파일 -> (헤더 dict, [(경과 초, ChatEvent), ...])"""
+    events = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        try:
+            for line in f:
+                try:
+                    offset, template_name, data = json.loads(line)
+                    events.append((offset, ChatEvent.from_dict(data, TEMPLATES.get(template_name, CHAT))))
+                except ValueError as e:
+                    print(f"[ChatEventRecorder] Skipped bad capture line: {e}")
+        except EOFError: # 프로그램이 비정상 종료되어 끝이 잘린 파일
+            print(f"[ChatEventRecorder] Capture file truncated, {len(events)} events read: {path}")
+    return header, events
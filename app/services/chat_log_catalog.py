@@ -0,0 +1,230 @@
+"""
+Chat Log Catalog Service
+
+채팅 로그 폴더의 일별 로그 파일 목록(날짜/채널 아이디/크기/수정 시각)을 메모리에 유지합니다.
+- 채팅부검(검색/모아보기), 채팅 로그 색인, 채팅 통계가 os.listdir + 이름 파싱을 반복하지 않고 이 목록을 조회합니다.
+- GUI 스레드에서 처음 조회되면 QFileSystemWatcher 로 폴더(파일 추가/삭제)와 최근 로그 파일(크기 변경)을 감시합니다.
+  감시자가 없을 때(프로세스 풀, 명령줄)는 조회할 때마다 폴더 수정 시각을 확인하고 최근 로그 파일만 다시 stat 합니다.
+  다른 스레드(검색/통계 작업)에서 다시 읽은 경우 감시 목록 변경은 시그널로 GUI 스레드에 넘깁니다. (QFileSystemWatcher 는 스레드 안전하지 않음)
+- 파일명 형식: YYYY-MM-DD_#<채널 아이디>.log (ChatLogWriter)
+"""
+
+import os
+import bisect
+import threading
+from datetime import date, datetime, timedelta
+from typing import NamedTuple, Optional
+
+from PyQt6.QtCore import QCoreApplication, QFileSystemWatcher, QObject, pyqtSignal
+
+LIVE_DAYS = 1 # 가장 최근 날짜부터 이 일수 이전까지의 파일은 아직 기록 중일 수 있음 (자정 넘김 포함)
+
+
+def is_chat_log_file(file_name):
+    """채팅부검/통계에서 사용하는 일별 채팅 로그 파일인지 확인"""
+    return file_name.endswith(".log") and "custom" not in file_name and "-" in file_name
+
+
+class LogFileEntry(NamedTuple):
+    name: str
+    date: Optional[date]     # 파일명 날짜, 형식이 아니면 None
+    channel_id: str          # '_#' 뒤의 채널 아이디, 없으면 ""
+    size: int
+    mtime: float
+
+
+def parse_log_file_name(file_name):
+    """파일명에서 (날짜, 채널 아이디). 형식이 아니면 해당 값은 None / "" """
+    try:
+        file_date = datetime.strptime(file_name[:10], '%Y-%m-%d').date()
+    except ValueError:
+        file_date = None
+    channel_start = file_name.find("_#")
+    channel_id = file_name[channel_start + 2:-4] if channel_start != -1 else ""
+    return file_date, channel_id
+
+
+class _WatchUpdater(QObject):
+    """다른 스레드에서 감시 목록 변경을 GUI 스레드로 넘기는 시그널"""
+    requested = pyqtSignal()
+
+
+class ChatLogCatalog:
+    def __init__(self, log_dir):
+        self.log_dir = log_dir
+        self._lock = threading.RLock()
+        self._entries = {}   # 파일명 -> LogFileEntry
+        self._dated = []     # 날짜가 있는 항목 (날짜, 파일명 순)
+        self._dated_keys = [] # bisect 용 (날짜, 파일명)
+        self._undated = []
+        self._dir_mtime = None
+        self._dirty = True
+        self._watcher = None
+        self._watch_updater = None
+
+    # --- 갱신 ---
+    def invalidate(self):
+        """다음 조회 때 폴더를 다시 읽음"""
+        with self._lock:
+            self._dirty = True
+
+    def _rescan(self):
+        entries = {}
+        try:
+            self._dir_mtime = os.stat(self.log_dir).st_mtime_ns
+            with os.scandir(self.log_dir) as it:
+                for dir_entry in it:
+                    if not is_chat_log_file(dir_entry.name): continue
+                    try:
+                        st = dir_entry.stat() # Windows 에서는 폴더를 읽을 때 함께 받은 값 (추가 시스템 호출 없음)
+                    except OSError:
+                        continue
+                    file_date, channel_id = parse_log_file_name(dir_entry.name)
+                    entries[dir_entry.name] = LogFileEntry(dir_entry.name, file_date, channel_id, st.st_size, st.st_mtime)
+        except OSError as e:
+            print(f"[ChatLogCatalog] Error scanning {self.log_dir}: {e}")
+            self._dir_mtime = None
+        self._entries = entries
+        self._rebuild_order()
+        self._dirty = False
+        self._watch_live_files()
+
+    def _rebuild_order(self):
+        self._dated = sorted((e for e in self._entries.values() if e.date is not None), key=lambda e: (e.date, e.name))
+        self._dated_keys = [(e.date, e.name) for e in self._dated]
+        self._undated = sorted(e for e in self._entries.values() if e.date is None)
+
+    def _live_entries(self):
+        if not self._dated: return []
+        first_live = self._dated[-1].date - timedelta(days=LIVE_DAYS)
+        start = bisect.bisect_left(self._dated_keys, (first_live, ""))
+        return self._dated[start:]
+
+    def _restat(self, file_name):
+        """파일 하나의 크기/수정 시각만 갱신. 파일이 없어졌으면 False"""
+        entry = self._entries.get(file_name)
+        if entry is None: return False
+        try:
+            st = os.stat(os.path.join(self.log_dir, file_name))
+        except OSError:
+            return False
+        if st.st_size != entry.size or st.st_mtime != entry.mtime:
+            new_entry = entry._replace(size=st.st_size, mtime=st.st_mtime)
+            self._entries[file_name] = new_entry
+            if entry.date is not None:
+                i = bisect.bisect_left(self._dated_keys, (entry.date, file_name))
+                self._dated[i] = new_entry
+            else:
+                self._undated = sorted(self._entries[e.name] for e in self._undated)
+        return True
+
+    def _ensure_fresh(self):
+        self._start_watcher()
+        if self._dirty:
+            self._rescan()
+            return
+        if self._watcher is not None: return # 감시자가 변경을 알려줌
+        try:
+            dir_mtime = os.stat(self.log_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime != self._dir_mtime:
+            self._rescan()
+            return
+        for entry in self._live_entries():
+            if not self._restat(entry.name):
+                self._rescan()
+                return
+
+    # --- 파일 감시 (GUI 스레드) ---
+    def _start_watcher(self):
+        if self._watcher is not None: return
+        if QCoreApplication.instance() is None or threading.current_thread() is not threading.main_thread(): return
+        if not os.path.isdir(self.log_dir): return
+        self._watcher = QFileSystemWatcher([self.log_dir])
+        self._watcher.directoryChanged.connect(lambda path: self.invalidate())
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watch_updater = _WatchUpdater()
+        self._watch_updater.requested.connect(self._on_watch_update_requested)
+        self._watch_live_files()
+
+    def _watch_live_files(self):
+        if self._watcher is None: return
+        if threading.current_thread() is not threading.main_thread():
+            self._watch_updater.requested.emit() # GUI 스레드에서 _on_watch_update_requested 실행
+            return
+        watched = set(self._watcher.files())
+        live = {os.path.join(self.log_dir, e.name) for e in self._live_entries()}
+        if watched - live:
+            self._watcher.removePaths(list(watched - live))
+        if live - watched:
+            self._watcher.addPaths(list(live - watched))
+
+    def _on_watch_update_requested(self):
+        with self._lock:
+            self._watch_live_files()
+
+    def _on_file_changed(self, path):
+        with self._lock:
+            if not self._restat(os.path.basename(path)):
+                self._dirty = True
+
+    def stop_watching(self):
+        with self._lock:
+            if self._watcher is not None:
+                self._watcher.deleteLater()
+                self._watcher = None
+                self._watch_updater.deleteLater()
+                self._watch_updater = None
+
+    # --- 조회 ---
+    def files(self, start_date=None, end_date=None, channel_id=None, newest_first=False):
+        """로그 파일 항목 목록. 기간을 지정하면 날짜가 있는 파일만 (start_date ~ end_date, 포함)"""
+        with self._lock:
+            self._ensure_fresh()
+            if start_date is None and end_date is None:
+                entries = self._undated + self._dated
+            else:
+                lo = bisect.bisect_left(self._dated_keys, (start_date, "")) if start_date else 0
+                hi = bisect.bisect_left(self._dated_keys, (end_date + timedelta(days=1), "")) if end_date else len(self._dated)
+                entries = self._dated[lo:hi]
+        if channel_id is not None:
+            entries = [e for e in entries if e.channel_id == channel_id]
+        if newest_first:
+            entries = entries[::-1]
+        return entries
+
+    def names(self, start_date=None, end_date=None, channel_id=None, newest_first=False):
+        """files() 의 파일명만 (오래된 순, newest_first 면 최신순)"""
+        return [e.name for e in self.files(start_date, end_date, channel_id, newest_first)]
+
+    def entry(self, file_name):
+        with self._lock:
+            self._ensure_fresh()
+            return self._entries.get(file_name)
+
+    def years(self):
+        """로그가 있는 연도 목록 (최신순)"""
+        with self._lock:
+            self._ensure_fresh()
+            return sorted({e.date.year for e in self._dated}, reverse=True)
+
+    def channels(self):
+        with self._lock:
+            self._ensure_fresh()
+            return sorted({e.channel_id for e in self._entries.values() if e.channel_id})
+
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_chat_log_catalog(log_dir):
+    """로그 폴더별 ChatLogCatalog 인스턴스 (공유)"""
+    key = os.path.normcase(os.path.abspath(log_dir))
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = ChatLogCatalog(log_dir)
+            _catalogs[key] = catalog
+        return catalog
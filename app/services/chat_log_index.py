@@ -0,0 +1,485 @@
+"""
+Chat Log Index Service
+
+채팅 로그 폴더의 유저별 역색인(user id -> (파일, 바이트 오프셋))을 관리합니다.
+- Chatroom_Connector.logWrite 가 로그를 쓸 때마다 add_line() 으로 색인을 갱신합니다.
+- 채팅부검 탭은 find_user() / read_user_lines() 로 전체 로그를 읽지 않고 해당 유저의 줄만 읽습니다.
+- 채팅 내용은 FTS5 trigram 전문 색인(chat_fts)에 공백 제거/소문자로 저장되어
+  search_content() 로 전체 기간을 페이지 단위로 검색합니다. (FTS5를 지원하지 않는 SQLite면 비활성화)
+  trigram 으로 찾을 수 없는 1~2글자 검색어는 글자/두 글자 색인(chat_grams)으로 찾습니다.
+- rebuild() 는 기존 로그 파일로부터 색인을 다시 만듭니다.
+- 조회(find_user 등)는 쓰기와 별도의 조회 전용 연결을 사용하므로 (WAL) 색인 중에도 쓰기 잠금을 기다리지 않습니다.
+  (명령줄: python -m app.services.chat_log_index <로그 폴더> [--rebuild])
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import threading
+
+from app.utils.chat_log_parser import parse_line
+from app.services.chat_log_catalog import get_chat_log_catalog
+
+INDEX_FILE_NAME = "chat_index.db"
+COMMIT_EVERY_LINES = 200 # 실시간 색인 시 커밋 주기 (줄 수)
+COMMIT_EVERY_SECONDS = 2.0 # 실시간 색인 시 커밋 주기 (초)
+SCHEMA_VERSION = 3
+# chat_fts rowid = (초 단위 시간 << 16) | (파일 구분 4bit << 12) | 같은 초 안의 순번 12bit
+# -> rowid 순서가 시간 순서이므로 최근 채팅부터 LIMIT 만큼만 읽을 수 있음
+CONTENT_SLOT_BITS = 16
+CONTENT_BUCKET_BITS = 12 # 같은 초 + 같은 파일 구분의 rowid 구간 (순번 12bit)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,
+    indexed_size INTEGER NOT NULL DEFAULT 0,
+    mtime REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS users (
+    uid INTEGER PRIMARY KEY,
+    user_id TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS nicks (
+    nick TEXT NOT NULL,
+    nick_key TEXT NOT NULL,
+    uid INTEGER NOT NULL,
+    last_file TEXT NOT NULL,
+    last_offset INTEGER NOT NULL,
+    PRIMARY KEY (nick, uid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_nicks_key ON nicks (nick_key);
+CREATE INDEX IF NOT EXISTS idx_nicks_uid ON nicks (uid);
+CREATE TABLE IF NOT EXISTS postings (
+    uid INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    PRIMARY KEY (uid, file_id, offset)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_file ON postings (file_id);
+"""
+
+_CONTENT_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS chat_fts USING fts5(
+    body, line UNINDEXED, file_id UNINDEXED, tokenize='trigram'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS chat_grams USING fts5(
+    grams, content='', tokenize='unicode61'
+);
+"""
+
+# 닉네임별로 가장 최근에 사용한 위치만 유지
+_UPSERT_NICK = (
+    "INSERT INTO nicks (nick, nick_key, uid, last_file, last_offset) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(nick, uid) DO UPDATE SET last_file=excluded.last_file, last_offset=excluded.last_offset "
+    "WHERE excluded.last_file > nicks.last_file OR (excluded.last_file = nicks.last_file AND excluded.last_offset > nicks.last_offset)")
+
+_DROP_SCHEMA = """
+DROP TABLE IF EXISTS postings;
+DROP TABLE IF EXISTS nicks;
+DROP TABLE IF EXISTS users;
+DROP TABLE IF EXISTS files;
+DROP TABLE IF EXISTS chat_fts;
+DROP TABLE IF EXISTS chat_grams;
+"""
+
+_INSERT_CONTENT = "INSERT INTO chat_fts (rowid, body, line, file_id) VALUES (?, ?, ?, ?)"
+
+
+def normalize_text(text):
+    """'공백/대소문자 무시' 옵션용 비교 키"""
+    return text.replace(" ", "").lower()
+
+
+def normalize_nick(nick):
+    """'공백/대소문자 무시' 옵션용 닉네임 키"""
+    return normalize_text(nick)
+
+
+def gram_token(gram):
+    """글자/두 글자 -> chat_grams 토큰 (글자마다 코드 포인트 6자리 16진수, 문장 부호/이모티콘도 토큰이 되도록)"""
+    return "".join(f"{ord(char):06x}" for char in gram)
+
+
+def gram_tokens(body):
+    """본문 키의 글자/두 글자 토큰 (중복 제외)"""
+    return " ".join({gram_token(body[i:i + n]) for n in (1, 2) for i in range(len(body) - n + 1)})
+
+
+class ChatLogIndex:
+    def __init__(self, log_dir):
+        self.log_dir = log_dir
+        self.db_path = os.path.join(log_dir, INDEX_FILE_NAME)
+        self._lock = threading.RLock() # 쓰기 연결
+        self._conn = None
+        self._read_lock = threading.Lock() # 조회 전용 연결
+        self._read_conn = None
+        self._file_ids = {} # {파일명: file_id}
+        self._uids = {} # {user_id: uid}
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        self._content_slots = {} # {file_id: (마지막 시간, 순번)}
+        self.content_enabled = True
+        self._sync_thread = None
+
+    # --- 연결 관리 ---
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._conn.executescript(_DROP_SCHEMA) # 이전 형식의 색인 -> 처음부터 다시 색인
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_CONTENT_SCHEMA)
+            except sqlite3.OperationalError as e:
+                self.content_enabled = False
+                print(f"[ChatLogIndex] Full-text index unavailable: {e}")
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._conn.commit()
+        return self._conn
+
+    def _reader(self):
+        """조회 전용 연결 (_read_lock 안에서 호출). 커밋된 색인만 보이며 쓰기 잠금을 기다리지 않음"""
+        if self._read_conn is None:
+            if self._conn is None: # 처음 한 번만: 스키마 생성/확인
+                with self._lock:
+                    self._connect()
+            self._read_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._read_conn.execute("PRAGMA query_only=ON")
+        return self._read_conn
+
+    def close(self):
+        with self._read_lock:
+            if self._read_conn is not None:
+                try:
+                    self._read_conn.close()
+                except Exception as e:
+                    print(f"[ChatLogIndex] Failed to close index: {e}")
+                self._read_conn = None
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.commit()
+                    self._conn.close()
+                except Exception as e:
+                    print(f"[ChatLogIndex] Failed to close index: {e}")
+                self._conn = None
+                self._file_ids.clear()
+                self._uids.clear()
+                self._content_slots.clear()
+                self._pending = 0
+
+    def flush(self, blocking=True):
+        """아직 커밋되지 않은 실시간 색인을 저장. blocking=False 면 색인 중(잠김)일 때 바로 False"""
+        if not self._lock.acquire(blocking): return False
+        try:
+            if self._conn is not None and self._pending:
+                self._conn.commit()
+                self._pending = 0
+                self._last_commit = time.monotonic()
+        finally:
+            self._lock.release()
+        return True
+
+    def _file_id(self, conn, file_name):
+        file_id = self._file_ids.get(file_name)
+        if file_id is None:
+            row = conn.execute("SELECT file_id FROM files WHERE name=?", (file_name,)).fetchone()
+            if row:
+                file_id = row[0]
+            else:
+                file_id = conn.execute("INSERT INTO files (name) VALUES (?)", (file_name,)).lastrowid
+            self._file_ids[file_name] = file_id
+        return file_id
+
+    def _uid(self, conn, user_id):
+        uid = self._uids.get(user_id)
+        if uid is None:
+            row = conn.execute("SELECT uid FROM users WHERE user_id=?", (user_id,)).fetchone()
+            if row:
+                uid = row[0]
+            else:
+                uid = conn.execute("INSERT INTO users (user_id) VALUES (?)", (user_id,)).lastrowid
+            self._uids[user_id] = uid
+        return uid
+
+    def _indexed_size(self, conn, file_name):
+        row = conn.execute("SELECT indexed_size FROM files WHERE name=?", (file_name,)).fetchone()
+        return row[0] if row else 0
+
+    def _content_row(self, file_id, record, chat):
+        """chat_fts에 넣을 (rowid, 본문 키, 로그 줄, file_id)"""
+        ts = record.timestamp
+        last_ts, n = self._content_slots.get(file_id, (None, -1))
+        n = n + 1 if last_ts == ts else 0
+        self._content_slots[file_id] = (ts, n)
+        rowid = (ts << CONTENT_SLOT_BITS) | ((file_id & 0xF) << 12) | min(n, 0xFFF)
+        return rowid, normalize_text(record.msg), chat, file_id
+
+    def _insert_content_rows(self, conn, rows):
+        if not self.content_enabled or not rows: return
+        conn.execute("SAVEPOINT content_rows")
+        try:
+            conn.executemany(_INSERT_CONTENT, rows)
+        except sqlite3.IntegrityError: # 같은 초에 이미 사용된 rowid가 있음 -> 겹치는 줄만 다음 빈 rowid로
+            conn.execute("ROLLBACK TO content_rows")
+            rows = self._free_rowids(conn, rows)
+            conn.executemany(_INSERT_CONTENT, rows)
+        conn.executemany("INSERT INTO chat_grams (rowid, grams) VALUES (?, ?)", [(row[0], gram_tokens(row[1])) for row in rows if row[1]])
+        conn.execute("RELEASE content_rows")
+
+    @staticmethod
+    def _free_rowids(conn, rows):
+        """이미 사용된 rowid를 같은 초 구간의 다음 빈 rowid로 바꾼 rows (구간마다 사용 중인 rowid는 한 번만 조회)
+        구간(순번 12bit)이 가득 차면 같은 초의 다음 구간을 사용하고, 그 초가 모두 차면 내용 색인에서 제외"""
+        used = {} # {구간: [사용 중인 rowid 집합, 가장 큰 rowid]}
+        resolved = []
+        for rowid, body, chat, file_id in rows:
+            second = rowid >> CONTENT_SLOT_BITS
+            while rowid >> CONTENT_SLOT_BITS == second:
+                bucket = rowid >> CONTENT_BUCKET_BITS
+                if bucket not in used:
+                    start = bucket << CONTENT_BUCKET_BITS
+                    taken = {row[0] for row in conn.execute(
+                        "SELECT rowid FROM chat_fts WHERE rowid >= ? AND rowid < ?", (start, start + (1 << CONTENT_BUCKET_BITS)))}
+                    used[bucket] = [taken, max(taken, default=start - 1)]
+                taken, last = used[bucket]
+                if rowid not in taken: break
+                rowid = last + 1 # 구간이 가득 찼으면 다음 구간의 첫 rowid
+            else:
+                print(f"[ChatLogIndex] Too many lines in one second, skipped content index: {chat}")
+                continue
+            used[bucket][0].add(rowid)
+            used[bucket][1] = max(used[bucket][1], rowid)
+            resolved.append((rowid, body, chat, file_id))
+        return resolved
+
+    # --- 실시간 색인 (Chatroom_Connector.logWrite) ---
+    def add_line(self, file_name, offset, chat):
+        """로그 파일에 방금 기록된 한 줄을 색인합니다. offset은 해당 줄의 시작 바이트 위치입니다."""
+        self.add_lines(file_name, [(offset, chat)])
+
+    def add_lines(self, file_name, entries, blocking=True):
+        """로그 파일에 방금 이어서 기록된 줄들을 한 번에 색인합니다. entries = [(줄 시작 바이트 위치, 줄)]
+        blocking=False 면 sync()/rebuild() 가 파일을 색인하는 중(잠김)일 때 기다리지 않고 False 를 반환합니다."""
+        if not self._lock.acquire(blocking): return False
+        try:
+            conn = self._connect()
+            indexed_size = self._indexed_size(conn, file_name)
+            entries = [entry for entry in entries if entry[0] >= indexed_size] # sync()가 이미 읽어간 줄 제외
+            if not entries: return True
+            file_id = self._file_id(conn, file_name)
+            contiguous = entries[0][0] == indexed_size # 앞부분이 모두 색인된 경우에만 전진 (빈 구간은 sync()가 채움)
+            self._add_lines(conn, file_name, file_id, entries, contiguous)
+            if contiguous:
+                last_offset, last_chat = entries[-1]
+                line_end = last_offset + len(last_chat.encode("utf-8")) + len(os.linesep)
+                conn.execute("UPDATE files SET indexed_size=?, mtime=? WHERE file_id=?", (line_end, time.time(), file_id))
+            self._pending += len(entries)
+            if self._pending >= COMMIT_EVERY_LINES or time.monotonic() - self._last_commit >= COMMIT_EVERY_SECONDS:
+                conn.commit()
+                self._pending = 0
+                self._last_commit = time.monotonic()
+        except Exception as e:
+            print(f"[ChatLogIndex] Failed to index line: {e}")
+        finally:
+            self._lock.release()
+        return True
+
+    def _add_lines(self, conn, file_name, file_id, entries, with_content=True):
+        """[(줄 시작 바이트 위치, 줄)] 목록을 유저 색인/내용 색인에 한 번에 추가"""
+        postings = []
+        last_nicks = {} # {(닉네임, uid): 마지막 줄 위치}
+        content_rows = []
+        with_content = with_content and self.content_enabled
+        for line_start, chat in entries:
+            record = parse_line(chat)
+            if record is None: continue
+            if record.id:
+                uid = self._uid(conn, record.id)
+                postings.append((uid, file_id, line_start))
+                last_nicks[(record.nick, uid)] = line_start
+            if with_content:
+                content_rows.append(self._content_row(file_id, record, chat))
+        conn.executemany("INSERT OR IGNORE INTO postings (uid, file_id, offset) VALUES (?, ?, ?)", postings)
+        conn.executemany(_UPSERT_NICK, [(nick, normalize_nick(nick), uid, file_name, line_start) for (nick, uid), line_start in last_nicks.items()])
+        self._insert_content_rows(conn, content_rows)
+
+    # --- 파일 단위 색인 ---
+    def _index_file(self, conn, file_name, size, mtime):
+        """파일의 색인되지 않은 뒷부분만 읽어서 색인 (로그는 이어쓰기만 하므로)"""
+        file_id = self._file_id(conn, file_name)
+        start = self._indexed_size(conn, file_name)
+        path = os.path.join(self.log_dir, file_name)
+        size = os.path.getsize(path) # 파일 목록 캐시의 크기는 지금 쓰는 중인 파일보다 작을 수 있음
+        if size < start: # 실제 파일이 색인보다 작음 = 잘렸거나 교체됨 -> 처음부터 다시
+            conn.execute("DELETE FROM postings WHERE file_id=?", (file_id,))
+            if self.content_enabled: # chat_grams 는 내용 없는 색인이라 지우지 못함 (search_content 가 chat_fts 본문으로 다시 확인)
+                conn.execute("DELETE FROM chat_fts WHERE file_id=?", (file_id,))
+            start = 0
+        offset = start
+        entries = []
+        with open(path, 'rb') as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"): break # 아직 쓰는 중인 마지막 줄
+                line_start = offset
+                offset += len(raw)
+                if b"<" not in raw: continue
+                entries.append((line_start, raw.decode("utf-8", errors="ignore").rstrip("\r\n")))
+        self._add_lines(conn, file_name, file_id, entries)
+        conn.execute("UPDATE files SET indexed_size=?, mtime=? WHERE file_id=?", (offset, mtime, file_id))
+
+    def sync(self, progress_callback=None, is_cancelled=None, file_names=None):
+        """로그 폴더를 확인하여 새로 추가되거나 커진 파일만 색인합니다. 취소되면 False
+        file_names: 지정하면 해당 파일만 확인
+        (파일 하나를 색인할 때만 잠그므로 그 사이 조회는 기다리지 않음)"""
+        with self._lock:
+            conn = self._connect()
+            indexed = {name: (size, mtime) for name, size, mtime in conn.execute("SELECT name, indexed_size, mtime FROM files")}
+        todo = [(entry.name, entry.size, entry.mtime) # 폴더 목록/크기는 파일 목록 캐시에서 조회
+                for entry in get_chat_log_catalog(self.log_dir).files(newest_first=True)
+                if (file_names is None or entry.name in file_names)
+                and (entry.name not in indexed or indexed[entry.name][0] != entry.size)]
+        for i, (file_name, size, mtime) in enumerate(todo):
+            if is_cancelled and is_cancelled():
+                return False
+            if progress_callback: progress_callback(i + 1, len(todo), file_name)
+            with self._lock:
+                conn = self._connect()
+                self._index_file(conn, file_name, size, mtime)
+                conn.commit()
+                self._pending = 0
+        return True
+
+    def sync_in_background(self):
+        """GUI 스레드용: sync() 를 백그라운드 스레드에서 실행 (이미 실행 중이면 무시). 조회는 현재 색인 그대로 사용"""
+        with self._lock:
+            if self.is_syncing: return
+            self._sync_thread = threading.Thread(target=self._sync_quietly, name="ChatLogIndexSync", daemon=True)
+            self._sync_thread.start()
+
+    @property
+    def is_syncing(self):
+        return self._sync_thread is not None and self._sync_thread.is_alive()
+
+    def _sync_quietly(self):
+        try:
+            self.sync()
+        except Exception as e:
+            print(f"[ChatLogIndex] Background sync failed: {e}")
+
+    def rebuild(self, progress_callback=None, is_cancelled=None):
+        """색인을 비우고 모든 로그 파일로부터 다시 만듭니다. (비우는 동안만 잠그고 색인은 sync() 와 같이 파일 단위로 잠금)"""
+        with self._lock:
+            conn = self._connect()
+            conn.executescript("DELETE FROM postings; DELETE FROM nicks; DELETE FROM users; DELETE FROM files;")
+            if self.content_enabled:
+                conn.execute("DELETE FROM chat_fts")
+                conn.execute("INSERT INTO chat_grams (chat_grams) VALUES ('delete-all')")
+            conn.commit()
+            self._file_ids.clear()
+            self._uids.clear()
+            self._content_slots.clear()
+        return self.sync(progress_callback, is_cancelled)
+
+    # --- 조회 ---
+    def find_user(self, search, ignore_space=False):
+        """닉네임 또는 아이디로 가장 최근에 채팅한 유저를 찾아 (아이디, 닉네임) 반환. 없으면 (None, '')"""
+        with self._read_lock:
+            conn = self._reader()
+            nick_column = "nick_key" if ignore_space else "nick"
+            nick_value = normalize_nick(search) if ignore_space else search
+            row = conn.execute(
+                "SELECT users.user_id, nicks.nick FROM nicks JOIN users ON users.uid = nicks.uid "
+                f"WHERE users.user_id = ? OR nicks.{nick_column} = ? "
+                "ORDER BY nicks.last_file DESC, nicks.last_offset DESC LIMIT 1",
+                (search, nick_value)).fetchone()
+        if not row: return None, ""
+        return row[0], row[1]
+
+    def user_files(self, user_id):
+        """해당 유저의 채팅이 있는 로그 파일명 목록 (최신순)"""
+        with self._read_lock:
+            conn = self._reader()
+            rows = conn.execute(
+                "SELECT DISTINCT files.name FROM postings "
+                "JOIN users ON users.uid = postings.uid JOIN files ON files.file_id = postings.file_id "
+                "WHERE users.user_id = ? ORDER BY files.name DESC", (user_id,)).fetchall()
+        return [row[0] for row in rows]
+
+    def count_user(self, user_id):
+        with self._read_lock:
+            conn = self._reader()
+            row = conn.execute(
+                "SELECT COUNT(*) FROM postings JOIN users ON users.uid = postings.uid WHERE users.user_id = ?",
+                (user_id,)).fetchone()
+        return row[0] if row else 0
+
+    def read_user_lines(self, file_name, user_id):
+        """로그 파일에서 해당 유저의 줄만 바로 읽어 파일 순서대로 반환"""
+        file_name = os.path.basename(file_name)
+        with self._read_lock:
+            conn = self._reader()
+            offsets = [row[0] for row in conn.execute(
+                "SELECT postings.offset FROM postings "
+                "JOIN users ON users.uid = postings.uid JOIN files ON files.file_id = postings.file_id "
+                "WHERE users.user_id = ? AND files.name = ? ORDER BY postings.offset", (user_id, file_name))]
+        lines = []
+        if not offsets: return lines
+        with open(os.path.join(self.log_dir, file_name), 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                lines.append(f.readline().decode("utf-8", errors="ignore").rstrip("\r\n"))
+        return lines
+
+    def search_content(self, keyword, ignore_space=False, limit=100, before=None):
+        """채팅 내용 검색 (전체 기간). 최근 채팅부터 최대 limit개의 로그 줄과
+        다음 페이지를 읽을 때 before로 넘길 커서를 반환합니다. (마지막 페이지면 커서는 None)"""
+        key = normalize_text(keyword)
+        if not key or not self.content_enabled: return [], None
+        if len(key) >= 3: # trigram 색인 사용
+            source, where, params = "chat_fts AS f", "chat_fts MATCH ?", ['"' + key.replace('"', '""') + '"']
+        else: # 3글자 미만은 trigram으로 찾을 수 없어 글자/두 글자 색인을 최근 순으로 읽으며 본문에서 확인
+            source = "chat_grams AS g CROSS JOIN chat_fts AS f ON f.rowid = g.rowid"
+            where, params = "chat_grams MATCH ? AND instr(f.body, ?) > 0", [gram_token(key), key]
+        if not ignore_space: # 공백/대소문자까지 일치하는지 메시지 부분에서 확인 (닉네임/아이디 제외)
+            where += " AND instr(substr(f.line, instr(substr(f.line, 22), '> ') + 23), ?) > 0"
+            params.append(keyword)
+        params += [before if before is not None else (1 << 62), limit]
+        order = "f.rowid" if len(key) >= 3 else "g.rowid"
+        with self._read_lock:
+            conn = self._reader()
+            rows = conn.execute(f"SELECT f.rowid, f.line FROM {source} WHERE {where} AND {order} < ? ORDER BY {order} DESC LIMIT ?", params).fetchall()
+        next_before = rows[-1][0] if len(rows) == limit else None
+        return [row[1] for row in rows], next_before
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+def get_chat_log_index(log_dir):
+    """로그 폴더별 ChatLogIndex 인스턴스 (공유)"""
+    key = os.path.normcase(os.path.abspath(log_dir))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = ChatLogIndex(log_dir)
+            _indexes[key] = index
+        return index
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m app.services.chat_log_index <log_dir> [--rebuild]")
+        sys.exit(1)
+    index = get_chat_log_index(sys.argv[1])
+    started = time.perf_counter()
+    report = lambda current, total, name: print(f"[{current}/{total}] {name}")
+    if "--rebuild" in sys.argv: index.rebuild(report)
+    else: index.sync(report)
+    index.close()
+    print(f"[ChatLogIndex] Done in {time.perf_counter() - started:.2f}s")
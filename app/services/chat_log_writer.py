@@ -0,0 +1,209 @@
+"""
+Chat Log Writer Service
+
+채팅 로그 파일 쓰기를 전담하는 단일 쓰기 스레드입니다.
+- Chatroom_Connector.logWrite 는 줄을 큐에 넣기만 하므로 asyncio 이벤트 루프에서 파일 I/O가 일어나지 않습니다.
+- 큐에 쌓인 줄을 한 번에 쓰고 flush_interval 마다 한 번만 flush 합니다. (group commit)
+- 날짜 변경(자정)은 다음 자정 시각과 비교만 하여 처리합니다. (줄마다 strftime 하지 않음)
+- 기록한 줄은 flush 된 뒤에 채팅부검용 유저/내용 색인(chat_log_index)에 추가합니다. (색인 위치가 실제 파일 크기를 앞서지 않도록)
+  색인이 sync()/rebuild() 중이라 잠겨 있으면 기다리지 않고 다음 반복에 다시 시도합니다.
+  밀린 줄이 MAX_INDEX_BACKLOG 를 넘으면 오래된 것부터 색인을 건너뜁니다. (다음 sync() 가 파일에서 다시 읽어 색인)
+- 큐가 가득 차서 버린 줄은 on_error 로 알립니다. (처음 한 번과 DROP_LOG_EVERY 줄마다)
+"""
+
+import os
+import time
+import queue
+import threading
+from datetime import datetime, timedelta
+
+from app.services.chat_log_index import get_chat_log_index
+
+DEFAULT_FLUSH_INTERVAL = 1.0 # 초
+DEFAULT_MAX_QUEUE = 20000 # 줄
+MAX_BATCH_LINES = 1000
+DROP_LOG_EVERY = 1000 # 큐가 가득 차서 버린 줄은 이 개수마다 한 번만 알림
+MAX_INDEX_BACKLOG = 50000 # 색인이 잠겨 있는 동안 모아 둘 최대 줄 수
+
+_STOP = object()
+
+
+class ChatLogWriter:
+    def __init__(self, log_dir, streamer_id, flush_interval=DEFAULT_FLUSH_INTERVAL, max_queue=DEFAULT_MAX_QUEUE, on_error=None):
+        self.log_dir = log_dir
+        self.streamer_id = streamer_id
+        self.flush_interval = flush_interval
+        self.on_error = on_error
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._handle = None
+        self._file_name = None
+        self._offset = 0 # 다음 줄이 기록될 바이트 위치 (채팅 로그 색인용)
+        self._day_end = 0.0 # 현재 로그 파일 날짜가 끝나는 시각 (timestamp)
+        self._index = get_chat_log_index(log_dir)
+        self._dirty = False # 마지막 flush 이후 기록한 줄이 있음
+        self._unindexed = [] # 기록했지만 아직 flush 되지 않아 색인하지 않은 [(줄 시작 바이트 위치, 줄)]
+        self._index_backlog = [] # flush 되었지만 색인이 잠겨 있어 아직 넣지 못한 [(파일명, [(줄 시작 바이트 위치, 줄)])]
+        self._index_backlog_lines = 0
+
+        # 상태 카운터
+        self.lines_written = 0
+        self.bytes_written = 0
+        self.dropped_lines = 0
+        self.flush_count = 0
+        self.index_skipped_lines = 0 # 밀린 색인이 너무 많아 건너뛴 줄 (다음 sync() 에서 색인)
+
+        self._thread = threading.Thread(target=self._run, name="ChatLogWriter", daemon=True)
+        self._thread.start()
+
+    # --- 호출 측 (asyncio 스레드 / GUI 스레드) ---
+    def write(self, chat_string):
+        """로그 한 줄을 쓰기 큐에 추가합니다. (기다리지 않음, 큐가 가득 차면 버리고 on_error 로 알림)"""
+        try:
+            self._queue.put_nowait(chat_string)
+        except queue.Full:
+            self.dropped_lines += 1
+            if self.dropped_lines % DROP_LOG_EVERY == 1:
+                message = f"쓰기 큐가 가득 차서 채팅 로그 {self.dropped_lines}줄을 기록하지 못했습니다."
+                print(f"[ChatLogWriter] Queue full, dropped log line ({self.dropped_lines} total)")
+                if self.on_error: self.on_error(message)
+
+    def flush(self, timeout=5.0):
+        """큐에 쌓인 줄을 모두 파일에 쓰고 flush 될 때까지 기다립니다."""
+        if not self._thread.is_alive(): return
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return
+        done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """남은 줄을 모두 기록하고 쓰기 스레드를 종료합니다."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        print(f"[ChatLogWriter] Closed: {self.stats()}")
+
+    @property
+    def queue_depth(self):
+        return self._queue.qsize()
+
+    def stats(self):
+        return {
+            "queue_depth": self.queue_depth,
+            "lines_written": self.lines_written,
+            "bytes_written": self.bytes_written,
+            "dropped_lines": self.dropped_lines,
+            "flush_count": self.flush_count,
+            "index_backlog": self._index_backlog_lines,
+            "index_skipped_lines": self.index_skipped_lines,
+        }
+
+    # --- 쓰기 스레드 ---
+    def _open_for_now(self, now):
+        """현재 날짜의 로그 파일을 열고 다음 자정 시각을 계산"""
+        self._close_file()
+        today = datetime.fromtimestamp(now).date()
+        self._day_end = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+        self._file_name = f"{today.strftime('%Y-%m-%d')}_#{self.streamer_id}.log"
+        os.makedirs(self.log_dir, exist_ok=True)
+        path = os.path.join(self.log_dir, self._file_name)
+        self._handle = open(path, "a", encoding="UTF8")
+        self._offset = os.path.getsize(path)
+
+    def _close_file(self):
+        if self._handle is None: return
+        try:
+            self._handle.close()
+            self._index_flushed()
+        except Exception as e:
+            print(f"[ChatLogWriter] Error closing log file: {e}")
+        self._unindexed = []
+        self._handle = None
+        self._index.flush(blocking=False)
+
+    def _flush_file(self):
+        if not self._dirty: return
+        if self._handle is not None:
+            self._handle.flush()
+            self._index_flushed()
+        self._index.flush(blocking=False)
+        self._dirty = False
+        self.flush_count += 1
+
+    def _index_flushed(self):
+        """파일에 flush 된 줄들을 색인 대기 목록으로 넘기고 색인 시도"""
+        if self._unindexed:
+            entries, self._unindexed = self._unindexed, []
+            if self._index_backlog and self._index_backlog[-1][0] == self._file_name:
+                self._index_backlog[-1][1].extend(entries)
+            else:
+                self._index_backlog.append((self._file_name, entries))
+            self._index_backlog_lines += len(entries)
+            while self._index_backlog_lines > MAX_INDEX_BACKLOG: # 오래된 줄부터 건너뜀
+                entries = self._index_backlog[0][1]
+                skip = min(len(entries), self._index_backlog_lines - MAX_INDEX_BACKLOG)
+                del entries[:skip]
+                if not entries: self._index_backlog.pop(0)
+                self._index_backlog_lines -= skip
+                self.index_skipped_lines += skip
+        self._drain_index()
+
+    def _drain_index(self):
+        """색인이 잠겨 있지 않으면 대기 중인 줄을 색인 (잠겨 있으면 다음에 다시 시도)"""
+        while self._index_backlog:
+            file_name, entries = self._index_backlog[0]
+            if not self._index.add_lines(file_name, entries, blocking=False): return
+            self._index_backlog.pop(0)
+            self._index_backlog_lines -= len(entries)
+
+    def _write_lines(self, lines):
+        now = time.time()
+        if self._handle is None or now >= self._day_end: # 첫 기록 또는 날짜 변경
+            self._open_for_now(now)
+        linesep_len = len(os.linesep) # 텍스트 모드이므로 "\n"은 OS 줄바꿈으로 기록됨
+        self._handle.write("\n".join(lines) + "\n")
+        for chat_string in lines:
+            self._unindexed.append((self._offset, chat_string))
+            size = len(chat_string.encode("utf-8")) + linesep_len
+            self._offset += size
+            self.bytes_written += size
+        self.lines_written += len(lines)
+        self._dirty = True
+
+    def _run(self):
+        last_flush = time.monotonic()
+        running = True
+        while running:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            lines = []
+            waiters = []
+            while item is not None:
+                if item is _STOP:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    lines.append(item)
+                if not running or len(lines) >= MAX_BATCH_LINES: break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            try:
+                if lines:
+                    self._write_lines(lines)
+                if waiters or not running or time.monotonic() - last_flush >= self.flush_interval:
+                    self._flush_file()
+                    last_flush = time.monotonic()
+                    if self._index_backlog: self._drain_index()
+            except Exception as e:
+                print(f"[ChatLogWriter] Error writing to log file: {e}")
+                self._close_file() # 다음 기록 시 다시 열기
+                if self.on_error: self.on_error(e)
+            for waiter in waiters:
+                waiter.set()
+        self._close_file()
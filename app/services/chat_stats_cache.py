@@ -0,0 +1,308 @@
+"""
+Chat Stats Cache Service
+
+채팅 통계 창(ui_chat_counter)에서 사용하는 일별 집계 캐시입니다.
+- 로그 파일 하나(하루)를 한 번 읽어 채팅 빈도표, 유저별 채팅 수, 채팅 수, 방송 시간(초)을 집계합니다.
+- 집계 결과는 로그 폴더의 chat_stats/<로그 파일명>.json 에 파일 크기/수정 시각과 함께 저장되며,
+  로그 파일이 바뀌지 않았으면 다시 읽지 않고 저장된 집계를 사용합니다. (계속 기록되는 오늘 로그만 다시 집계)
+  캐시 파일의 첫 줄은 키(버전/크기/수정 시각), 둘째 줄은 집계이므로 첫 줄만 읽어 최신 여부를 확인합니다.
+- iter_day_stats() 는 다시 집계할 날짜가 많으면 프로세스 풀에서 나누어 집계하고(map) 호출 측이 순서대로 합칩니다(reduce).
+- ChatStatsTotals 는 기간 전체를 합친 집계로, 한 번 합치면 빈도/유저/특정 단어 결과를 모두 만들 수 있습니다.
+  여러 단어/이모티콘은 Aho-Corasick 자동자(MultiPatternCounter)로 빈도표를 한 번만 훑어 모두 셉니다.
+  top_k 를 지정하면 메시지 빈도표 대신 Space-Saving 카운터만 유지해 메모리를 제한합니다.
+"""
+
+import os
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+from app.utils.chat_log_parser import parse_line, line_timestamp
+from app.utils.aho_corasick import MultiPatternCounter
+from app.utils.space_saving import SpaceSaving
+from app.services.chat_log_catalog import get_chat_log_catalog
+
+STATS_DIR_NAME = "chat_stats"
+CACHE_VERSION = 2
+PARALLEL_MIN_FILES = 8 # 다시 집계할 파일이 이 개수 이상일 때만 프로세스 풀 사용 (프로세스 시작 비용)
+SESSION_GAP_SECONDS = 1800 # 30분 이상 채팅이 없으면 방송 꺼짐으로 간주
+CHAR_COUNT_ALIASES = {'헉': ('{:lck_28:}',)} # 단어와 같이 세는 이모티콘
+
+
+def analyze_lines(lines):
+    """로그 줄들을 집계합니다.
+    freq: {공백 제거 메시지: 횟수}, users: {아이디: [채팅 수, 마지막 닉네임]}, chats: 채팅 수, seconds: 방송 시간(초)"""
+    freq = {}
+    users = {}
+    chats = 0
+    seconds = 0
+    prev_ts = None
+    for line in lines:
+        record = parse_line(line)
+        chat_ts = record.timestamp if record else line_timestamp(line)
+        if chat_ts is None: continue
+
+        # 30분(1800초) 이상 공백 시 세션 분리 (방송 꺼짐 처리)
+        if prev_ts is not None:
+            diff = chat_ts - prev_ts
+            if 0 <= diff <= SESSION_GAP_SECONDS:
+                seconds += diff
+        prev_ts = chat_ts
+
+        if record is None or not record.id or record.is_event: continue
+        msgg = record.msg.strip().replace(" ", "")
+        if "Cheer" in msgg: continue # 치즈 후원 메시지 제외
+        chats += 1
+        if msgg:
+            freq[msgg] = freq.get(msgg, 0) + 1
+        user = users.get(record.id)
+        if user is None:
+            users[record.id] = [1, record.nick]
+        else:
+            user[0] += 1
+            user[1] = record.nick
+    return {"freq": freq, "users": users, "chats": chats, "seconds": seconds}
+
+
+def _cache_path(log_dir, file_name):
+    return os.path.join(log_dir, STATS_DIR_NAME, f"{file_name}.json")
+
+
+def _cache_key(stat):
+    return {"version": CACHE_VERSION, "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _read_cache(log_dir, file_name, stat, with_stats=True):
+    """캐시 키가 맞으면 집계(with_stats=False면 True), 아니면 None"""
+    cache_path = _cache_path(log_dir, file_name)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            if json.loads(f.readline()) != _cache_key(stat):
+                return None
+            return json.loads(f.readline()) if with_stats else True
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[ChatStatsCache] Ignoring broken cache {cache_path}: {e}")
+    return None
+
+
+def is_cached(log_dir, file_name):
+    """로그 파일이 바뀌지 않아 저장된 집계를 그대로 쓸 수 있는지 확인"""
+    try:
+        stat = os.stat(os.path.join(log_dir, file_name))
+    except OSError:
+        return False
+    return _read_cache(log_dir, file_name, stat, with_stats=False) is not None
+
+
+def load_day_stats(log_dir, file_name):
+    """로그 파일 하나의 집계. 파일 크기/수정 시각이 캐시와 같으면 캐시를 그대로 사용
+    (프로세스 풀에서도 실행되므로 모듈 최상위 함수로 유지)"""
+    path = os.path.join(log_dir, file_name)
+    stat = os.stat(path)
+    stats = _read_cache(log_dir, file_name, stat)
+    if stats is not None:
+        return stats
+
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        stats = analyze_lines(f)
+
+    cache_path = _cache_path(log_dir, file_name)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(_cache_key(stat)) + "\n")
+            f.write(json.dumps(stats, ensure_ascii=False, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"[ChatStatsCache] Failed to save cache {cache_path}: {e}")
+    return stats
+
+
+def iter_day_stats(log_dir, file_names, is_cancelled=None, parallel=True, max_workers=None):
+    """file_names 순서대로 (파일명, 집계)를 반환합니다.
+    parallel이면 캐시가 없는 파일이 PARALLEL_MIN_FILES 개 이상일 때 프로세스 풀에서 미리 집계합니다.
+    is_cancelled()가 True가 되면 남은 작업을 취소하고 종료합니다."""
+    is_cancelled = is_cancelled or (lambda: False)
+    workers = max_workers or os.cpu_count() or 1
+    stale = [name for name in file_names if not is_cached(log_dir, name)] if parallel and workers > 1 else []
+    if len(stale) < PARALLEL_MIN_FILES:
+        for name in file_names:
+            if is_cancelled(): return
+            yield name, load_day_stats(log_dir, name)
+        return
+
+    workers = min(workers, len(stale))
+    stale_set = set(stale)
+    queued = deque(stale)
+    futures = {}
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for name in file_names:
+            # 결과를 순서대로 합치므로 앞쪽 파일부터 workers*2 개까지만 미리 제출 (메모리 제한)
+            while queued and len(futures) < workers * 2:
+                queued_name = queued.popleft()
+                futures[queued_name] = executor.submit(load_day_stats, log_dir, queued_name)
+            if is_cancelled(): return
+            if name not in stale_set:
+                yield name, load_day_stats(log_dir, name)
+                continue
+            future = futures.pop(name)
+            while True:
+                try:
+                    stats = future.result(timeout=0.2)
+                    break
+                except FutureTimeoutError:
+                    if is_cancelled(): return
+            yield name, stats
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def day_log_files(log_dir, start_date, end_date):
+    """기간(start_date ~ end_date)에 해당하는 일별 채팅 로그 파일명 (오래된 순)"""
+    return get_chat_log_catalog(log_dir).names(start_date, end_date)
+
+
+class ChatStatsTotals:
+    """일별 집계를 합친 기간 전체 집계. 유저 닉네임이 최신이 되도록 오래된 날짜부터 add() 해야 합니다.
+    top_k 가 있으면 메시지 빈도는 SpaceSaving(top_k) 으로 근사하고, 특정 단어 횟수는 일별 캐시를 다시 합산합니다."""
+    def __init__(self, log_dir=None, top_k=None):
+        self.log_dir = log_dir
+        self.top_k = top_k
+        self.freq = {} if not top_k else None # {공백 제거 메시지: 횟수}
+        self.heavy_hitters = SpaceSaving(top_k) if top_k else None
+        self.file_names = []  # 합친 일별 로그 파일 (top_k 모드에서 특정 단어 횟수 계산용)
+        self.user_counts = {} # {아이디: 채팅 수}
+        self.user_nicks = {}  # {아이디: 마지막 닉네임}
+        self.chats = 0
+        self.seconds = 0
+        self.days = 0
+
+    def add(self, day_stats, file_name=None):
+        self.days += 1
+        self.chats += day_stats["chats"]
+        self.seconds += day_stats["seconds"]
+        if file_name:
+            self.file_names.append(file_name)
+        if self.heavy_hitters is not None:
+            update = self.heavy_hitters.update
+            for msgg, count in day_stats["freq"].items():
+                update(msgg, count)
+        else:
+            freq = self.freq
+            for msgg, count in day_stats["freq"].items():
+                freq[msgg] = freq.get(msgg, 0) + count
+        user_counts = self.user_counts
+        for id_val, (count, nick) in day_stats["users"].items():
+            user_counts[id_val] = user_counts.get(id_val, 0) + count
+            self.user_nicks[id_val] = nick # 계속 덮어씀 -> 마지막이 최신
+
+    def frequency_result(self):
+        """가장 많은 채팅 (ResultsDialog). top_k 모드면 추정 횟수와 오차(errors)를 함께 반환"""
+        if self.heavy_hitters is not None:
+            top = self.heavy_hitters.top()
+            return {
+                "total_seconds": self.seconds,
+                "total_chats": self.heavy_hitters.total,
+                "sorted_result": {msgg: count for msgg, count, _ in top},
+                "errors": {msgg: error for msgg, _, error in top if error},
+                "max_error": self.heavy_hitters.max_error
+            }
+        sorted_result = dict(sorted(self.freq.items(), key=lambda item: item[1], reverse=True))
+        return {
+            "total_seconds": self.seconds,
+            "total_chats": sum(sorted_result.values()),
+            "sorted_result": sorted_result
+        }
+
+    def _freq_items(self):
+        """(공백 제거 메시지, 횟수). top_k 모드면 일별 캐시를 차례로 읽음 (같은 메시지가 여러 번 나올 수 있음)"""
+        if self.freq is not None:
+            yield from self.freq.items()
+            return
+        for file_name in self.file_names:
+            yield from load_day_stats(self.log_dir, file_name)["freq"].items()
+
+    def user_result(self):
+        """채팅을 가장 많이 친 사람 (UserStatsResultDialog)"""
+        sorted_users = sorted(self.user_counts.items(), key=lambda x: x[1], reverse=True)
+        return {
+            "total_chats": self.chats,
+            "total_users": len(sorted_users),
+            "sorted_result": [(uid, count, self.user_nicks.get(uid, "Unknown")) for uid, count in sorted_users]
+        }
+
+    def char_count_result(self, target, is_emoticon=False):
+        """특정 단어/이모티콘이 나온 횟수 (CharCountResultDialog)
+        빈도표의 키는 띄어쓰기를 제외한 메시지 -> 같은 메시지는 한 번만 세고 횟수를 곱함
+        target이 tuple이면 여러 대상을 한 번에 셉니다. (multi_count_result)"""
+        if isinstance(target, tuple):
+            return self.multi_count_result(target)
+
+        # target이 '{:kane1Soak:}' 형태면 그대로 사용, 아니면 '{: :}'로 감싸기
+        search_term = target
+        if not (search_term.startswith("{:") and search_term.endswith(":}")):
+            search_term = f"{{:{target}:}}"
+        target_clean = target.replace(" ", "")
+
+        total_count = 0
+        total_chars = 0
+        for msg_clean, chat_count in self._freq_items():
+            # 띄어쓰기 제외한 전체 글자 수 집계
+            total_chars += len(msg_clean) * chat_count
+
+            # 이모티콘 모드
+            if is_emoticon:
+                found = msg_clean.count(search_term)
+            # 텍스트 모드 (띄어쓰기 무시)
+            elif target_clean in CHAR_COUNT_ALIASES:
+                found = msg_clean.count(target_clean) + sum(msg_clean.count(alias) for alias in CHAR_COUNT_ALIASES[target_clean])
+            else:
+                # '뭉' -> '뭉', '뭉탱', '뭉탱이' 모두 '뭉' 글자 세면 포함됨
+                found = msg_clean.count(target_clean)
+            total_count += found * chat_count
+
+        return {
+            "target": target,
+            "is_emoticon": is_emoticon,
+            "count": total_count,
+            "total_chats": self.chats,
+            "total_chars": total_chars,
+            "total_seconds": self.seconds
+        }
+
+    def multi_count_result(self, targets):
+        """여러 단어/이모티콘이 나온 횟수를 한 번에 세고 순위표로 반환 (CharCountResultDialog)
+        '{:이름:}' 형태는 이모티콘, 나머지는 띄어쓰기를 무시한 단어로 셉니다."""
+        patterns = {}
+        for target in targets:
+            if target.startswith("{:") and target.endswith(":}"):
+                patterns[target] = target
+                continue
+            target_clean = target.replace(" ", "")
+            patterns[target_clean] = target
+            for alias in CHAR_COUNT_ALIASES.get(target_clean, ()):
+                patterns[alias] = target
+        counter = MultiPatternCounter(patterns)
+        emoticons_only = all(pattern.startswith("{:") for pattern in patterns)
+
+        counts = dict.fromkeys(counter.labels, 0)
+        total_chars = 0
+        for msg_clean, chat_count in self._freq_items():
+            total_chars += len(msg_clean) * chat_count
+            if emoticons_only and "{:" not in msg_clean: continue # 이모티콘이 없는 메시지는 훑지 않음
+            counter.count(msg_clean, chat_count, counts)
+
+        ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+        return {
+            "target": tuple(targets),
+            "is_emoticon": False,
+            "ranked": ranked,
+            "count": sum(counts.values()),
+            "total_chats": self.chats,
+            "total_chars": total_chars,
+            "total_seconds": self.seconds
+        }
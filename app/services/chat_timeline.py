@@ -0,0 +1,133 @@
+"""
+Chat Timeline Service
+
+채팅 로그에서 방송(세션)별 초당/분당 채팅 수 배열을 만들고 채팅이 갑자기 몰린 순간(클립각, 리액션)을 찾습니다.
+- 세션 구분은 채팅 통계와 같이 30분(SESSION_GAP_SECONDS) 이상 채팅이 없으면 방송 꺼짐으로 봅니다.
+- 급증 판정은 NumPy 누적합으로 모든 초에 대해 한 번에 계산합니다. (하루치 로그 기준 1초 미만)
+  10초 창의 채팅 수를 직전 5분 평균과 비교해 점수(표준 편차 단위)가 기준 이상이면 급증으로 보고,
+  이어지는 급증 구간에서는 가장 채팅이 많은 10초만 남깁니다.
+"""
+
+import os
+from typing import NamedTuple
+
+import numpy as np
+
+from app.utils.chat_log_parser import EVENT_MARK, decode_timestamp
+from app.services.chat_stats_cache import SESSION_GAP_SECONDS
+
+SPIKE_WINDOW_SECONDS = 10     # 급증 판정 창 (초)
+BASELINE_SECONDS = 300        # 비교 기준: 직전 5분
+BASELINE_MIN_SECONDS = 60     # 방송 시작 직후 1분은 기준이 부족해 판정하지 않음
+SPIKE_MIN_SCORE = 4.0
+SPIKE_MIN_MESSAGES = 20       # 10초 창 최소 채팅 수
+
+
+class ChatSession(NamedTuple):
+    start: int                # 세션 첫 채팅 시각 (decode_timestamp 초)
+    per_second: np.ndarray    # per_second[i] = start + i 초의 채팅 수
+
+    @property
+    def end(self):
+        return self.start + len(self.per_second) - 1
+
+    @property
+    def total(self):
+        return int(self.per_second.sum())
+
+    @property
+    def per_minute(self):
+        """per_minute[i] = 세션 시작 후 i 번째 분의 채팅 수"""
+        padded = np.zeros(-(-len(self.per_second) // 60) * 60, dtype=self.per_second.dtype)
+        padded[:len(self.per_second)] = self.per_second
+        return padded.reshape(-1, 60).sum(axis=1)
+
+
+class ChatSpike(NamedTuple):
+    timestamp: int            # 급증 10초 창 시작 시각
+    count: int                # 10초 창 채팅 수
+    baseline: float           # 직전 5분 평균으로 예상한 10초 채팅 수
+    score: float
+
+
+def read_timestamps(path):
+    """로그 파일의 채팅 시각 배열 (이벤트 줄 제외, 정렬됨)"""
+    times = []
+    append = times.append
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            if line[20:23] != "] <" or EVENT_MARK in line: continue
+            ts = decode_timestamp(line, 1)
+            if ts is not None:
+                append(ts)
+    timestamps = np.array(times, dtype=np.int64)
+    timestamps.sort()
+    return timestamps
+
+
+def split_sessions(timestamps, gap=SESSION_GAP_SECONDS):
+    """정렬된 시각 배열을 gap 초 이상 끊긴 곳에서 나누어 세션별 초당 채팅 수로 변환"""
+    if len(timestamps) == 0: return []
+    breaks = np.flatnonzero(np.diff(timestamps) > gap) + 1
+    sessions = []
+    for part in np.split(timestamps, breaks):
+        start = int(part[0])
+        sessions.append(ChatSession(start, np.bincount(part - start)))
+    return sessions
+
+
+def _window_sums(cumsum, window, count):
+    return cumsum[window:window + count] - cumsum[:count]
+
+
+def detect_spikes(session, min_score=SPIKE_MIN_SCORE, min_messages=SPIKE_MIN_MESSAGES,
+                  window=SPIKE_WINDOW_SECONDS, baseline_seconds=BASELINE_SECONDS):
+    """세션의 급증 구간 목록 (시간순)"""
+    counts = session.per_second.astype(np.float64)
+    n = len(counts) - window + 1
+    if n <= BASELINE_MIN_SECONDS: return []
+
+    cs = np.concatenate(([0.0], np.cumsum(counts)))
+    cs2 = np.concatenate(([0.0], np.cumsum(counts * counts)))
+    t = np.arange(n)
+    burst = _window_sums(cs, window, n) # burst[t] = t ~ t+window-1 초 채팅 수
+
+    # 직전 baseline_seconds 초의 초당 평균/분산 (방송 초반은 있는 만큼만)
+    lo = np.maximum(t - baseline_seconds, 0)
+    length = np.maximum(t - lo, 1)
+    mean = (cs[t] - cs[lo]) / length
+    var = np.maximum((cs2[t] - cs2[lo]) / length - mean * mean, 0.0)
+    expected = mean * window
+    # 분산이 거의 없는 조용한 구간에서 점수가 튀지 않도록 포아송 잡음(expected)과 1을 더함
+    score = (burst - expected) / np.sqrt(var * window + expected + 1.0)
+
+    candidates = np.flatnonzero((t >= BASELINE_MIN_SECONDS) & (score >= min_score) & (burst >= min_messages))
+    if len(candidates) == 0: return []
+
+    spikes = []
+    for group in np.split(candidates, np.flatnonzero(np.diff(candidates) > window) + 1):
+        peak = int(group[np.argmax(burst[group])])
+        spikes.append(ChatSpike(session.start + peak, int(burst[peak]), float(expected[peak]), float(score[peak])))
+    return spikes
+
+
+def analyze_day(path, min_score=SPIKE_MIN_SCORE, min_messages=SPIKE_MIN_MESSAGES):
+    """로그 파일 하나의 (세션 목록, 급증 목록)"""
+    sessions = split_sessions(read_timestamps(path))
+    spikes = []
+    for session in sessions:
+        spikes.extend(detect_spikes(session, min_score, min_messages))
+    return sessions, spikes
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from app.utils.chat_log_parser import to_datetime
+    for log_path in sys.argv[1:]:
+        started = time.perf_counter()
+        day_sessions, day_spikes = analyze_day(log_path)
+        elapsed = time.perf_counter() - started
+        print(f"{os.path.basename(log_path)}: 세션 {len(day_sessions)}개, 급증 {len(day_spikes)}개, {elapsed * 1000:.1f} ms")
+        for spike in sorted(day_spikes, key=lambda s: s.score, reverse=True)[:20]:
+            print(f"  {to_datetime(spike.timestamp)}  {spike.count:5d}개 (평소 {spike.baseline:.1f})  점수 {spike.score:.1f}")
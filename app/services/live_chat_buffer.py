@@ -0,0 +1,107 @@
+"""
+실시간 채팅 링 버퍼
+
+방송 중 수신한 채팅을 메모리에 보관합니다.
+채팅 모아보기/추첨 당첨자 채팅처럼 특정 유저의 최근 채팅을 1초마다 확인하는 기능이
+로그 파일을 다시 읽지 않고 최근 채팅을 가져올 수 있도록 유저별 색인을 함께 유지합니다.
+"""
+import threading
+from collections import OrderedDict, deque
+
+from app.services.chat_log_index import normalize_nick
+
+MAX_LINES_PER_USER = 100  # 유저별 보관 채팅 수 (모아보기 최대 표시 수)
+MAX_USERS = 5000          # 보관 유저 수 (오래 채팅하지 않은 유저부터 제거)
+
+
+class LiveChatBuffer:
+    def __init__(self, max_users=MAX_USERS, max_lines_per_user=MAX_LINES_PER_USER):
+        self.max_users = max_users
+        self.max_lines_per_user = max_lines_per_user
+        self._lock = threading.Lock()
+        self._lines = OrderedDict()  # user_id -> deque[chat], 최근 채팅한 유저가 뒤쪽
+        self._nicks = {}             # user_id -> 마지막 닉네임
+        self._nick_ids = {}          # 닉네임 -> user_id
+        self._nick_key_ids = {}      # 공백/대소문자 무시 닉네임 -> user_id
+        self._seeded = set()         # 로그 파일에서 이전 채팅을 불러온 유저
+
+    def append(self, chat, user_id, nick):
+        """수신한 채팅 한 줄을 추가합니다."""
+        if not user_id: return
+        with self._lock:
+            lines = self._lines.get(user_id)
+            if lines is None:
+                lines = deque(maxlen=self.max_lines_per_user)
+                self._lines[user_id] = lines
+            else:
+                self._lines.move_to_end(user_id)
+            lines.append(chat)
+            self._set_nick(user_id, nick)
+            while len(self._lines) > self.max_users:
+                old_id, _ = self._lines.popitem(last=False)
+                self._forget(old_id)
+
+    def _set_nick(self, user_id, nick):
+        old_nick = self._nicks.get(user_id)
+        if old_nick == nick: return
+        self._nicks[user_id] = nick
+        self._nick_ids[nick] = user_id
+        self._nick_key_ids[normalize_nick(nick)] = user_id
+
+    def _forget(self, user_id):
+        nick = self._nicks.pop(user_id, None)
+        self._seeded.discard(user_id)
+        if nick is None: return
+        if self._nick_ids.get(nick) == user_id:
+            del self._nick_ids[nick]
+        nick_key = normalize_nick(nick)
+        if self._nick_key_ids.get(nick_key) == user_id:
+            del self._nick_key_ids[nick_key]
+
+    def seed(self, user_id, nick, chats):
+        """로그 파일에서 읽은 이전 채팅(오래된 순)을 버퍼 앞쪽에 합칩니다."""
+        with self._lock:
+            lines = self._lines.get(user_id)
+            live = list(lines) if lines is not None else []
+            known = set(chats)
+            merged = deque(list(chats) + [chat for chat in live if chat not in known], maxlen=self.max_lines_per_user)
+            self._lines[user_id] = merged
+            self._lines.move_to_end(user_id)
+            if user_id not in self._nicks:
+                self._set_nick(user_id, nick)
+            self._seeded.add(user_id)
+            while len(self._lines) > self.max_users:
+                old_id, _ = self._lines.popitem(last=False)
+                self._forget(old_id)
+
+    def is_seeded(self, user_id):
+        with self._lock:
+            return user_id in self._seeded
+
+    def find_user(self, search, ignore_space=False):
+        """닉네임 또는 아이디로 유저를 찾습니다. (user_id, nick) 또는 (None, "")"""
+        with self._lock:
+            if search in self._nicks:
+                return search, self._nicks[search]
+            user_id = self._nick_key_ids.get(normalize_nick(search)) if ignore_space else self._nick_ids.get(search)
+            if user_id is None:
+                return None, ""
+            return user_id, self._nicks[user_id]
+
+    def user_lines(self, user_id, limit=None):
+        """유저의 최근 채팅을 오래된 순으로 반환합니다."""
+        with self._lock:
+            lines = self._lines.get(user_id)
+            if not lines: return []
+            lines = list(lines)
+        return lines[-limit:] if limit else lines
+
+    def clear(self):
+        with self._lock:
+            self._lines.clear()
+            self._nicks.clear()
+            self._nick_ids.clear()
+            self._nick_key_ids.clear()
+            self._seeded.clear()
+
+live_chat_buffer = LiveChatBuffer()
@@ -0,0 +1,165 @@
+"""
+Profile Lookup Service
+
+유저 정보 조회(팔로우 날짜, 닉네임, 구독 정보)를 TTL 동안 캐시합니다.
+- 같은 유저를 여러 번 조회(밴 전에 반복 클릭 등)해도 TTL(PROFILE_TTL) 안에서는 API 를 다시 부르지 않습니다.
+  없는 유저(NotFoundException)는 NOT_FOUND_TTL 동안만 기억하고, 다른 오류는 캐시하지 않습니다.
+- 같은 유저에 대한 조회가 진행 중이면 새로 요청하지 않고 그 결과를 함께 기다립니다. (조회하던 쪽이 취소되면 기다리던 쪽이 다시 조회)
+- prefetch(): 후원한 유저의 프로필을 미리 받아 둡니다. (동시 MAX_PREFETCH 개까지, 넘치면 건너뜀)
+- 구독 정보는 SubscriberStore 에서 조회 시점에 채운 사본으로 돌려줍니다. (캐시된 객체는 바꾸지 않음)
+- 커넥터의 asyncio 루프 안에서만 호출합니다.
+"""
+
+import copy
+import time
+import asyncio
+from collections import OrderedDict
+
+from chzzkpy.error import NotFoundException
+
+PROFILE_TTL = 300
+NOT_FOUND_TTL = 60
+MAX_ENTRIES = 1000
+MAX_PREFETCH = 2
+
+
+class ProfileInfo:
+    __slots__ = ("user_id", "nick", "following_date", "subscription", "not_found", "fetched")
+
+    def __init__(self, user_id, nick=None, following_date=None, subscription=None, not_found=False):
+        self.user_id = user_id
+        self.nick = nick
+        self.following_date = following_date # None: 팔로우하지 않음
+        self.subscription = subscription # SubscriberStore.get() 결과 또는 None
+        self.not_found = not_found
+        self.fetched = time.monotonic()
+
+    @property
+    def age(self):
+        return time.monotonic() - self.fetched
+
+    def with_subscription(self, subscription):
+        """구독 정보만 바꾼 사본 (캐시된 객체는 여러 곳에서 공유하므로 직접 바꾸지 않음)"""
+        info = copy.copy(self)
+        info.subscription = subscription
+        return info
+
+
+class ProfileLookupService:
+    def __init__(self, ttl=PROFILE_TTL, not_found_ttl=NOT_FOUND_TTL, max_entries=MAX_ENTRIES):
+        self.ttl = ttl
+        self.not_found_ttl = not_found_ttl
+        self.max_entries = max_entries
+        self._cache = OrderedDict() # (채널, 아이디/닉네임) -> ProfileInfo
+        self._inflight = {} # (채널, 아이디/닉네임) -> asyncio.Future
+        self._prefetching = set() # 미리 조회 중인 key
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.prefetched = 0
+        self.errors = 0
+
+    def _get_cached(self, key):
+        info = self._cache.get(key)
+        if info is None: return None
+        if info.age > (self.not_found_ttl if info.not_found else self.ttl):
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return info
+
+    def _put(self, key, info):
+        self._cache[key] = info
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def invalidate(self, channel_id, user_id_or_nick):
+        self._cache.pop((channel_id, user_id_or_nick), None)
+
+    async def lookup(self, client, user_id_or_nick, subscriber_store=None):
+        """client(비공식 ChatClient).profile_card 결과를 ProfileInfo 로 반환 (캐시/진행 중 요청 공유)"""
+        key = (client.channel_id, user_id_or_nick)
+        info = self._get_cached(key)
+        if info is not None:
+            self.hits += 1
+        else:
+            info = await self._load(client, user_id_or_nick, key)
+        if subscriber_store is not None:
+            info = info.with_subscription(subscriber_store.get(info.user_id) or subscriber_store.get(user_id_or_nick))
+        return info
+
+    async def _load(self, client, user_id_or_nick, key):
+        # 진행 중인 조회가 있으면 그 결과를 기다림 (조회하던 쪽이 취소되었으면 직접 다시 조회)
+        while key in self._inflight:
+            future = self._inflight[key]
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled(): raise # 기다리던 쪽이 취소됨
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            info = await self._fetch(client, user_id_or_nick)
+            self._put(key, info)
+            if info.user_id != user_id_or_nick:
+                self._put((client.channel_id, info.user_id), info)
+            future.set_result(info)
+            return info
+        except Exception as e:
+            self.errors += 1
+            future.set_exception(e)
+            future.exception() # 기다리는 쪽이 없어도 경고가 나지 않게
+            raise
+        finally:
+            if not future.done(): # 취소(CancelledError) 등
+                future.cancel()
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    @staticmethod
+    async def _fetch(client, user_id_or_nick):
+        try:
+            profile = await client.profile_card(user_id_or_nick)
+        except NotFoundException:
+            return ProfileInfo(user_id_or_nick, not_found=True)
+        if not profile:
+            return ProfileInfo(user_id_or_nick, not_found=True)
+        streaming_property = profile.streaming_property
+        following_date = streaming_property.following_date if streaming_property else None
+        return ProfileInfo(getattr(profile, "user_id_hash", None) or user_id_or_nick, profile.nickname, following_date)
+
+    def prefetch(self, client, user_id):
+        """(루프 안에서) 프로필을 백그라운드로 미리 조회 (이미 있거나 진행 중이면 무시)"""
+        if client is None or not user_id: return
+        key = (client.channel_id, user_id)
+        if key in self._inflight or key in self._prefetching or self._get_cached(key) is not None: return
+        if len(self._prefetching) >= MAX_PREFETCH: return
+        self._prefetching.add(key)
+        self.prefetched += 1
+        asyncio.ensure_future(self._prefetch(client, user_id, key))
+
+    async def _prefetch(self, client, user_id, key):
+        try:
+            await self.lookup(client, user_id)
+        except Exception as e:
+            print(f"[ProfileLookup] Prefetch failed for {user_id}: {e}")
+        finally:
+            self._prefetching.discard(key)
+
+    def stats(self):
+        return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses, "coalesced": self.coalesced,
+                "prefetched": self.prefetched, "errors": self.errors, "inflight": len(self._inflight)}
+
+
+_service = None
+
+
+def get_profile_lookup_service():
+    """공유 ProfileLookupService 인스턴스"""
+    global _service
+    if _service is None:
+        _service = ProfileLookupService()
+    return _service
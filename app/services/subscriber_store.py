@@ -0,0 +1,227 @@
+"""
+Subscriber Store
+
+채널 구독자 목록(아이디 -> 닉네임, 티어, 개월 수, 구독 시작일)을 BCU/subscribers/<채널>.json 에 저장해 두고 조금씩 갱신합니다.
+- 추첨 탭의 구독자 전용 필터, 유저 검색(구독 정보) 등에서 is_subscriber()/get() 으로 바로(O(1)) 확인합니다. (아이디/닉네임 모두 가능)
+- refresh(): 최근 구독 순(RECENT)으로 앞 페이지부터 받아 이미 알고 있고 바뀐 것이 없는 페이지가 나오면 멈춥니다. (새 구독만 반영)
+  받은 수와 전체 구독자 수(total_count)가 맞지 않거나 마지막 전체 갱신이 FULL_REFRESH_SECONDS 보다 오래되었으면
+  전체 페이지를 다시 받습니다. (구독 해지, 개월 수/티어 변경 반영)
+- 전체 갱신은 여러 페이지를 동시에(MAX_CONCURRENT_PAGES) 받되 RateLimiter 로 초당 요청 수를 제한합니다.
+- refresh() 는 커넥터의 asyncio 루프에서, 조회는 어느 스레드에서나 호출할 수 있습니다.
+"""
+
+import os
+import json
+import time
+import asyncio
+import threading
+
+from app.constants import USERPATH
+
+STORE_DIR = os.path.join(USERPATH, "BCU", "subscribers")
+STORE_VERSION = 1
+PAGE_SIZE = 50
+MAX_CONCURRENT_PAGES = 4
+REQUESTS_PER_SECOND = 5
+FULL_REFRESH_SECONDS = 6 * 3600
+
+
+class RateLimiter:
+    """요청 시작 간격을 1/rate 초 이상으로 유지 (asyncio)"""
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class SubscriberStore:
+    def __init__(self, channel_id, store_dir=STORE_DIR):
+        self.channel_id = channel_id
+        self.path = os.path.join(store_dir, f"{channel_id}.json")
+        self._lock = threading.Lock()
+        self._refresh_lock = None # asyncio.Lock (루프 안에서 생성)
+        self._by_id = {} # user_id -> {"nick", "tier", "month", "created"}
+        self._by_nick = {} # nick -> user_id
+        self.total_count = 0
+        self.last_full_refresh = 0.0 # time.time()
+        self.last_refresh = 0.0
+        self.pages_fetched = 0
+        self.full_refreshes = 0
+        self._load()
+
+    # --- 조회 ---
+    def get(self, user_id_or_nick):
+        """아이디 또는 닉네임 -> 구독 정보 dict (user_id 포함) / None"""
+        with self._lock:
+            user_id = user_id_or_nick if user_id_or_nick in self._by_id else self._by_nick.get(user_id_or_nick)
+            entry = self._by_id.get(user_id)
+        return dict(entry, user_id=user_id) if entry else None
+
+    def is_subscriber(self, user_id_or_nick):
+        with self._lock:
+            return user_id_or_nick in self._by_id or user_id_or_nick in self._by_nick
+
+    def nicknames(self, tier=None):
+        with self._lock:
+            return [entry["nick"] for entry in self._by_id.values() if tier is None or entry["tier"] == tier]
+
+    def nickname_set(self):
+        with self._lock:
+            return set(self._by_nick)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    @property
+    def is_loaded(self):
+        return self.last_refresh > 0
+
+    # --- 저장 ---
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != STORE_VERSION: return
+            self._set_entries(data.get("subscribers", {}))
+            self.total_count = data.get("total_count", len(self._by_id))
+            self.last_full_refresh = data.get("last_full_refresh", 0.0)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[SubscriberStore] Failed to load {self.path}: {e}")
+
+    def _save(self):
+        with self._lock:
+            data = {"version": STORE_VERSION, "channel": self.channel_id, "total_count": self.total_count,
+                    "last_full_refresh": self.last_full_refresh, "subscribers": self._by_id}
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"[SubscriberStore] Failed to save {self.path}: {e}")
+
+    def _set_entries(self, by_id):
+        by_nick = {entry["nick"]: user_id for user_id, entry in by_id.items()}
+        with self._lock:
+            self._by_id, self._by_nick = by_id, by_nick
+
+    @staticmethod
+    def _entry(sub):
+        created = getattr(sub, "created_date", None)
+        return {"nick": sub.user_name, "tier": sub.tier_no, "month": sub.month,
+                "created": created.isoformat() if hasattr(created, "isoformat") else created}
+
+    # --- 갱신 ---
+    async def _fetch_page(self, client, page_no, limiter):
+        await limiter.wait()
+        result = await client.get_subscribers(page=page_no, size=PAGE_SIZE, sort="RECENT")
+        self.pages_fetched += 1
+        return result
+
+    async def refresh(self, client, full=False, max_age=0):
+        """구독자 목록 갱신 (새 구독만 / 필요하면 전체). 반환: 바뀐 구독자 수
+        max_age: 마지막 갱신이 이 시간(초) 안이면 요청하지 않음"""
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock: # 동시에 여러 곳에서 요청하면 한 번만 받음
+            if not full and max_age and time.time() - self.last_refresh < max_age:
+                return 0
+            limiter = RateLimiter(REQUESTS_PER_SECOND)
+            if not full and time.time() - self.last_full_refresh < FULL_REFRESH_SECONDS:
+                changed = await self._refresh_delta(client, limiter)
+                if changed is not None:
+                    self.last_refresh = time.time()
+                    if changed: self._save()
+                    return changed
+            changed = await self._refresh_full(client, limiter)
+            self.last_refresh = self.last_full_refresh = time.time()
+            self.full_refreshes += 1
+            self._save()
+            return changed
+
+    async def _refresh_delta(self, client, limiter):
+        """최근 구독 페이지부터 바뀐 것이 없는 페이지가 나올 때까지 반영. 전체 수가 맞지 않으면 None (전체 갱신 필요)"""
+        with self._lock:
+            by_id = dict(self._by_id)
+        changed = 0
+        page_no = 0
+        total_count = self.total_count
+        while True:
+            result = await self._fetch_page(client, page_no, limiter)
+            data = result.data or []
+            total_count = getattr(result, "total_count", total_count)
+            page_changed = 0
+            for sub in data:
+                entry = self._entry(sub)
+                old = by_id.get(sub.user_id)
+                if old is None or old["nick"] != entry["nick"] or old["tier"] != entry["tier"] or old["month"] != entry["month"]:
+                    by_id[sub.user_id] = entry
+                    page_changed += 1
+            changed += page_changed
+            if page_changed == 0 or len(data) < PAGE_SIZE:
+                break
+            page_no += 1
+        if len(by_id) != total_count: # 해지한 구독자가 있거나 중간 페이지가 바뀜
+            return None
+        self.total_count = total_count
+        if changed: self._set_entries(by_id)
+        return changed
+
+    async def _refresh_full(self, client, limiter):
+        first = await self._fetch_page(client, 0, limiter)
+        total_pages = getattr(first, "total_pages", None)
+        results = [first]
+        if total_pages is None: # 페이지 수를 모르면 순서대로
+            page_no, result = 0, first
+            while result.data and len(result.data) >= PAGE_SIZE:
+                page_no += 1
+                result = await self._fetch_page(client, page_no, limiter)
+                results.append(result)
+        elif total_pages > 1:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+            async def fetch(page_no):
+                async with semaphore:
+                    return await self._fetch_page(client, page_no, limiter)
+            results += await asyncio.gather(*(fetch(page_no) for page_no in range(1, total_pages)))
+
+        by_id = {}
+        for result in results:
+            for sub in result.data or []:
+                by_id.setdefault(sub.user_id, self._entry(sub))
+        with self._lock:
+            old = self._by_id
+        changed = sum(1 for user_id, entry in by_id.items() if old.get(user_id) != entry) + sum(1 for user_id in old if user_id not in by_id)
+        self.total_count = getattr(first, "total_count", len(by_id))
+        self._set_entries(by_id)
+        return changed
+
+    def stats(self):
+        return {"channel": self.channel_id, "subscribers": len(self._by_id), "total_count": self.total_count,
+                "pages_fetched": self.pages_fetched, "full_refreshes": self.full_refreshes,
+                "last_refresh_ago": round(time.time() - self.last_refresh, 1) if self.last_refresh else None}
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_subscriber_store(channel_id):
+    """채널별 SubscriberStore 인스턴스 (공유)"""
+    with _stores_lock:
+        store = _stores.get(channel_id)
+        if store is None:
+            store = SubscriberStore(channel_id)
+            _stores[channel_id] = store
+        return store
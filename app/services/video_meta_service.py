@@ -0,0 +1,224 @@
+"""
+Video Meta Service
+
+영상 후원 영상의 방향(쇼츠/일반)을 확인하고 결과를 캐시합니다.
+- 유튜브: YouTube Data API(videos?part=player)의 embedWidth/embedHeight, 치지직 클립: 썸네일 이미지 크기로 판단합니다.
+- 썸네일은 전체를 받지 않고 앞부분(Range 요청)만 받아 PIL 이 이미지 헤더에서 크기를 읽는 즉시 연결을 끊습니다.
+- 결과는 메모리 LRU + BCU/video_meta.json 에 영상 ID(썸네일은 URL) 기준으로 저장되어 같은 영상은 다시 요청하지 않습니다.
+  확인에 실패한 경우("normal" 반환)는 저장하지 않고 다음에 다시 시도합니다.
+- HTTP 연결은 requests.Session 하나로 재사용합니다.
+- *_async() 는 작업 스레드에서 확인 후 callback(video_type) 을 호출합니다. (GUI 갱신은 시그널로 넘겨서 할 것)
+  같은 영상에 대한 요청이 진행 중이면 새로 요청하지 않고 그 결과를 함께 받습니다.
+"""
+
+import os
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from PIL import ImageFile
+
+from app.constants import USERPATH
+
+CACHE_FILE = os.path.join(USERPATH, "BCU", "video_meta.json")
+CACHE_VERSION = 1
+MAX_ENTRIES = 2000
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3/videos"
+HEADER_RANGE_BYTES = 65535 # 썸네일 앞부분만 요청 (JPEG/PNG/WEBP 헤더는 보통 수 KB 안에 있음)
+CHUNK_SIZE = 4096
+REQUEST_TIMEOUT = 5
+
+
+def classify_youtube(embed_width, embed_height):
+    """embed 크기(maxWidth=1280, maxHeight=720 기준) -> "shorts" / "normal" """
+    embed_width, embed_height = int(embed_width), int(embed_height)
+    if embed_height == 720:
+        return "shorts" if embed_width <= 450 else "normal"
+    return "shorts" if embed_width <= embed_height else "normal"
+
+
+def classify_thumbnail(width, height):
+    if width == 720 and height == 1280:
+        return "shorts"
+    return "shorts" if width < height else "normal"
+
+
+class VideoMetaService:
+    def __init__(self, cache_file=CACHE_FILE, max_entries=MAX_ENTRIES):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self._cache = OrderedDict() # key -> {"type", "width", "height"}
+        self._lock = threading.Lock()
+        self._inflight = {} # key -> Future
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="VideoMeta")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.bytes_read = 0
+        self._load()
+
+    # --- 캐시 ---
+    def _load(self):
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self._cache.update(data.get("entries", {}))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[VideoMeta] Failed to load cache: {e}")
+
+    def _save(self):
+        with self._lock:
+            data = {"version": CACHE_VERSION, "entries": dict(self._cache)}
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_path = self.cache_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            print(f"[VideoMeta] Failed to save cache: {e}")
+
+    def _get_cached(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        self._save()
+
+    def _resolve(self, key, fetch):
+        """캐시 확인 -> 없으면 _lookup()"""
+        entry = self._get_cached(key)
+        if entry is not None:
+            return entry["type"]
+        return self._lookup(key, fetch)
+
+    def _lookup(self, key, fetch):
+        """fetch() 로 {"type", "width", "height"} 확인 (실패 시 None) 후 저장 -> 영상 타입"""
+        try:
+            entry = fetch()
+        except Exception as e:
+            self.errors += 1
+            print(f"[VideoMeta] Lookup failed for {key}: {e}")
+            entry = None
+        if entry is None:
+            return "normal"
+        self._put(key, entry)
+        return entry["type"]
+
+    # --- 확인 ---
+    def _fetch_youtube(self, video_id, api_key):
+        params = {"part": "player", "id": video_id, "maxHeight": 720, "maxWidth": 1280, "key": api_key}
+        response = self.session.get(YOUTUBE_API_URL, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        items = response.json().get("items") or []
+        if not items: return None
+        player_info = items[0]["player"]
+        width, height = int(player_info["embedWidth"]), int(player_info["embedHeight"])
+        return {"type": classify_youtube(width, height), "width": width, "height": height}
+
+    def image_size(self, url):
+        """이미지 앞부분만 받아 (width, height) 를 반환 (서버가 Range 를 무시해도 헤더를 읽으면 중단)"""
+        parser = ImageFile.Parser()
+        headers = {"Range": f"bytes=0-{HEADER_RANGE_BYTES}"}
+        with self.session.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                self.bytes_read += len(chunk)
+                parser.feed(chunk)
+                if parser.image is not None:
+                    return parser.image.size
+        return None
+
+    def _fetch_thumbnail(self, thumbnail):
+        size = self.image_size(thumbnail)
+        if size is None: return None
+        width, height = size
+        return {"type": classify_thumbnail(width, height), "width": width, "height": height}
+
+    def youtube_type(self, video_id, api_key):
+        if 'clip-donation' in video_id:
+            return "normal"
+        return self._resolve(f"yt:{video_id}", lambda: self._fetch_youtube(video_id, api_key))
+
+    def thumbnail_type(self, thumbnail):
+        return self._resolve(f"thumb:{thumbnail}", lambda: self._fetch_thumbnail(thumbnail))
+
+    # --- 비동기 ---
+    def _submit(self, key, fetch, callback):
+        entry = self._get_cached(key)
+        if entry is not None:
+            callback(entry["type"])
+            return
+        with self._lock:
+            future = self._inflight.get(key)
+            is_new = future is None
+            if is_new:
+                future = self._executor.submit(self._lookup, key, fetch)
+                self._inflight[key] = future
+        if is_new:
+            future.add_done_callback(lambda f: self._finish(key))
+        future.add_done_callback(lambda f: self._deliver(f, callback))
+
+    def _finish(self, key):
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _deliver(future, callback):
+        try:
+            video_type = future.result()
+        except Exception as e:
+            print(f"[VideoMeta] Lookup failed: {e}")
+            video_type = "normal"
+        try:
+            callback(video_type)
+        except Exception as e:
+            print(f"[VideoMeta] Callback error: {e}")
+
+    def youtube_type_async(self, video_id, api_key, callback):
+        if 'clip-donation' in video_id:
+            callback("normal")
+            return
+        self._submit(f"yt:{video_id}", lambda: self._fetch_youtube(video_id, api_key), callback)
+
+    def thumbnail_type_async(self, thumbnail, callback):
+        self._submit(f"thumb:{thumbnail}", lambda: self._fetch_thumbnail(thumbnail), callback)
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses, "errors": self.errors,
+                    "inflight": len(self._inflight), "bytes_read": self.bytes_read}
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_video_meta_service():
+    """공유 VideoMetaService 인스턴스"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = VideoMetaService()
+        return _service
@@ -1,4 +1,6 @@
+import threading
 import webbrowser
+from collections import OrderedDict
 from flask import Flask, request
 from flask_cors import CORS
 from flask_socketio import SocketIO
@@ -357,6 +359,91 @@ def emit_volume_update(volume):
     """앱에서 음량 변경 시 호출하여 Dock에 알림"""
     socketio.emit('volume_update', {'volume': volume})
 
+# --- In-process Publish (Qt -> Socket.IO) ---
+
+PUBLISH_QUEUE_SIZE = 256
+PUBLISH_IDLE_SLEEP = 0.02 # 대기 중인 이벤트가 없을 때 확인 주기(초)
+
+class SocketPublisher:
+    """
+    Qt(GUI) 스레드 등 어느 스레드에서나 Socket.IO 이벤트를 보낼 수 있게 하는 큐.
+    - publish() 는 큐에 넣기만 하고 바로 돌아옵니다. (HTTP 요청 없음)
+    - 같은 key 로 아직 전송되지 않은 이벤트가 있으면 최신 값으로 덮어씁니다. (빠른 연속 갱신 병합)
+    - 큐가 가득 차면 가장 오래된 이벤트를 버립니다.
+    - 실제 emit 은 서버가 시작한 백그라운드 작업(run)에서 합니다.
+    """
+    def __init__(self, socketio, maxsize=PUBLISH_QUEUE_SIZE):
+        self.socketio = socketio
+        self.maxsize = maxsize
+        self._pending = OrderedDict() # key -> (event, data)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self.running = False
+        self.published = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.emitted = 0
+        self.errors = 0
+
+    def publish(self, event, data, key=None):
+        """key 가 없으면 이벤트 이름이 key (같은 이벤트는 마지막 값만 전송)"""
+        with self._lock:
+            self.published += 1
+            if key is None: key = event
+            elif key is False: # 병합하지 않음
+                self._seq += 1
+                key = (event, self._seq)
+            if key in self._pending:
+                self.coalesced += 1
+            elif len(self._pending) >= self.maxsize:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            self._pending[key] = (event, data)
+
+    def _take(self):
+        with self._lock:
+            items, self._pending = list(self._pending.values()), OrderedDict()
+        return items
+
+    def flush(self):
+        for event, data in self._take():
+            try:
+                self.socketio.emit(event, data)
+                self.emitted += 1
+            except Exception as e:
+                self.errors += 1
+                print(f"[SocketPublisher] Emit '{event}' failed: {e}")
+
+    def run(self):
+        """socketio.start_background_task 로 서버 쪽에서 실행"""
+        self.running = True
+        while self.running:
+            if self._pending:
+                self.flush()
+            else:
+                self.socketio.sleep(PUBLISH_IDLE_SLEEP)
+
+    def stop(self):
+        self.running = False
+
+    def stats(self):
+        return {"published": self.published, "emitted": self.emitted, "coalesced": self.coalesced,
+                "dropped": self.dropped, "errors": self.errors, "pending": len(self._pending)}
+
+publisher = SocketPublisher(socketio)
+
+def publish(event, data, key=None):
+    """Qt 코드에서 직접 호출하는 오버레이 갱신 API (스레드 안전, 바로 반환)"""
+    publisher.publish(event, data, key)
+
+def publish_text(text):
+    publish('text_update', {'text': text})
+
+def publish_image(image_path, back_image_path=None):
+    if not image_path: return
+    publish('image_update', {'path': image_path, 'backpath': back_image_path})
+
 def run_flask_server():
+    socketio.start_background_task(publisher.run)
     socketio.run(appW, host='127.0.0.1', port=5000)   # Flask 서버 실행 (스레드 지원)
 
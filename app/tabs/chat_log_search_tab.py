@@ -4,17 +4,200 @@ import traceback
 import clipboard
 import threading
 import asyncio
+import time
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, 
                              QPushButton, QCheckBox, QButtonGroup, QComboBox, 
                              QTextEdit, QLabel, QSlider, QFrame, QMessageBox, 
                              QApplication)
 from PyQt6.QtGui import QFont, QIcon, QIntValidator
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSlot, QThread, pyqtSignal
 
 from app.constants import GLOBALFONTSIZE
 from app.resources import resource_path
 from app.ui_widgets import QToggle
+from app.services.chat_log_index import get_chat_log_index
+from app.services.chat_log_catalog import get_chat_log_catalog
+from app.services.live_chat_buffer import live_chat_buffer
+from app.utils.chat_log_parser import parse_line, decode_timestamp, line_timestamp, to_datetime
+
+class ChatLogIndexRebuildWorker(QThread):
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+
+    def __init__(self, log_dir):
+        super().__init__()
+        self.log_dir = log_dir
+        self.is_running = True
+
+    def run(self):
+        try:
+            chat_index = get_chat_log_index(self.log_dir)
+            done = chat_index.rebuild(lambda i, total, name: self.progress.emit(i, total, name), lambda: not self.is_running)
+            self.finished.emit({"done": done})
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def stop(self):
+        self.is_running = False
+
+class LiveSeedWorker(QThread):
+    """실시간 채팅 버퍼에 이전 채팅이 없는 유저의 채팅을 최근 로그 파일에서 불러옵니다. (모아보기/추첨 당첨자)
+    최근 로그 파일의 색인을 먼저 끝낸 뒤 조회하므로 덜 된 색인으로 불러오지 않습니다."""
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+
+    RECENT_FILES = 3
+
+    def __init__(self, log_dir, search, ignore_space, user_id=None, nick=""):
+        super().__init__()
+        self.log_dir = log_dir
+        self.search = search
+        self.ignore_space = ignore_space
+        self.user_id = user_id # 실시간 채팅 버퍼에서 찾은 유저 (없으면 색인에서 찾음)
+        self.nick = nick
+
+    def run(self):
+        try:
+            chat_index = get_chat_log_index(self.log_dir)
+            recent_files = get_chat_log_catalog(self.log_dir).names(newest_first=True)[:self.RECENT_FILES]
+            chat_index.sync(file_names=set(recent_files))
+            user_id, nick = self.user_id, self.nick
+            if user_id is None:
+                user_id, nick = chat_index.find_user(self.search, self.ignore_space)
+            chats = []
+            if user_id is not None:
+                for file_name in reversed(chat_index.user_files(user_id)):
+                    if file_name in recent_files:
+                        chats.extend(chat_index.read_user_lines(file_name, user_id))
+            self.finished.emit({"search": self.search, "ignore_space": self.ignore_space, "user_id": user_id, "nick": nick,
+                                "chats": chats, "complete": not chat_index.is_syncing}) # 전체 색인이 끝났을 때만 '없는 유저'로 확정
+        except Exception as e:
+            self.error.emit(str(e))
+
+class ChatLogSearchWorker(QThread):
+    """채팅 로그 검색 (아이디/닉네임, 채팅 내용)을 GUI 스레드 밖에서 실행합니다.
+    검색된 채팅은 최근 채팅부터 묶음 단위(batch)로 전달됩니다."""
+    progress = pyqtSignal(int, int, str)
+    user_found = pyqtSignal(str, str)
+    batch = pyqtSignal(list)
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+
+    BATCH_SIZE = 500
+    BATCH_INTERVAL = 0.2 # 초
+
+    def __init__(self, log_dir, search_type, search, ignore_space, limit, cutoff_time, before=None):
+        super().__init__()
+        self.log_dir = log_dir
+        self.search_type = search_type
+        self.search = search
+        self.ignore_space = ignore_space
+        self.limit = limit # None이면 전체 검색
+        self.cutoff_time = cutoff_time # 전문 색인을 사용할 수 없을 때의 채팅 내용 검색 기간
+        self.before = before # 채팅 내용 검색 다음 페이지 커서
+        self.is_running = True
+        self._pending = []
+        self._last_emit = 0.0
+
+    def run(self):
+        try:
+            if self.search_type == "채팅 내용":
+                info = self.search_content()
+            else:
+                info = self.search_user()
+            self._flush()
+            info["cancelled"] = not self.is_running
+            self.finished.emit(info)
+        except Exception as e:
+            self.error.emit(traceback.format_exc())
+
+    def stop(self):
+        self.is_running = False
+
+    def _add(self, line):
+        self._pending.append(line)
+        if len(self._pending) >= self.BATCH_SIZE or time.monotonic() - self._last_emit >= self.BATCH_INTERVAL:
+            self._flush()
+
+    def _flush(self):
+        self._last_emit = time.monotonic()
+        if self._pending:
+            self.batch.emit(self._pending)
+            self._pending = []
+
+    def search_user(self):
+        chat_index = get_chat_log_index(self.log_dir)
+        if not chat_index.sync(self.progress.emit, lambda: not self.is_running):
+            return {"user_id": None}
+        user_id, nick = chat_index.find_user(self.search, self.ignore_space)
+        if user_id is None:
+            return {"user_id": None}
+        self.user_found.emit(user_id, nick)
+
+        files = chat_index.user_files(user_id) # 최근 파일부터
+        first_chat_date = None
+        if files:
+            first_lines = chat_index.read_user_lines(files[-1], user_id)
+            first_ts = line_timestamp(first_lines[0]) if first_lines else None
+            if first_ts is not None:
+                first_chat_date = to_datetime(first_ts)
+        found = 0
+        for i, file_name in enumerate(files):
+            if not self.is_running: break
+            self.progress.emit(i + 1, len(files), file_name)
+            for chat in reversed(chat_index.read_user_lines(file_name, user_id)):
+                self._add(chat.replace(f" ({user_id})", ""))
+                found += 1
+                if self.limit and found >= self.limit: break
+            if self.limit and found >= self.limit: break
+        return {"user_id": user_id, "nick": nick, "chat_count": chat_index.count_user(user_id), "first_chat_date": first_chat_date}
+
+    def display_line(self, chat):
+        """[시간] <닉네임 (아이디)> 내용 -> [시간] <닉네임> 내용. 형식이 아니면 None"""
+        # Format: [2023-10-27 12:34:56] <Nick (ID)> Content
+        record = parse_line(chat)
+        if record is None: return None
+        return f"[{chat[1:20]}] <{record.nick}> {record.msg}"
+
+    def search_content(self):
+        chat_index = get_chat_log_index(self.log_dir)
+        if not chat_index.sync(self.progress.emit, lambda: not self.is_running):
+            return {}
+        if not chat_index.content_enabled: # 전문 색인을 사용할 수 없으면 최근 72시간만 직접 검색
+            return self.scan_recent_content()
+        lines, next_before = chat_index.search_content(self.search, self.ignore_space, self.limit, self.before)
+        for chat in lines:
+            line = self.display_line(chat)
+            if line: self._add(line)
+        return {"next_before": next_before}
+
+    def scan_recent_content(self):
+        search_key = self.search.replace(" ", "").lower() if self.ignore_space else self.search
+        cutoff_ts = decode_timestamp(self.cutoff_time.strftime("%Y-%m-%d %H:%M:%S"))
+        # 검색 기간 이전 날짜의 파일은 읽지 않음 (최신순)
+        files = get_chat_log_catalog(self.log_dir).names(start_date=self.cutoff_time.date(), newest_first=True)
+        found = 0
+        for i, file_name in enumerate(files):
+            if not self.is_running: break
+            self.progress.emit(i + 1, len(files), file_name)
+            with open(os.path.join(self.log_dir, file_name), 'r', encoding='utf-8') as f:
+                chat_array = f.read().split("\n")
+            for chat in reversed(chat_array):
+                if not self.is_running: break
+                record = parse_line(chat)
+                if record is None: continue
+                if record.timestamp < cutoff_ts:
+                    return {}
+                # Strict Content Match (Exclude ID/Nick) & Ignore Space/Case
+                content_to_check = record.msg.replace(" ", "").lower() if self.ignore_space else record.msg
+                if search_key in content_to_check:
+                    self._add(f"[{chat[1:20]}] <{record.nick}> {record.msg}")
+                    found += 1
+                    if found >= self.limit:
+                        return {}
+        return {}
 
 class ChatLogSearchTab(QWidget):
     def __init__(self, main_window, parent=None):
@@ -70,6 +253,27 @@ class ChatLogSearchTab(QWidget):
         self.ignore_space_check = QCheckBox('공백/대소문자 무시', self)
         optimize_layout.addWidget(self.ignore_space_check)
         optimize_layout.addStretch()
+
+        self.rebuild_index_button = QPushButton("색인 재생성", self)
+        self.rebuild_index_button.clicked.connect(self.rebuild_index)
+        optimize_layout.addWidget(self.rebuild_index_button)
+        self.rebuild_index_worker = None
+
+        self.load_more_button = QPushButton("이전 결과 더 보기", self)
+        self.load_more_button.clicked.connect(self.load_more_content)
+        optimize_layout.addWidget(self.load_more_button)
+        self.load_more_button.hide()
+        self.live_seed_missing = set() # 로그에도 없는 유저 (매초 다시 찾지 않음)
+        self.live_seed_workers = {} # (검색어, 공백 무시) -> LiveSeedWorker
+        self.search_worker = None
+        self.search_result = []
+        self.search_moa = False
+        self.search_type = ""
+        self.search_user = (None, "")
+        self.search_keyword = ""
+        self.search_before = None
+        self.search_next_before = None
+        self.search_content_lines = []
         layout.addLayout(optimize_layout)
 
         search_option_layout = QHBoxLayout()
@@ -215,23 +419,6 @@ class ChatLogSearchTab(QWidget):
             self.input_box_chat_log.setPlaceholderText("닉네임 또는 아이디를 입력하세요.")
 
 
-    def get_id_nick(self, chat):
-        id = ""
-        nick = ""
-        if ")> " in chat:
-            id_start = chat.index(" (") + 2
-            id_end = chat.index(")> ")
-            id = chat[id_start:id_end]
-            nick_start = chat.index("] <") + 3
-            nick_end = chat.index(" (")
-            nick = chat[nick_start:nick_end]
-        else:
-            id_start = chat.index("] <") + 3
-            id_end = chat.index("> ")
-            id = chat[id_start:id_end]
-            nick = id
-        return id, nick
-
     def toggle_chatMoa(self):
         if self.search_button_chat_moa.text() == "채팅 모아보기":
             self.search_button_chat_moa.setText("채팅 모아보기 정지")
@@ -267,6 +454,8 @@ class ChatLogSearchTab(QWidget):
     def search_stop(self):
         try:
             self.stop_signal = True
+            if self.search_worker is not None and self.search_worker.isRunning():
+                self.search_worker.stop()
             self.search_button_chat_log.show()
             self.search_stop_button_chat_log.hide()
             self.chat_count_label_chat_log.setText("채팅 수: ")
@@ -289,39 +478,84 @@ class ChatLogSearchTab(QWidget):
         except Exception as e:
             None
     
-    def search_id(self, nick_to_search):
-        search = nick_to_search # 검색할 닉네임/아이디
-        file_list = os.listdir(self.main_window.file_path_box_chat_log.text())
-        file_list.sort(reverse=True)
-        file_list_log = [f"{os.path.join(self.main_window.file_path_box_chat_log.text(),file)}" for file in file_list if file.endswith(".log") and "custom" not in file and "-" in file]
-        first_chat_date = None
-        user_id = None
-        if file_list_log:
-            for file_name in file_list_log:
-                QApplication.processEvents()
-                if self.stop_signal: return None # Check for cancellation
-                with open(file_name, 'r', encoding='utf-8') as f:
-                    data = f.read()
-                    chat_array = data.split("\n")
-                    for chat in chat_array[::-1]:
-                        QApplication.processEvents()
-                        if self.stop_signal: return None # Check for cancellation
-                        try:
-                            if "<" not in chat: continue
-                            id = ""
-                            nick = ""
-                            id, nick = self.get_id_nick(chat)
-                            if nick == search or id == search:
-                                user_id = id
-                                break    
-                        except Exception as e:
-                            continue
-                    if user_id == None:
-                        continue
-                    else: break
-            return user_id
+    def rebuild_index(self):
+        log_dir = self.main_window.file_path_box_chat_log.text()
+        if not os.path.isdir(log_dir):
+            QMessageBox.warning(self, "오류", "채팅 로그 폴더를 찾을 수 없습니다.")
+            return
+        if self.rebuild_index_worker is not None and self.rebuild_index_worker.isRunning():
+            self.rebuild_index_worker.stop()
+            return
+        self.rebuild_index_button.setText("색인 재생성 중지")
+        self.search_button_chat_log.setEnabled(False)
+        self.rebuild_index_worker = ChatLogIndexRebuildWorker(log_dir)
+        self.rebuild_index_worker.progress.connect(lambda i, total, name: self.result_box_chat_log.setText(f"채팅 로그 색인 생성 중... ({i}/{total})\n{name}"))
+        self.rebuild_index_worker.finished.connect(self.on_rebuild_index_finished)
+        self.rebuild_index_worker.error.connect(self.on_rebuild_index_error)
+        self.rebuild_index_worker.start()
+
+    def on_rebuild_index_finished(self, result):
+        self.rebuild_index_button.setText("색인 재생성")
+        self.live_seed_missing.clear()
+        self.search_button_chat_log.setEnabled(True)
+        if result.get("done"):
+            self.result_box_chat_log.setText("채팅 로그 색인 생성 완료")
         else:
+            self.result_box_chat_log.setText("채팅 로그 색인 생성이 중지되었습니다. 다음 검색 시 이어서 색인합니다.")
+
+    def on_rebuild_index_error(self, error_msg):
+        self.rebuild_index_button.setText("색인 재생성")
+        self.search_button_chat_log.setEnabled(True)
+        print(f"[ChatLogIndex] 색인 생성 오류: {error_msg}")
+        self.result_box_chat_log.setText(f"채팅 로그 색인 생성 중 오류가 발생했습니다.\n{error_msg}")
+
+    def live_user_lines(self, search, ignore_space=False, limit=100):
+        """실시간 채팅 버퍼에서 유저의 최근 채팅을 가져옵니다. (user_id, nick, 채팅 목록)
+        버퍼에 이전 채팅이 없는 유저는 최근 로그 파일 3개에서 한 번만 불러옵니다. (작업 스레드, 불러오는 동안은 버퍼에 있는 채팅만)"""
+        user_id, nick = live_chat_buffer.find_user(search, ignore_space)
+        if user_id is None or not live_chat_buffer.is_seeded(user_id):
+            if user_id is None and (search, ignore_space) in self.live_seed_missing:
+                return None, "", []
+            self.start_live_seed(search, ignore_space, user_id, nick)
+            if user_id is None:
+                return None, "", []
+        return user_id, nick, live_chat_buffer.user_lines(user_id, limit)
+
+    def is_live_seed_pending(self, search, ignore_space=False):
+        worker = self.live_seed_workers.get((search, ignore_space))
+        return worker is not None and worker.isRunning()
+
+    def start_live_seed(self, search, ignore_space, user_id=None, nick=""):
+        """최근 로그 파일에서 유저의 이전 채팅 불러오기 시작 (이미 진행 중이면 무시)"""
+        key = (search, ignore_space)
+        if self.is_live_seed_pending(search, ignore_space): return
+        log_dir = self.main_window.file_path_box_chat_log.text()
+        if not os.path.isdir(log_dir):
+            if user_id is None: self.live_seed_missing.add(key)
             return
+        get_chat_log_index(log_dir).sync_in_background() # 오래된 로그 (오늘 로그는 ChatLogWriter 가 실시간으로 색인함)
+        self.live_seed_workers = {k: w for k, w in self.live_seed_workers.items() if w.isRunning()}
+        worker = LiveSeedWorker(log_dir, search, ignore_space, user_id, nick)
+        worker.finished.connect(self.on_live_seed_finished)
+        worker.error.connect(lambda error_msg: print(f"[ChatLogSearch] 이전 채팅 불러오기 오류: {error_msg}"))
+        self.live_seed_workers[key] = worker
+        worker.start()
+
+    def on_live_seed_finished(self, result):
+        user_id = result["user_id"]
+        if user_id is not None:
+            if not live_chat_buffer.is_seeded(user_id):
+                live_chat_buffer.seed(user_id, result["nick"], result["chats"])
+        elif result["complete"]: # 색인 갱신 중이면 다음에 다시 확인
+            self.live_seed_missing.add((result["search"], result["ignore_space"]))
+
+    def search_id(self, nick_to_search):
+        log_dir = self.main_window.file_path_box_chat_log.text()
+        if not os.path.isdir(log_dir): return None
+        chat_index = get_chat_log_index(log_dir)
+        chat_index.sync_in_background() # 오늘 로그는 ChatLogWriter 가 실시간으로 색인함
+        user_id, nick = chat_index.find_user(nick_to_search)
+        return user_id
     
     def search_log(self, moa):
         try:
@@ -356,7 +590,7 @@ class ChatLogSearchTab(QWidget):
             
             cutoff_time = datetime.now() - timedelta(hours=72)
             if search_type == "채팅 내용":
-                self.loading_msg = "최근 72시간 채팅 내용 검색 중..."
+                self.loading_msg = "채팅 내용 검색 중..."
             if datetime.now().minute >= 40:
                 jeong_lee_time = str(int((datetime.now() + timedelta(hours=1)).strftime("%I")))
             else:
@@ -414,19 +648,9 @@ class ChatLogSearchTab(QWidget):
                 self.ignore_space_check.setEnabled(True)
                 return
 
-            result = []
-            chat_count = 0
-            is_new_moa_chat = True # 모아보기 중에 채팅이 새로 들어오면 True로 바뀜.
-            is_hit_limit_search_chat_partial = False # 최근 채팅 검색 시 검색할 채팅 수 만큼 채팅이 검색되었을 경우 True로 바뀜.
-            original_nick = ""
-            file_list = os.listdir(self.main_window.file_path_box_chat_log.text())
-            file_list.sort(reverse=True)
-            file_list_log = [f"{os.path.join(self.main_window.file_path_box_chat_log.text(),file)}" for file in file_list if file.endswith(".log") and "custom" not in file and "-" in file]
-            first_chat_date = None
-            user_id = None
+            log_dir = self.main_window.file_path_box_chat_log.text()
+            file_list_log = get_chat_log_catalog(log_dir).names() if os.path.isdir(log_dir) else []
             if self.search_button_chat_moa.text() != "채팅 모아보기 정지": ## 채팅 모아보기 하는 중이 아님
-                
-                
                 self.temp_ban_button_cm.setDisabled(True)
                 self.temp_ban_duration_combo_box.setDisabled(True)
                 self.temp_restrict_duration_combo_box.setDisabled(True)
@@ -434,196 +658,15 @@ class ChatLogSearchTab(QWidget):
                 self.ban_button_cm.setDisabled(True)
             else: ## 채팅 모아보기 중
                 self.ignore_space_check.setDisabled(True)
-            QApplication.processEvents()
             if moa == False:
                 self.search_button_chat_moa.setDisabled(True)
-                self.result_box_chat_log.setText(f"{self.loading_msg} \n아이디 검색 중....\n✅'검색 중지' 버튼 클릭 시 검색을 중단합니다.")
-            QApplication.processEvents()
-
-            if self.stop_signal == True:
-                self.result_box_chat_log.setText("")
-                return
+                if search_type != "채팅 내용":
+                    self.result_box_chat_log.setText(f"{self.loading_msg} \n아이디 검색 중....\n✅'검색 중지' 버튼 클릭 시 검색을 중단합니다.")
 
             if self.ignore_space_check.isChecked():
                 search = search.replace(" ","").lower() # 닉네임 공백/대소문자 무시
 
-            if file_list_log:
-                for file_name in file_list_log:
-                    QApplication.processEvents()
-                    if self.stop_signal == True:
-                        self.result_box_chat_log.setText("")
-                        return
-                    with open(file_name, 'r', encoding='utf-8') as f:
-                        data = f.read()
-                        chat_array = data.split("\n")
-                        for chat in chat_array[::-1]:
-                            QApplication.processEvents()
-                            try:
-                                if self.stop_signal == True:
-                                    self.result_box_chat_log.setText("")
-                                    return
-                                
-                                if search_type == "채팅 내용":
-                                    try:
-                                        # Parse Timestamp & Content
-                                        # Format: [2023-10-27 12:34:56] <Nick (ID)> Content
-                                        parts = chat.split("] <")
-                                        if len(parts) < 2: continue
-                                        time_str = parts[0].strip("[")
-                                        chat_date = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-                                        right_part = parts[1] # Nick (ID)> Content
-                                        meta_end_index = right_part.find("> ")
-                                        if meta_end_index == -1: continue
-                                        meta_part = right_part[:meta_end_index] # Nick (ID)
-                                        content_part = right_part[meta_end_index+2:] # Content
-                                        content_part = right_part[meta_end_index+2:] # Content
-                                        # Strict Content Match (Exclude ID/Nick) & Ignore Space/Case
-                                        content_to_check = content_part
-                                        search_key = search
-                                        if self.ignore_space_check.isChecked():
-                                            content_to_check = content_part.replace(" ", "").lower()
-                                            search_key = search.replace(" ", "").lower()
-                                        if search_key in content_to_check:
-                                            display_nick = meta_part
-                                            if "(" in meta_part and meta_part.endswith(")"):
-                                                display_nick = meta_part.rsplit(" (", 1)[0]
-                                            display_line = f"[{time_str}] <{display_nick}> {content_part}"
-                                            result.append(display_line)
-                                            chat_count += 1
-                                            if moa == True:
-                                                if len(result) >= 100:
-                                                    break
-                                            elif chat_count >= chatnum:
-                                                result.reverse()
-                                                should_update = True
-                                                if moa:
-                                                    current_lines = self.result_box_chat_log.toPlainText().strip().split('\n')
-                                                    if result and current_lines and result[-1].strip() == current_lines[-1].strip():
-                                                        should_update = False
-                                                if should_update:
-                                                     self.result_box_chat_log.setText("\n".join(result))
-                                                     self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum())
-                                                self.result_chat_done = True
-                                                self.search_button_chat_log.show()
-                                                self.search_stop_button_chat_log.hide()
-                                                if moa == False:
-                                                    self.input_box_chat_log.setEnabled(True)
-                                                    self.input_num_box_chat_log.setEnabled(True)
-                                                    self.search_button_chat_log.setEnabled(True)
-                                                    self.search_chat_all.setEnabled(True)
-                                                    self.search_chat_partial.setEnabled(True)
-                                                    self.ignore_space_check.setEnabled(True)
-                                                    self.search_button_chat_moa.setEnabled(True)
-                                                return 
-                                        if chat_date < cutoff_time:
-                                            result.reverse()
-                                            if not result:
-                                                self.result_box_chat_log.setText("검색 결과가 없습니다.")
-                                            else:
-                                                should_update = True
-                                                if moa:
-                                                    current_lines = self.result_box_chat_log.toPlainText().strip().split('\n')
-                                                    if result and current_lines and result[-1].strip() == current_lines[-1].strip():
-                                                        should_update = False
-                                                if should_update:
-                                                     self.result_box_chat_log.setText("\n".join(result))
-                                                     self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum())
-                                            self.result_chat_done = True
-                                            self.search_button_chat_log.show()
-                                            self.search_stop_button_chat_log.hide()
-                                            if moa == False:
-                                                self.input_box_chat_log.setEnabled(True)
-                                                self.input_num_box_chat_log.setEnabled(True)
-                                                self.search_button_chat_log.setEnabled(True)
-                                                self.search_chat_all.setEnabled(True)
-                                                self.search_chat_partial.setEnabled(True)
-                                                self.ignore_space_check.setEnabled(True)
-                                                self.search_button_chat_moa.setEnabled(True)
-                                            return
-                                    except Exception as e:
-                                        continue
-                                    continue # Skip ID logic
-
-                                if "<" not in chat: continue
-                                id = ""
-                                nick = ""
-                                id, nick = self.get_id_nick(chat)
-                                original_nick = str(nick)
-                                if self.ignore_space_check.isChecked(): # 닉네임 공백/대소문자 무시
-                                    nick = nick.replace(" ","").lower()
-                                if nick == search or id == search:
-                                    user_id = id
-                                    if moa == True:
-                                        if chat.replace(f" ({user_id})", "") == self.result_box_chat_log.toPlainText().split("\n")[-1]:
-                                            is_new_moa_chat = False
-                                    break    
-                            except Exception as e:
-                                continue
-                        if search_type == "채팅 내용": continue # File loop continue
-                        if user_id == None:
-                            continue
-                        else: break
-                if search_type == "채팅 내용":
-                     result.reverse()
-                     if not result:
-                         self.result_box_chat_log.setText("검색 결과가 없습니다.")
-                     else:
-                         should_update = True
-                         if moa:
-                             current_lines = self.result_box_chat_log.toPlainText().strip().split('\n')
-                             if result and current_lines and result[-1].strip() == current_lines[-1].strip():
-                                 should_update = False
-                         
-                         if should_update:
-                             self.result_box_chat_log.setText("\n".join(result))
-                             QTimer.singleShot(100, lambda: self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum()))
-                     self.search_button_chat_log.show()
-                     self.search_stop_button_chat_log.hide()
-                     if moa == False:
-                         self.input_box_chat_log.setEnabled(True)
-                         self.input_num_box_chat_log.setEnabled(True)
-                         self.search_button_chat_log.setEnabled(True)
-                         self.search_chat_all.setEnabled(True)
-                         self.search_chat_partial.setEnabled(True)
-                         self.ignore_space_check.setEnabled(True)
-                         self.search_button_chat_moa.setEnabled(True)
-                     return
-                QApplication.processEvents()
-                self.main_window.user_id_chzzk_ban = user_id
-                self.main_window.user_nick_chzzk_ban = str(original_nick)
-                if moa == False and search_type != "채팅 내용": ## 채팅 검색 (ID/Nick)
-                    self.chat_count_label_chat_log.setText("채팅 수: (확인 중 입니다....)")
-                    self.chat_count_label_chat_log.setText("채팅 수: (확인 중 입니다....)")
-                    if user_id != None: # 유저 아이디를 검색하였음.
-                        self.temp_ban_label_chat_log.setText("임시 제한 수: (확인 중 입니다....)")
-                        self.ban_label_chat_log.setText("활동 제한 수: (확인 중 입니다....)")
-                        self.follow_date_label_chat_log.setText("팔로우 날짜: (확인 중 입니다....)")
-                        self.subscribe_label_chat_log.setText("구독: (확인 중 입니다....)")
-                    else: # 유저 아이디를 검색하지 못함.
-                        self.temp_ban_label_chat_log.setText("임시 제한 수: (확인할 수 없습니다)")
-                        self.ban_label_chat_log.setText("활동 제한 수: (확인할 수 없습니다)")
-                        self.follow_date_label_chat_log.setText("팔로우 날짜: (확인할 수 없습니다)")
-                        self.subscribe_label_chat_log.setText("구독: (확인할 수 없습니다)")
-                if user_id == None and search_type != "채팅 내용":
-                    self.result_box_chat_log.setText("존재하지 않는 유저입니다. 닉네임 또는 아이디를 정확하게 입력하였는지, 로그 파일이 올바른지 확인해주세요.")
-                    self.chat_count_label_chat_log.setText("채팅 수: ")
-                    self.first_chat_date_label_chat_log.setText("첫 채팅을 친 날짜: ")
-                    self.time_elapsed_label_chat_log.setText("첫 채팅을 친 후 경과한 시간: ")
-                    self.temp_ban_label_chat_log.setText("임시 제한 수: ")
-                    self.ban_label_chat_log.setText("활동 제한 수: ")
-                    self.follow_date_label_chat_log.setText("팔로우 날짜: ")
-                    self.subscribe_label_chat_log.setText("구독: ")
-                    self.input_box_chat_log.setEnabled(True)
-                    self.input_num_box_chat_log.setEnabled(True)
-                    self.search_button_chat_log.setEnabled(True)
-                    self.search_chat_all.setEnabled(True)
-                    self.search_chat_partial.setEnabled(True)
-                    self.ignore_space_check.setEnabled(True)
-                    self.search_button_chat_moa.setEnabled(True)
-                    self.search_button_chat_log.show()
-                    self.search_stop_button_chat_log.hide()
-                    return
-            else:
+            if not file_list_log:
                 self.result_box_chat_log.setText("로그 파일이 없습니다.")
                 self.chat_count_label_chat_log.setText("채팅 수: ")
                 self.first_chat_date_label_chat_log.setText("첫 채팅을 친 날짜: ")
@@ -632,114 +675,26 @@ class ChatLogSearchTab(QWidget):
                 self.ban_label_chat_log.setText("활동 제한 수: ")
                 self.follow_date_label_chat_log.setText("팔로우 날짜: ")
                 self.subscribe_label_chat_log.setText("구독: ")
-                self.search_button_chat_log.show()
-                self.search_stop_button_chat_log.hide()
+                self.search_finish_ui(moa)
+                return
 
+            if moa == False or search_type == "채팅 내용":
+                # 로그 파일 검색은 백그라운드 작업으로 실행하고 결과는 묶음 단위로 전달받음
+                self.start_search_worker(log_dir, search_type, search, chatnum, moa, cutoff_time)
+                return
 
-            if moa == False:
-                if search_type == "채팅 내용":
-                     self.result_box_chat_log.setText(f"{self.loading_msg}\n키워드 '{search}' 검색 완료\n검색된 채팅 출력 시작...")
-                     QTimer.singleShot(100, lambda: self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum()))
-                else:
-                    self.result_box_chat_log.setText(f"{self.loading_msg}\n아이디 검색 완료\n{original_nick} ({user_id})의 채팅 내역 검색 시작\n✅'검색 중지' 버튼 클릭 시 검색을 중단합니다.")
-            QApplication.processEvents()
-
-            if file_list_log:
-                file_list_index = 0
-                for file_name in file_list_log:
-                    QApplication.processEvents()
-                    if self.stop_signal == True:
-                        if self.result_chat_done == False:
-                            result.reverse()
-                            result.append(f"이미 검색된 채팅 {len(result)}개만 표시하였습니다.")
-                            self.result_box_chat_log.setText("\n".join(result))
-                            self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum())
-                        return
-                    
-                    if search_type == "채팅 내용": continue # Content search already handled above (inside file loop)
-
-                    with open(file_name, 'r', encoding='utf-8') as f:
-                        data = f.read()
-                        chat_array = data.split("\n")
-                        QApplication.processEvents()
-                        for chat in chat_array[::-1]:
-                            QApplication.processEvents()
-                            try:
-                                if self.stop_signal == True:
-                                    if self.result_chat_done == False:
-                                        result.reverse()
-                                        result.append(f"이미 검색된 채팅 {len(result)}개만 표시하였습니다.")
-                                        self.result_box_chat_log.setText("\n".join(result))
-                                        self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum())
-                                    return
-                                if "<" not in chat: continue
-                                id = ""
-                                nick = ""
-                                id, nick = self.get_id_nick(chat)
-                                if id == user_id:
-                                    if moa == True:
-                                        if len(result) >= 100:
-                                            break
-                                        result.append(chat.replace(f" ({user_id})",""))
-                                        chat_date_str = chat.split(" ")[0].strip("[]") + " " + chat.split(" ")[1].strip("[]")
-                                        chat_date = datetime.strptime(chat_date_str, '%Y-%m-%d %H:%M:%S')
-                                        if first_chat_date is None or chat_date < first_chat_date:
-                                            first_chat_date = chat_date
-                                        QApplication.processEvents()
-                                    elif(self.search_chat_partial.isChecked()):
-                                        if chat_count < chatnum:
-                                            result.append((chat.replace(f" ({user_id})","")))
-                                            self.result_box_chat_log.setText(f"{self.loading_msg}\n아이디 검색 완료\n{original_nick} ({user_id})의 채팅 내역 검색 시작\n검색된 채팅 수: {len(result)}/{chatnum}\n✅'검색 중지' 버튼 클릭 시 검색을 중단하고 현재까지 검색된 채팅로그만 표시됩니다.")
-                                            QApplication.processEvents()
-                                        if chat_count == chatnum:
-                                            result.reverse()
-                                            self.result_box_chat_log.setText("\n".join(result))
-                                            self.result_chat_done = True
-                                            is_hit_limit_search_chat_partial = True
-                                            print("752")
-                                            self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum())
-                                            self.chzzk_user_profile_button.setEnabled(True)
-                                            self.copy_user_id_button.setEnabled(True)
-                                            self.studio_restriction_popup_button.setEnabled(True)
-                                            self.temp_restrict_duration_combo_box.setEnabled(True)
-                                            self.temp_ban_duration_combo_box.setEnabled(True)
-                                            self.temp_ban_button_cm.setEnabled(True)
-                                            self.ban_button_cm.setEnabled(True)
-                                            self.search_button_chat_log.setEnabled(True)
-                                            self.search_button_chat_moa.setEnabled(True)
-                                            self.first_chat_date_label_chat_log.setText(f"첫 채팅을 친 날짜: (확인 중 입니다....)")
-                                            self.time_elapsed_label_chat_log.setText(f"첫 채팅을 친 후 경과한 시간: (확인 중 입니다....)")
-                                            QApplication.processEvents()
-                                        chat_count+=1
-                                        chat_date_str = chat.split(" ")[0].strip("[]") + " " + chat.split(" ")[1].strip("[]")
-                                        chat_date = datetime.strptime(chat_date_str, '%Y-%m-%d %H:%M:%S')
-                                        if first_chat_date is None or chat_date < first_chat_date:
-                                            first_chat_date = chat_date
-                                    elif(self.search_chat_all.isChecked()):
-                                        result.append((chat.replace(f" ({user_id})","")))
-                                        chat_count+=1
-                                        chat_date_str = chat.split(" ")[0].strip("[]") + " " + chat.split(" ")[1].strip("[]")
-                                        chat_date = datetime.strptime(chat_date_str, '%Y-%m-%d %H:%M:%S')
-                                        if first_chat_date is None or chat_date < first_chat_date:
-                                            first_chat_date = chat_date
-                                        if len(result) < 1000 and len(result) % 10 == 0:
-                                            self.result_box_chat_log.setText(f"{self.loading_msg}\n아이디 검색 완료\n{original_nick} ({user_id})의 채팅 내역 검색 시작\n검색된 채팅 수: {len(result)}\n✅'검색 중지' 버튼 클릭 시 검색을 중단하고 현재까지 검색된 채팅로그만 표시됩니다.")
-                                            QApplication.processEvents()
-                                        if len(result) % 1000 == 0:
-                                            if len(result) > 10000:
-                                                self.result_box_chat_log.setText(f"{self.loading_msg}\n아이디 검색 완료\n{original_nick} ({user_id})의 채팅 내역 검색 시작\n검색된 채팅 수: {len(result)}\n❗{self.CHAT_LOG_TOO_MUCH_TEXT}\n검색 완료 후 채팅 내역 출력 시 프로그램이 잠시 멈출 수 있으니 기다려 주세요.\n✅'검색 중지' 버튼 클릭 시 검색을 중단하고 현재까지 검색된 채팅로그만 표시됩니다.")
-                                                QApplication.processEvents()
-                                            else:
-                                                self.result_box_chat_log.setText(f"{self.loading_msg}\n아이디 검색 완료\n{original_nick} ({user_id})의 채팅 내역 검색 시작\n검색된 채팅 수: {len(result)}\n✅'검색 중지' 버튼 클릭 시 검색을 중단하고 현재까지 검색된 채팅로그만 표시됩니다.")
-                                                QApplication.processEvents()
-                            except Exception as e:
-                                continue
-                    file_list_index+=1
-                    if moa == True:
-                        if len(result) >= 100 or file_list_index >= 3 or is_new_moa_chat == False : break
-                        else: continue
-                    elif self.search_chat_all.isChecked() or self.search_chat_partial.isChecked(): continue
-                    else: break
+            # 모아보기는 실시간 채팅 버퍼에서 최근 채팅을 가져옴 (로그 파일을 다시 읽지 않음)
+            user_id, original_nick, moa_chat_array = self.live_user_lines(search, self.ignore_space_check.isChecked(), 100)
+            if user_id == None and self.is_live_seed_pending(search, self.ignore_space_check.isChecked()):
+                self.result_box_chat_log.setText("채팅 로그에서 유저를 찾는 중...")
+                self.search_button_chat_log.show()
+                self.search_stop_button_chat_log.hide()
+                return
+            if user_id == None:
+                self.result_box_chat_log.setText("존재하지 않는 유저입니다. 닉네임 또는 아이디를 정확하게 입력하였는지, 로그 파일이 올바른지 확인해주세요.")
+                self.search_button_chat_log.show()
+                self.search_stop_button_chat_log.hide()
+                return
             if self.main_window.user_id_chzzk_ban != user_id:
                 self.chat_count_label_chat_log.setText("채팅 수:")
                 self.first_chat_date_label_chat_log.setText("첫 채팅을 친 날짜:")
@@ -758,84 +713,24 @@ class ChatLogSearchTab(QWidget):
             self.temp_ban_button_cm.setEnabled(True)
             self.ban_button_cm.setEnabled(True)
             self.search_button_chat_moa.setEnabled(True)
-            if len(result) != 0:
-                if moa == False:
-                    if is_hit_limit_search_chat_partial == False:
-                        result.reverse()
-                        self.result_box_chat_log.setText("\n".join(result))
-                        self.result_chat_done = True
-                    self.input_box_chat_log.setEnabled(True)
-                    self.input_num_box_chat_log.setEnabled(True)
-                    if self.search_button_chat_moa.text() == ("채팅 모아보기"):
-                        self.search_button_chat_log.setEnabled(True)
-                    self.search_chat_all.setEnabled(True)
-                    self.search_chat_partial.setEnabled(True)
-                    self.ignore_space_check.setEnabled(True)
-                if moa == True:
-                    if is_new_moa_chat == True: # 모아보기 중 새로운 채팅
-                        if is_hit_limit_search_chat_partial == False:
-                            result.reverse()
-                            if self.result_box_chat_log.toPlainText().split("\n")[-1] != result[-1]:
-                                self.main_window.user_id_moa_before = self.main_window.user_id_chzzk_ban
-                                self.search_button_chat_moa.setEnabled(True)
-                                self.result_box_chat_log.setText("\n".join(result))
-                                self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum())
-                                if self.moa_chat_read_tts.isChecked():
-                                    try:
-                                        chat = result[-1]
-                                        id, nick = self.get_id_nick(chat)
-                                        chat = chat.split(f"<{nick}> ")[1]
-                                        if "🟥⭐" not in chat:
-                                            if self.main_window.audio_thread and self.main_window.audio_thread.is_alive():
-                                                self.main_window.stop_audio_event.set()
-                                                self.main_window.audio_thread.join()
-                                            self.main_window.stop_audio_event.clear()
-                                            self.main_window.audio_thread = threading.Thread(target=lambda: asyncio.run(self.main_window.play_audio(chat, 1,)))
-                                            self.main_window.audio_thread.start()
-                                    except Exception as e:
-                                        None
-                            if self.chat_count_label_chat_log.text() != "채팅 수: (확인 중 입니다....)" and self.chat_count_label_chat_log.text() != "채팅 수:" :
-                                None
-                            else:
-                                self.chat_count_label_chat_log.setText("채팅 수:")
-                                self.first_chat_date_label_chat_log.setText("첫 채팅을 친 날짜:")
-                                self.time_elapsed_label_chat_log.setText("첫 채팅을 친 후 경과한 시간:")
-                                self.temp_ban_label_chat_log.setText("임시 제한 수:")
-                                self.ban_label_chat_log.setText("활동 제한 수:")
-                                self.follow_date_label_chat_log.setText("팔로우 날짜:")
-                                self.subscribe_label_chat_log.setText("구독:")
-                else:
-                    #if self.chat_count_label_chat_log.text().startswith("채팅 수: 9999+") and chat_count > 9999:
-                    self.chat_count_label_chat_log.setText(f"채팅 수: {chat_count}")
-                    self.first_chat_date_label_chat_log.setText(f"첫 채팅을 친 날짜: {first_chat_date.strftime('%Y-%m-%d %H:%M:%S')}")
-                    time_elapsed = datetime.now() - first_chat_date
-                    days_elapsed = time_elapsed.days
-                    hours_elapsed, remainder = divmod(time_elapsed.seconds, 3600)
-                    minutes_elapsed, seconds_elapsed = divmod(remainder, 60)
-                    self.time_elapsed_label_chat_log.setText(f"첫 채팅을 친 후 경과한 시간: {days_elapsed}일 {hours_elapsed}시간 {minutes_elapsed}분 {seconds_elapsed}초")
-                    QApplication.processEvents()  # 이벤트 루프 처리
-                    if self.search_chat_partial.isChecked():
-                        print("870")
-                        if is_hit_limit_search_chat_partial == False: self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum())
-            elif is_new_moa_chat == False: return
-            else:
-                self.result_box_chat_log.setText("검색 결과가 없습니다.\n닉네임 또는 아이디를 정확하게 입력하였는지, 로그 파일이 올바른지 확인해주세요.")
-                self.chat_count_label_chat_log.setText("채팅 수: ")
-                self.first_chat_date_label_chat_log.setText("첫 채팅을 친 날짜: ")
-                self.time_elapsed_label_chat_log.setText("첫 채팅을 친 후 경과한 시간: ")
-                self.temp_ban_label_chat_log.setText("임시 제한 수: ")
-                self.ban_label_chat_log.setText("활동 제한 수: ")
-                self.follow_date_label_chat_log.setText("팔로우 날짜: ")
-                self.subscribe_label_chat_log.setText("구독: ")
-                self.search_button_chat_moa.setEnabled(True)
-                self.temp_restrict_duration_combo_box.setDisabled(True)
-                self.temp_ban_duration_combo_box.setDisabled(True)
-                self.temp_ban_button_cm.setDisabled(True)
-                self.temp_ban_duration_combo_box.setDisabled(True)
-                self.ban_button_cm.setDisabled(True)
-                self.ignore_space_check.setEnabled(True)
-                self.search_button_chat_log.show()
-                self.search_stop_button_chat_log.hide()
+            result = [chat.replace(f" ({user_id})","") for chat in moa_chat_array]
+            if result and self.result_box_chat_log.toPlainText().split("\n")[-1] != result[-1]: # 모아보기 중 새로운 채팅
+                self.main_window.user_id_moa_before = self.main_window.user_id_chzzk_ban
+                self.result_box_chat_log.setText("\n".join(result))
+                self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum())
+                if self.moa_chat_read_tts.isChecked():
+                    try:
+                        record = parse_line(result[-1])
+                        chat = record.msg
+                        if not record.is_event:
+                            if self.main_window.audio_thread and self.main_window.audio_thread.is_alive():
+                                self.main_window.stop_audio_event.set()
+                                self.main_window.audio_thread.join()
+                            self.main_window.stop_audio_event.clear()
+                            self.main_window.audio_thread = threading.Thread(target=lambda: asyncio.run(self.main_window.play_audio(chat, 1,)))
+                            self.main_window.audio_thread.start()
+                    except Exception as e:
+                        None
             self.search_button_chat_log.show()
             self.search_stop_button_chat_log.hide()
         except Exception as e:
@@ -866,6 +761,166 @@ class ChatLogSearchTab(QWidget):
             self.search_stop_button_chat_log.hide()
 
     
+    def search_finish_ui(self, moa):
+        """검색이 끝난 뒤 입력/버튼을 다시 활성화합니다."""
+        self.search_button_chat_log.show()
+        self.search_stop_button_chat_log.hide()
+        if moa == False:
+            self.input_box_chat_log.setEnabled(True)
+            self.input_num_box_chat_log.setEnabled(True)
+            if self.search_button_chat_moa.text() == "채팅 모아보기":
+                self.search_button_chat_log.setEnabled(True)
+            self.search_chat_all.setEnabled(True)
+            self.search_chat_partial.setEnabled(True)
+            self.ignore_space_check.setEnabled(True)
+            self.search_button_chat_moa.setEnabled(True)
+
+    def start_search_worker(self, log_dir, search_type, search, chatnum, moa, cutoff_time, before=None):
+        if self.search_worker is not None and self.search_worker.isRunning():
+            if moa == True: return # 이전 모아보기 검색이 아직 진행 중
+            self.search_worker.stop()
+            self.search_worker.wait()
+        if search_type == "채팅 내용":
+            limit = 100 if moa == True else chatnum
+        else:
+            limit = chatnum if self.search_chat_partial.isChecked() else None
+        self.search_result = []
+        self.search_moa = moa
+        self.search_type = search_type
+        self.search_user = (None, "")
+        self.search_keyword = search
+        self.search_before = before
+        if moa == False: self.load_more_button.hide()
+        worker = ChatLogSearchWorker(log_dir, search_type, search, self.ignore_space_check.isChecked(), limit, cutoff_time, before)
+        worker.progress.connect(self.on_search_progress)
+        worker.user_found.connect(self.on_search_user_found)
+        worker.batch.connect(self.on_search_batch)
+        worker.finished.connect(self.on_search_finished)
+        worker.error.connect(self.on_search_error)
+        self.search_worker = worker
+        worker.start()
+
+    def load_more_content(self):
+        """채팅 내용 검색의 이전(더 오래된) 결과를 이어서 불러옵니다."""
+        if self.search_next_before is None: return
+        if self.search_worker is not None and self.search_worker.isRunning(): return
+        self.input_box_chat_log.setDisabled(True)
+        self.input_num_box_chat_log.setDisabled(True)
+        self.ignore_space_check.setDisabled(True)
+        self.search_button_chat_log.hide()
+        self.search_stop_button_chat_log.show()
+        self.start_search_worker(self.main_window.file_path_box_chat_log.text(), "채팅 내용", self.search_keyword, int(self.input_num_box_chat_log.text()), False, datetime.now() - timedelta(hours=72), self.search_next_before)
+
+    def on_search_progress(self, current, total, file_name):
+        if self.sender() is not self.search_worker or self.search_moa: return
+        if self.search_type == "채팅 내용":
+            if self.search_before is not None: return
+            self.result_box_chat_log.setText(f"{self.loading_msg}\n로그 파일 확인 중.... ({current}/{total})\n검색된 채팅 수: {len(self.search_result)}\n✅'검색 중지' 버튼 클릭 시 검색을 중단합니다.")
+        elif self.search_user[0] is None:
+            self.result_box_chat_log.setText(f"{self.loading_msg} \n아이디 검색 중.... (로그 색인 {current}/{total})\n✅'검색 중지' 버튼 클릭 시 검색을 중단합니다.")
+
+    def on_search_user_found(self, user_id, nick):
+        if self.sender() is not self.search_worker: return
+        self.search_user = (user_id, nick)
+        self.main_window.user_id_chzzk_ban = user_id
+        self.main_window.user_nick_chzzk_ban = str(nick)
+        self.chat_count_label_chat_log.setText("채팅 수: (확인 중 입니다....)")
+        self.temp_ban_label_chat_log.setText("임시 제한 수: (확인 중 입니다....)")
+        self.ban_label_chat_log.setText("활동 제한 수: (확인 중 입니다....)")
+        self.follow_date_label_chat_log.setText("팔로우 날짜: (확인 중 입니다....)")
+        self.subscribe_label_chat_log.setText("구독: (확인 중 입니다....)")
+        self.result_box_chat_log.setText(f"{self.loading_msg}\n아이디 검색 완료\n{nick} ({user_id})의 채팅 내역 검색 시작\n✅'검색 중지' 버튼 클릭 시 검색을 중단합니다.")
+
+    def on_search_batch(self, lines):
+        if self.sender() is not self.search_worker: return
+        self.search_result.extend(lines)
+        if self.search_moa or self.search_type == "채팅 내용": return
+        user_id, nick = self.search_user
+        if len(self.search_result) > 10000:
+            self.result_box_chat_log.setText(f"{self.loading_msg}\n아이디 검색 완료\n{nick} ({user_id})의 채팅 내역 검색 시작\n검색된 채팅 수: {len(self.search_result)}\n❗{self.main_window.CHAT_LOG_TOO_MUCH_TEXT}\n검색 완료 후 채팅 내역 출력 시 프로그램이 잠시 멈출 수 있으니 기다려 주세요.\n✅'검색 중지' 버튼 클릭 시 검색을 중단하고 현재까지 검색된 채팅로그만 표시됩니다.")
+        else:
+            self.result_box_chat_log.setText(f"{self.loading_msg}\n아이디 검색 완료\n{nick} ({user_id})의 채팅 내역 검색 시작\n검색된 채팅 수: {len(self.search_result)}\n✅'검색 중지' 버튼 클릭 시 검색을 중단하고 현재까지 검색된 채팅로그만 표시됩니다.")
+
+    def on_search_finished(self, info):
+        if self.sender() is not self.search_worker: return
+        moa = self.search_moa
+        result = self.search_result[::-1] # 최근 채팅부터 검색되므로 시간 순으로 되돌림
+        self.result_chat_done = True
+        if self.search_type == "채팅 내용":
+            if self.search_before is not None: # 이전 결과 더 보기 -> 기존 결과 앞에 붙임
+                result = result + self.search_content_lines
+            if info.get("cancelled") and self.search_before is None:
+                self.result_box_chat_log.setText("")
+            elif not result:
+                if moa == False or self.result_box_chat_log.toPlainText() != "검색 결과가 없습니다.":
+                    self.result_box_chat_log.setText("검색 결과가 없습니다.")
+            else:
+                current_lines = self.result_box_chat_log.toPlainText().strip().split('\n')
+                if self.search_before is not None:
+                    self.result_box_chat_log.setText("\n".join(result))
+                elif moa == False or not current_lines or result[-1].strip() != current_lines[-1].strip():
+                    self.result_box_chat_log.setText("\n".join(result))
+                    QTimer.singleShot(100, lambda: self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum()))
+            self.search_content_lines = result
+            self.search_next_before = None if info.get("cancelled") else info.get("next_before")
+            if moa == False and self.search_next_before is not None: self.load_more_button.show()
+            self.search_finish_ui(moa)
+            return
+
+        user_id = info.get("user_id")
+        if info.get("cancelled") and not result:
+            self.result_box_chat_log.setText("")
+            return
+        if user_id == None:
+            self.result_box_chat_log.setText("존재하지 않는 유저입니다. 닉네임 또는 아이디를 정확하게 입력하였는지, 로그 파일이 올바른지 확인해주세요.")
+            self.chat_count_label_chat_log.setText("채팅 수: ")
+            self.first_chat_date_label_chat_log.setText("첫 채팅을 친 날짜: ")
+            self.time_elapsed_label_chat_log.setText("첫 채팅을 친 후 경과한 시간: ")
+            self.temp_ban_label_chat_log.setText("임시 제한 수: ")
+            self.ban_label_chat_log.setText("활동 제한 수: ")
+            self.follow_date_label_chat_log.setText("팔로우 날짜: ")
+            self.subscribe_label_chat_log.setText("구독: ")
+            self.search_finish_ui(moa)
+            return
+
+        self.chzzk_user_profile_button.setEnabled(True)
+        self.copy_user_id_button.setEnabled(True)
+        self.studio_restriction_popup_button.setEnabled(True)
+        self.temp_restrict_duration_combo_box.setEnabled(True)
+        self.temp_ban_duration_combo_box.setEnabled(True)
+        self.temp_ban_button_cm.setEnabled(True)
+        self.ban_button_cm.setEnabled(True)
+        if info.get("cancelled"):
+            result.append(f"이미 검색된 채팅 {len(result)}개만 표시하였습니다.")
+            self.result_box_chat_log.setText("\n".join(result))
+            self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum())
+            return
+        if not result:
+            self.result_box_chat_log.setText("검색 결과가 없습니다.\n닉네임 또는 아이디를 정확하게 입력하였는지, 로그 파일이 올바른지 확인해주세요.")
+            self.chat_count_label_chat_log.setText("채팅 수: ")
+            self.first_chat_date_label_chat_log.setText("첫 채팅을 친 날짜: ")
+            self.time_elapsed_label_chat_log.setText("첫 채팅을 친 후 경과한 시간: ")
+            self.search_finish_ui(moa)
+            return
+        self.result_box_chat_log.setText("\n".join(result))
+        self.chat_count_label_chat_log.setText(f"채팅 수: {info.get('chat_count', len(result))}")
+        first_chat_date = info.get("first_chat_date")
+        if first_chat_date is not None:
+            self.first_chat_date_label_chat_log.setText(f"첫 채팅을 친 날짜: {first_chat_date.strftime('%Y-%m-%d %H:%M:%S')}")
+            time_elapsed = datetime.now() - first_chat_date
+            days_elapsed = time_elapsed.days
+            hours_elapsed, remainder = divmod(time_elapsed.seconds, 3600)
+            minutes_elapsed, seconds_elapsed = divmod(remainder, 60)
+            self.time_elapsed_label_chat_log.setText(f"첫 채팅을 친 후 경과한 시간: {days_elapsed}일 {hours_elapsed}시간 {minutes_elapsed}분 {seconds_elapsed}초")
+        QTimer.singleShot(100, lambda: self.result_box_chat_log.verticalScrollBar().setValue(self.result_box_chat_log.verticalScrollBar().maximum()))
+        self.search_finish_ui(moa)
+
+    def on_search_error(self, error_msg):
+        if self.sender() is not self.search_worker: return
+        print(f"[ChatLogSearch] 검색 오류: {error_msg}")
+        self.result_box_chat_log.setText(f"❗오류 발생!\n{error_msg}")
+        self.search_finish_ui(self.search_moa)
+
     @pyqtSlot(str)
     def search_log_check_moa(self, searchnick):
         try:
@@ -917,72 +972,51 @@ class ChatLogSearchTab(QWidget):
             self.result_vote_temp_donation = []
             result_pick_chat = []
             picked_user_nick = ""
-            file_list = os.listdir(self.main_window.file_path_box_chat_log.text())
-            file_list.sort(reverse=True)
-            file_list_log = [f"{os.path.join(self.main_window.file_path_box_chat_log.text(),file)}" for file in file_list if file.endswith(".log") and "custom" not in file and "-" in file]
             temp_pick_nick = str(self.main_window.picked_user_nick)
             if self.search_button_chat_moa.text() == "채팅 모아보기 정지": self.search_log(True)
             QApplication.processEvents()  # 이벤트 루프 처리
             
-            if file_list_log:
-                for file_name in file_list_log[:3]:
-                    with open(file_name, 'r', encoding='utf-8') as f:
-                        data = f.read()
-                        chat_array = data.split("\n")
-                        index = len(chat_array)
-                        for chat in chat_array[::-1]:
-                            if temp_pick_nick != "" and len(result_pick_chat) < 10:
+            if temp_pick_nick != "":
+                # 당첨자 채팅은 실시간 채팅 버퍼에서 가져옴 (로그 파일을 다시 읽지 않음)
+                id, nick, chat_array = self.live_user_lines(temp_pick_nick, False, 10)
+                if id is not None:
+                    picked_user_nick = nick
+                    result_pick_chat = [chat.replace(f" ({id})","") for chat in chat_array]
+
+            # 당첨자 채팅 출력
+            if temp_pick_nick != "" and temp_pick_nick == self.main_window.picked_user_nick:
+                if len(result_pick_chat) >= 1:
+                    try:
+                        if self.main_window.result_box_chat_pick.toPlainText().split("\n")[-1] != result_pick_chat[-1].replace(f"<{picked_user_nick}>",""):
+                            result_pick_array = []
+                            for ra in result_pick_chat:
+                                result_pick_array.append(ra.replace(f"<{picked_user_nick}>",""))
+                            self.main_window.result_box_chat_pick.setText("\n".join(result_pick_array))
+                            self.main_window.result_box_chat_pick.verticalScrollBar().setValue(self.main_window.result_box_chat_pick.verticalScrollBar().maximum())
+                            if self.main_window.pick_chat_read_tts.isChecked():
                                 try:
-                                    id = ""
-                                    nick = ""
-                                    id, nick = self.get_id_nick(chat)
-                                    msg = chat.split(f"({id})> ")[1]
-                                    if nick == temp_pick_nick:
-                                        try:
-                                            picked_user_nick = nick
-                                            result_pick_chat.append(chat.replace(f" ({id})",""))
-                                            QApplication.processEvents()
-                                        except Exception as e:
-                                            None
+                                    chat = result_pick_chat[-1].split(f"<{picked_user_nick}> ")[1]
+                                    if "🟥⭐" not in chat:
+                                        if self.main_window.audio_thread and self.main_window.audio_thread.is_alive():
+                                            self.main_window.stop_audio_event.set()
+                                            self.main_window.audio_thread.join()
+                                        self.main_window.stop_audio_event.clear()
+                                        print(self.main_window.is_pick_clicked)
+                                        if self.main_window.is_pick_clicked:
+                                            self.main_window.is_pick_clicked = False
+                                            self.main_window.audio_thread = threading.Thread(target=lambda: asyncio.run(self.main_window.play_audio(picked_user_nick + " 당첨!  " + chat, 0,)))
+                                        else:
+                                            self.main_window.audio_thread = threading.Thread(target=lambda: asyncio.run(self.main_window.play_audio(chat, 0,)))
+                                        self.main_window.audio_thread.start()
                                 except Exception as e:
+                                    print(e)
                                     None
-                
-                result_pick_chat.reverse()
-
-                # 당첨자 채팅 출력
-                if temp_pick_nick != "" and temp_pick_nick == self.main_window.picked_user_nick:
-                    if len(result_pick_chat) >= 1:
-                        try:
-                            if self.main_window.result_box_chat_pick.toPlainText().split("\n")[-1] != result_pick_chat[-1].replace(f"<{picked_user_nick}>",""):
-                                result_pick_array = []
-                                for ra in result_pick_chat:
-                                    result_pick_array.append(ra.replace(f"<{picked_user_nick}>",""))
-                                self.main_window.result_box_chat_pick.setText("\n".join(result_pick_array))
-                                self.main_window.result_box_chat_pick.verticalScrollBar().setValue(self.main_window.result_box_chat_pick.verticalScrollBar().maximum())
-                                if self.main_window.pick_chat_read_tts.isChecked():
-                                    try:
-                                        chat = result_pick_chat[-1].split(f"<{picked_user_nick}> ")[1]
-                                        if "🟥⭐" not in chat:
-                                            if self.main_window.audio_thread and self.main_window.audio_thread.is_alive():
-                                                self.main_window.stop_audio_event.set()
-                                                self.main_window.audio_thread.join()
-                                            self.main_window.stop_audio_event.clear()
-                                            print(self.main_window.is_pick_clicked)
-                                            if self.main_window.is_pick_clicked:
-                                                self.main_window.is_pick_clicked = False
-                                                self.main_window.audio_thread = threading.Thread(target=lambda: asyncio.run(self.main_window.play_audio(picked_user_nick + " 당첨!  " + chat, 0,)))
-                                            else:
-                                                self.main_window.audio_thread = threading.Thread(target=lambda: asyncio.run(self.main_window.play_audio(chat, 0,)))
-                                            self.main_window.audio_thread.start()
-                                    except Exception as e:
-                                        print(e)
-                                        None
-                                QApplication.processEvents()
-                        except Exception as e:
-                            print(e)
-                            None
-                    else:
-                        self.main_window.result_box_chat_pick.setText("이 유저의 채팅이 없습니다.")
+                            QApplication.processEvents()
+                    except Exception as e:
+                        print(e)
+                        None
+                else:
+                    self.main_window.result_box_chat_pick.setText("이 유저의 채팅이 없습니다.")
         except Exception as e:
             exc_type, exc_obj, exc_tb = sys.exc_info()
             fname = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
@@ -4,7 +4,7 @@ from PyQt6.QtGui import QFont, QIcon
 from PyQt6.QtCore import pyqtSlot, QUrl, QTimer
 from app.constants import GLOBALFONTSIZE
 from app.resources import resource_path
-from app.ui_widgets import CustomWebEnginePage, TestPopup
+from app.ui_widgets import CustomWebEnginePage, TestPopup, ChatView, CHAT_VIEW_MAX_LINES
 from app.ui_chat_counter import ChatCounterWindow
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile, QWebEnginePage
@@ -71,8 +71,7 @@ class ChatroomTab(QWidget):
         self.result_box_chat_temp.hide()
         self.chatroom_signal = QTextEdit(self)
         self.chatroom_signal.hide()
-        self.result_box_chat = QTextEdit(self)
-        self.result_box_chat.setReadOnly(True)
+        self.result_box_chat = ChatView(main_window.settings.value('chat_view_max_lines', CHAT_VIEW_MAX_LINES, type=int), self)
         self.result_box_chat.setFont(QFont('Pretendard JP', GLOBALFONTSIZE-1))
         self.result_box_chat.setText(f"채팅창 접속 버튼을 누르면 API 인증 및 채팅창 접속을 시작합니다.\n설정 탭에서 프로그램 시작 시 자동 접속하도록 설정하실 수 있습니다.")
         self.chatroom_layout.addWidget(self.result_box_chat, 1)
@@ -172,7 +171,7 @@ class ChatroomTab(QWidget):
 
     def run_test_popup(self):
         self.test_popup = TestPopup()
-        self.test_popup.simulator.test_message.connect(self.main_window.message)
+        self.test_popup.simulator.test_message.connect(self.main_window.message_batcher.push)
         self.test_popup.show()
 
     def run_test_overlay(self):
@@ -718,18 +717,12 @@ class ChatroomTab(QWidget):
     
     @pyqtSlot(str)
     def append_result_chat(self, text):
-        list = self.result_box_chat.toPlainText().split("\n")
-        chat_result = ""
-        idx = 0
-        for i in list:
-            idx += 1
-            if len(list) >= 50 and idx == 1: continue
-            chat_result += (i + "\n")
-        chat_result += text
-        self.result_box_chat.setText(chat_result)
-        self.result_box_chat.verticalScrollBar().setValue(self.result_box_chat.verticalScrollBar().maximum())
+        self.append_result_chats([text])
+
+    def append_result_chats(self, texts):
+        """채팅창 결과에 여러 줄을 한 번에 추가 (최근 chat_view_max_lines 줄 유지, 스크롤을 올려두면 화면 멈춤)"""
+        self.result_box_chat.append_lines(texts)
 
     @pyqtSlot(str)
     def set_text_result_chat(self, text):
-        self.result_box_chat.setText(text)
-        self.result_box_chat.verticalScrollBar().setValue(self.result_box_chat.verticalScrollBar().maximum())
\ No newline at end of file
+        self.result_box_chat.setText(text)
\ No newline at end of file
@@ -1,4 +1,5 @@
 import sys
+import math
 import random
 import os
 import traceback
@@ -6,7 +7,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QFrame, QCheckBox, 
                              QSpinBox, QMessageBox, QTextEdit, QApplication, QSlider, QSizePolicy)
 from PyQt6.QtGui import QFont, QIcon
-from PyQt6.QtCore import Qt, QTimer, QSize
+from PyQt6.QtCore import Qt, QSize
 from datetime import datetime
 
 from app.constants import GLOBALFONTSIZE
@@ -22,7 +23,7 @@ class PickTab(QWidget):
         self.pick_list = []
         self.picked_users_set = set()
         self.pick_option_time_cnt = 0
-        self.subscriber_list = []
+        self.subscriber_list = set()
         self.is_subscriber_list_loaded = False
         
         layout = QVBoxLayout()
@@ -173,7 +174,7 @@ class PickTab(QWidget):
             self.main_window.chatroom_connector_instance.subscribers_fetched.connect(self.on_subscribers_fetched)
 
     def on_subscribers_fetched(self, data):
-        self.subscriber_list = data
+        self.subscriber_list = set(data) # 닉네임 집합 (O(1) 확인)
         self.is_subscriber_list_loaded = True
 
 
@@ -225,7 +226,7 @@ class PickTab(QWidget):
         self.result_button_chat_pick.hide()
         self.main_window.picked_user_nick = ""
         self.pick_list.clear()
-        self.subscriber_list = []
+        self.subscriber_list = set()
         self.is_subscriber_list_loaded = False
         self.result_count_p.setText("0명")
         self.result_button_pick.setText("추첨하기")
@@ -272,7 +273,7 @@ class PickTab(QWidget):
             self.result_count_p.setText("0명")
             QApplication.processEvents()
             
-            self.subscriber_list = []
+            self.subscriber_list = set()
             self.is_subscriber_list_loaded = False
             if self.main_window.chatroom_connector_instance:
                 self.main_window.chatroom_connector_instance.request_all_subscribers()
@@ -319,8 +320,7 @@ class PickTab(QWidget):
                      self.result_box_pick.setText("❗ 구독자 목록이 아직 로드되지 않았습니다. 잠시 후 다시 시도해주세요.")
                      return
                 
-                sub_set = set(self.subscriber_list)
-                candidates = [user for user in candidates if user in sub_set]
+                candidates = [user for user in candidates if user in self.subscriber_list]
                 
                 if len(candidates) == 0:
                      self.result_box_pick.setText("참여자 중 구독자가 없습니다.")
@@ -399,16 +399,12 @@ class PickTab(QWidget):
 
     ##### 타이머 함수 (이 탭 전용) #####
     def start_timer_pick(self):
+        self.pick_deadline = self.main_window.scheduler.now() + self.pick_option_time_cnt # 남은 시간은 마감 시각 기준으로 계산
         self.stop_timer_pick()
-        self.timer_pick_refresh = QTimer(self)
-        self.timer_pick_refresh.timeout.connect(self.pick_refresh)
-        self.timer_pick_refresh.start(1000)
+        self.main_window.scheduler.add_job("pick_refresh", self.pick_refresh, 1.0)
     
     def stop_timer_pick(self):
-        if hasattr(self, 'timer_pick_refresh'):
-            self.timer_pick_refresh.stop()
-            if hasattr(self, 'timer_pick_refresh'): # stop() 이후에도 객체가 남아있을 수 있음
-                del self.timer_pick_refresh
+        self.main_window.scheduler.remove_job("pick_refresh")
         self.pick_refresh() # 중지 시 마지막 갱신
 
     def pick_refresh(self):
@@ -416,8 +412,8 @@ class PickTab(QWidget):
         if self.toggle_button_pick.text() == "모집 종료":
             self.result_count_p.setText(f"{len(self.pick_list)}명")
             self.result_box_list_pick.setText((" , ".join(self.pick_list)))
-            if self.pick_option_check1.isChecked():
-                self.pick_option_time_cnt -= 1
+            if self.pick_option_check1.isChecked() and getattr(self, 'pick_deadline', None) is not None:
+                self.pick_option_time_cnt = max(0, math.ceil(self.pick_deadline - self.main_window.scheduler.now()))
                 self.pick_timer_box.setText(f"남은 시간: {int(self.pick_option_time_cnt/60)}분 {int(self.pick_option_time_cnt%60)}초")
                 if self.pick_option_time_cnt <= 0:
                     self.pick_timer_box.hide()
@@ -432,16 +428,19 @@ class PickTab(QWidget):
     ##### 메인 윈도우에서 호출할 함수 #####
     def process_pick_message(self, msg_dict):
         """메인 윈도우의 message 핸들러가 호출 (추첨 관련 메시지 처리)"""
+        self.process_pick_messages([msg_dict])
+
+    def process_pick_messages(self, msg_dicts):
+        """메시지 묶음(MessageBatcher)에서 추첨 참가자를 모읍니다."""
         
         # 추첨 모집 중이 아니면 아무것도 안 함
         if self.toggle_button_pick.text() != "모집 종료":
             return
 
-        nick = msg_dict.get('nick', '')
-        donation_type = msg_dict.get('donation_type', '')
-
         try:
-            if donation_type == "채팅":
+            for msg_dict in msg_dicts:
+                if msg_dict.get('donation_type', '') != "채팅": continue
+                nick = msg_dict.get('nick', '')
                 if nick != "익명의 후원자" and nick not in self.pick_list:
                     self.pick_list.append(nick)
                     # (UI 갱신은 pick_refresh 타이머가 하도록 둠)
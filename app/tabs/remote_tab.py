@@ -1,14 +1,12 @@
 import os
 import webbrowser
 import pyautogui
-import requests
 import re
 import traceback
 import sys
 import asyncio
 import threading
 from PIL import Image, ImageFont, ImageDraw
-from io import BytesIO
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QLineEdit, QLabel, QFrame, QSizePolicy, QTextEdit, QDialog, QApplication, QListWidgetItem, QSlider)
 from PyQt6.QtGui import QFont, QIcon, QBrush, QColor
@@ -21,6 +19,8 @@ from app.resources import resource_path
 from app.ui_widgets import QToggle, CustomWebEnginePage, QListWidgetDonationImg, LabelButtonWidget
 from app.ui_dialogs import ChzzkRemotePopupWindow, RemoteBanDialog, ShowTotalMoneyDialog
 from app.ui_preview import OverlayPreviewWindow
+from app.services import web_server
+from app.services.video_meta_service import get_video_meta_service
 from datetime import datetime
 
 class RemoteTab(QWidget):
@@ -690,72 +690,19 @@ class RemoteTab(QWidget):
     
     ### 영도 쇼츠 확대 관련 함수 #####
     def get_chzzk_video_type(self, thumbnail):
-        # 치지직 클립 썸네일의 크기를 확인하여 영상 타입을 결정
-        try:
-            # 이미지 다운로드
-            response = requests.get(thumbnail)
-            response.raise_for_status()  # 요청 실패 시 예외 발생
-            
-            # 이미지를 PIL Image 객체로 변환
-            img = Image.open(BytesIO(response.content))
-            
-            # 이미지 크기 출력 (width, height)
-            width, height = img.size
-            if width == 720 and height == 1280:
-                return "shorts"
-            elif width < height:
-                return "shorts"
-            else:
-                return "normal" 
-        except requests.exceptions.RequestException as e:
-            return "normal"
-        except Exception as e:
-            return "normal"
+        # 치지직 클립 썸네일의 크기(이미지 헤더만 읽음)로 영상 타입을 결정 (결과 캐시)
+        return get_video_meta_service().thumbnail_type(thumbnail)
     
     def get_youtube_video_type(self, videoId):
-        try:
-            if 'clip-donation' in videoId:
-                return 'normal'
-            # API 요청 URL 구성
-            url = "https://www.googleapis.com/youtube/v3/videos"
-            params = {
-                "part": "player",
-                "id": videoId,
-                "maxHeight": 720,
-                "maxWidth": 1280,
-                "key": self.main_window.settings_tab.youtube_api_key.text().strip()
-            }
+        # YouTube Data API 의 embed 크기로 영상 타입을 결정 (결과 캐시, GUI 에서는 video_meta_service 의 *_async 사용)
+        return get_video_meta_service().youtube_type(videoId, self.youtube_api_key())
 
-            # 요청 보내기
-            response = requests.get(url, params=params)
-            data = response.json()
-            player_info = data["items"][0]["player"]
-            embed_height = player_info.get("embedHeight")
-            embed_width = player_info.get("embedWidth")
-            if int(embed_height) == 720:
-                if int(embed_width) <= 450:
-                    return "shorts"
-                else:
-                    return "normal"
-            elif int(embed_width) <= int(embed_height):
-                return "shorts"
-            else:
-                return "normal"
-        except (KeyError, IndexError):
-            return "normal"
+    def youtube_api_key(self):
+        return self.main_window.settings_tab.youtube_api_key.text().strip()
     
     ### 텍스트 오버레이 관련 함수 ###
     def send_overlay_text(self, text):
-        url = "http://127.0.0.1:5000/update_text"  # Flask 서버의 엔드포인트 URL
-        data = {"text": text}  # 서버에 보낼 데이터
-        try:
-            response = requests.post(url, json=data)  # POST 요청 보내기
-            if response.status_code == 200:
-                None
-            else:
-                None
-        except Exception as e:
-            None
+        web_server.publish_text(text) # Socket.IO 로 바로 전달 (큐에 넣고 즉시 반환)
     
 
     
@@ -816,13 +763,7 @@ class RemoteTab(QWidget):
     def send_image_path(self, image_path, back_image_path):
         try:
             back_image_path = back_image_path.replace("\\","/")
-            url = "http://127.0.0.1:5000/update_image"  # Flask 서버의 엔드포인트 URL
-            data = {"image_path": image_path, "back_image_path": back_image_path}  # 서버에 보낼 데이터
-            response = requests.post(url, json=data)  # POST 요청 보내기
-            if response.status_code == 200:
-                None
-            else:
-                None
+            web_server.publish_image(image_path, back_image_path)
         except Exception as e:
             None
 
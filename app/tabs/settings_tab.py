@@ -426,6 +426,10 @@ class SettingsTab(QWidget):
         self.devmode_toggle.clicked.connect(self.toggle_devmode)
         etc_layout.addWidget(self.devmode_toggle)
 
+        self.scheduler_report_button = QPushButton("주기 작업 현황")
+        self.scheduler_report_button.clicked.connect(self.show_scheduler_report)
+        etc_layout.addWidget(self.scheduler_report_button)
+
         button_layout = QHBoxLayout()
         self.login_reset_button = QPushButton("로그인 초기화")
         self.login_reset_button.clicked.connect(self.main_window.login_reset)
@@ -853,6 +857,9 @@ class SettingsTab(QWidget):
     def toggle_devmode(self):
         self.main_window.toggle_devmode()
 
+    def show_scheduler_report(self):
+        QMessageBox.information(self, '주기 작업 현황', self.main_window.scheduler.report() or '등록된 주기 작업이 없습니다.')
+
     def extra_donation_settings_func(self):
         self.main_window.extra_donation_settings_func()
     
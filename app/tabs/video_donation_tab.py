@@ -9,12 +9,13 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QCheckBox, 
                              QSpinBox, QMessageBox, QApplication, QTextEdit, QSlider)
 from PyQt6.QtGui import QFont, QIcon
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 
 from app.constants import GLOBALFONTSIZE
 from app.ui_widgets import QToggle
 from app.resources import resource_path
 from app.services import web_server
+from app.services.video_meta_service import get_video_meta_service
 from datetime import datetime
 from playsound import playsound
 from app.ui_widgets import QToggle
@@ -26,11 +27,15 @@ from datetime import datetime
 from playsound import playsound
 
 class VideoDonationTab(QWidget):
+    video_type_detected = pyqtSignal(str, str) # video_id, "shorts"/"normal" (작업 스레드 -> GUI)
+
     def __init__(self, main_window, parent=None):
         super().__init__(parent)
         
         self.main_window = main_window
         self.overlay = None  # 오버레이 인스턴스 저장용 변수
+        self.current_video_id = None
+        self.video_type_detected.connect(self.apply_video_type)
 
         layout = QVBoxLayout()
         
@@ -456,19 +461,10 @@ class VideoDonationTab(QWidget):
                 print("[Overlay] Not a YouTube video, skipping YouTube-specific orientation logic.")
                 return
 
-            if hasattr(self.main_window, 'remote_tab'):
-                remote_tab = self.main_window.remote_tab
-                if hasattr(remote_tab, 'get_youtube_video_type'):
-                    video_type = remote_tab.get_youtube_video_type(video_id)
-                    print(f"[Overlay] Detected Video Type: {video_type}")
-                    if video_type == "shorts":
-                        if not self.overlay.is_portrait:
-                            print("[Overlay] Switching to Portrait Mode (Auto)")
-                            self.overlay.set_orientation(True)
-                    elif video_type == "normal":
-                        if self.overlay.is_portrait:
-                            print("[Overlay] Switching to Landscape Mode (Auto)")
-                            self.overlay.set_orientation(False)
+            # 영상 타입 확인은 작업 스레드에서 (캐시된 영상은 바로 적용)
+            self.current_video_id = video_id
+            api_key = self.main_window.settings_tab.youtube_api_key.text().strip()
+            get_video_meta_service().youtube_type_async(video_id, api_key, lambda video_type: self.video_type_detected.emit(video_id, video_type))
         except Exception as e:
             print(f"[Overlay] Auto-Orientation Error: {e}")
             try:
@@ -478,6 +474,22 @@ class VideoDonationTab(QWidget):
             except Exception as e:
                 print(f"[Overlay] Auto-Orientation Error: {e}")
     
+    def apply_video_type(self, video_id, video_type):
+        """video_meta_service 가 확인한 영상 타입에 맞춰 방향 전환 (GUI 스레드)"""
+        if video_id != self.current_video_id or self.overlay is None: return # 그 사이 다음 영상이 시작됨
+        print(f"[Overlay] Detected Video Type: {video_type}")
+        try:
+            if video_type == "shorts":
+                if not self.overlay.is_portrait:
+                    print("[Overlay] Switching to Portrait Mode (Auto)")
+                    self.overlay.set_orientation(True)
+            elif video_type == "normal":
+                if self.overlay.is_portrait:
+                    print("[Overlay] Switching to Landscape Mode (Auto)")
+                    self.overlay.set_orientation(False)
+        except Exception as e:
+            print(f"[Overlay] Auto-Orientation Error: {e}")
+
     def on_resolution_detected(self, res_type: str):
         """JS에서 감지된 해상도 타입(portrait/landscape)에 따라 회전"""
         print(f"[Overlay] Resolution Detected: {res_type}")
@@ -511,25 +523,20 @@ class VideoDonationTab(QWidget):
     ##### 타이머 함수 (이 탭 전용) #####
     def start_timer_video(self):
         self.stop_timer_video()
-        self.timer_video_refresh = QTimer(self)
-        self.timer_video_refresh.timeout.connect(self.video_refresh)
-        self.timer_video_refresh.start(1000)
+        # 라벨에 표시된 시간(저장된 데이터 복원 포함)부터 이어서 셈
+        match = re.search(r'(\d+)시간 (\d+)분 (\d+)초', self.len_count_label_video_open_timer.text())
+        self.video_open_base = int(match.group(1)) * 3600 + int(match.group(2)) * 60 + int(match.group(3)) if match else None
+        self.video_open_started = self.main_window.scheduler.now()
+        self.main_window.scheduler.add_job("video_refresh", self.video_refresh, 1.0)
 
     def stop_timer_video(self):
-        if hasattr(self, 'timer_video_refresh'):
-            self.timer_video_refresh.stop()
-            del self.timer_video_refresh
+        self.main_window.scheduler.remove_job("video_refresh")
 
     def video_refresh(self):
         try:
-            current_text = self.len_count_label_video_open_timer.text().replace("영도 올린 시간: ", "")
-            match = re.search(r'(\d+)시간 (\d+)분 (\d+)초', current_text)
-            if not match:
+            if getattr(self, 'video_open_base', None) is None:
                 return
-            hours = int(match.group(1))
-            minutes = int(match.group(2))
-            seconds = int(match.group(3))
-            total_seconds = hours * 3600 + minutes * 60 + seconds + 1
+            total_seconds = self.video_open_base + int(self.main_window.scheduler.now() - self.video_open_started)
             new_hours = total_seconds // 3600
             new_minutes = (total_seconds % 3600) // 60
             new_seconds = total_seconds % 60
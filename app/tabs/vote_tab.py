@@ -1,5 +1,6 @@
 import sys
 import os
+import math
 import traceback
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QLineEdit, QLabel, QFrame, QCheckBox, 
@@ -7,7 +8,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QTableWidgetItem, QAbstractItemView, QScrollArea, QSizePolicy, QTextEdit,
                              QComboBox, QHeaderView)
 from PyQt6.QtGui import QFont
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from collections import OrderedDict
 from datetime import datetime
 
@@ -593,31 +594,47 @@ class VoteTab(QWidget):
 
     ##### 타이머 함수 (이 탭 전용) #####
     def start_timer_vote(self):
+        self.vote_deadline = self.main_window.scheduler.now() + self.vote_option_time_cnt # 남은 시간은 마감 시각 기준으로 계산
         self.stop_timer_vote()
-        self.timer_vote_refresh = QTimer(self)
-        self.timer_vote_refresh.timeout.connect(self.vote_refresh)
-        self.timer_vote_refresh.start(1000)
+        self.main_window.scheduler.add_job("vote_refresh", self.vote_refresh, 1.0)
     
     def stop_timer_vote(self):
-        if hasattr(self, 'timer_vote_refresh'):
-            self.timer_vote_refresh.stop()
-            if hasattr(self, 'timer_vote_refresh'):
-                del self.timer_vote_refresh
+        self.main_window.scheduler.remove_job("vote_refresh")
         self.vote_refresh()
 
     def vote_refresh(self):
         if self.toggle_button_vote.text() == self.main_window.VOTE_STOP_BUTTON_TEXT:
-            if self.vote_option_check1.isChecked():
-                self.vote_option_time_cnt -= 1
+            if self.vote_option_check1.isChecked() and getattr(self, 'vote_deadline', None) is not None:
+                self.vote_option_time_cnt = max(0, math.ceil(self.vote_deadline - self.main_window.scheduler.now()))
                 self.vote_timer_box.setText(f"남은 시간: {int(self.vote_option_time_cnt/60)}분 {int(self.vote_option_time_cnt%60)}초")
                 if self.vote_option_time_cnt <= 0:
                     self.toggle_button_vote.click()
 
     def process_vote_message(self, msg_dict):
         """메인 윈도우의 message 핸들러가 호출 (투표 관련 메시지 처리)"""
-        if self.toggle_button_vote.text() != self.main_window.VOTE_STOP_BUTTON_TEXT:
-            return
+        self.process_vote_messages([msg_dict])
+
+    def process_vote_messages(self, msg_dicts):
+        """메시지 묶음(MessageBatcher)을 처리하고 투표 현황 UI는 묶음당 한 번만 갱신"""
+        changed = False
+        for msg_dict in msg_dicts:
+            if self.toggle_button_vote.text() != self.main_window.VOTE_STOP_BUTTON_TEXT:
+                break
+            changed = self.apply_vote_message(msg_dict) or changed
+
+            # 인원 제한 체크
+            try:
+                if self.vote_option_check2.isChecked() and self.vote_people_count() >= self.vote_option_count.value():
+                    if changed: self.vote_count()
+                    changed = False
+                    self.toggle_button_vote.click() # 인원 도달 시 투표 자동 마감
+            except Exception as e:
+                print(f"Error processing vote message: {e}")
+        if changed:
+            self.vote_count() # UI 갱신
 
+    def apply_vote_message(self, msg_dict):
+        """메시지 하나를 투표 결과에 반영. 투표 현황 UI 갱신이 필요하면 True"""
         nick = msg_dict.get('nick', '')
         msg = msg_dict.get('msg', '')
         donation_type = msg_dict.get('donation_type', '')
@@ -626,7 +643,7 @@ class VoteTab(QWidget):
         try:
             if donation_type == "채팅" and self.chat_vote_check.isChecked() and msg.startswith("!투표"):
                 vote_num_str = msg.replace("!투표", "").strip()
-                if not vote_num_str: return
+                if not vote_num_str: return False
                 vote_num = int(vote_num_str)
                 vote_num_str = str(vote_num)
                 
@@ -635,12 +652,12 @@ class VoteTab(QWidget):
                         # 복수 투표: 인당 항목 수 제한 적용
                         # 1. 이미 해당 항목에 투표했는지 확인 (항목당 1회만)
                         if nick in self.result_vote[vote_num_str]:
-                            return  # 이미 이 항목에 투표함
+                            return False  # 이미 이 항목에 투표함
                         
                         # 2. 투표한 항목 수 확인
                         voted_items_count = sum(1 for voters in self.result_vote.values() if nick in voters)
                         if voted_items_count >= self.chat_vote_limit.value():
-                            return  # 이미 제한 개수만큼 투표함
+                            return False  # 이미 제한 개수만큼 투표함
                         
                         self.result_vote[vote_num_str].append(nick)
                     else: # 복수 투표 불허
@@ -649,15 +666,15 @@ class VoteTab(QWidget):
                                 voters.remove(nick)
                                 break
                         self.result_vote[vote_num_str].append(nick)
-                    self.vote_count() # UI 갱신
+                    return True
 
             elif donation_type == '치즈' and self.donation_vote_check.isChecked() and msg.startswith("!투표"):
                 vote_num_str = msg.replace("!투표", "").strip()
-                if not vote_num_str: return
+                if not vote_num_str: return False
                 vote_num = int(vote_num_str)
                 vote_num_str = str(vote_num)
                 
-                if vote_num_str not in self.vote_num_list: return
+                if vote_num_str not in self.vote_num_list: return False
                     
                 if self.donation_vote_multiple.isChecked():
                     vote_quantity = int(int(cheese) / self.donation_vote_number.value())
@@ -673,15 +690,10 @@ class VoteTab(QWidget):
                                 break
                         if not has_voted:
                             self.result_vote_donation[vote_num_str].append(nick)
-                self.vote_count() # UI 갱신
-
-            # 인원 제한 체크
-            if self.vote_option_check2.isChecked():
-                total_votes = self.vote_people_count()
-                if total_votes >= self.vote_option_count.value():
-                    self.toggle_button_vote.click() # 인원 도달 시 투표 자동 마감
+                return True
 
         except (ValueError, IndexError):
-            return
+            return False
         except Exception as e:
-            print(f"Error processing vote message: {e}")
\ No newline at end of file
+            print(f"Error processing vote message: {e}")
+        return False
\ No newline at end of file
@@ -4,265 +4,255 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QFileDialog, 
     QProgressBar, QLabel, QTableWidget, QTableWidgetItem, QFormLayout, 
     QMessageBox, QHeaderView, QSpinBox, QDialog, QAbstractItemView, QDateEdit, QMainWindow,
-    QSizePolicy, QGroupBox, QRadioButton, QComboBox, QButtonGroup, QCompleter
+    QSizePolicy, QGroupBox, QRadioButton, QComboBox, QButtonGroup, QCompleter, QCheckBox, QTableView, QDoubleSpinBox
 )
+import re
 import json
+from itertools import islice
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from app.constants import USERPATH
 import sys
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer, QDate, QSize, QUrl
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer, QDate, QSize, QUrl, QSettings, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QIcon, QColor, QBrush, QFont, QPixmap
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from app.resources import resource_path
+from app.services.chat_stats_cache import iter_day_stats, day_log_files, ChatStatsTotals
+from app.services.chat_log_catalog import get_chat_log_catalog
+from app.services.chat_timeline import analyze_day, SPIKE_MIN_SCORE, SPIKE_MIN_MESSAGES, SPIKE_WINDOW_SECONDS
+from app.utils.chat_log_parser import to_datetime
 
-def getIDNick(chat):
-    """채팅 로그에서 ID와 닉네임을 추출합니다."""
-    id_val, nick_val = "", ""
-    try:
-        if ")> " in chat:
-            id_start = chat.index(" (") + 2
-            id_end = chat.index(")> ")
-            id_val = chat[id_start:id_end]
-            nick_start = chat.index("] <") + 3
-            nick_end = chat.index(" (")
-            nick_val = chat[nick_start:nick_end]
-        else:
-            id_start = chat.index("] <") + 3
-            id_end = chat.index("> ")
-            id_val = chat[id_start:id_end]
-            nick_val = id_val
-    except ValueError:
-        return "", ""
-    return id_val, nick_val
-
-class LogAnalyzerWorker(QThread):
+TOP_K_CAPACITY_FACTOR = 10 # 메모리 절약 모드 카운터 수 = 상위 표시 개수 x 10
+TOP_K_MIN_CAPACITY = 10000
+
+class ChatStatsWorker(QThread):
+    """기간 내 로그를 한 번만 읽어 ChatStatsTotals 로 합치는 통합 분석 작업
+    (가장 많은 채팅 / 특정 단어 횟수 / 유저 순위 결과를 모두 만들 수 있음)"""
     progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
-    def __init__(self, log_dir, start_date, end_date):
+    def __init__(self, log_dir, start_date, end_date, parallel=True, top_k=None):
         super().__init__()
         self.log_dir = log_dir
         self.start_date = start_date
         self.end_date = end_date
+        self.parallel = parallel
+        self.top_k = top_k # 메모리 절약 모드: 메시지 빈도를 상위 top_k 개 카운터로 근사
         self.is_running = True
 
     def run(self):
         try:
-            result = {}
-            elapsecondS = 0
-            
-            all_files = os.listdir(self.log_dir)
-            
-            filtered_files = []
-            for f_name in all_files:
-                if f_name.endswith(".log") and "custom" not in f_name and "-" in f_name:
-                    try:
-                        date_str = f_name[:10]
-                        file_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        if self.start_date <= file_date <= self.end_date:
-                            filtered_files.append(f_name)
-                    except (ValueError, IndexError):
-                        continue
-            
-            filtered_files.sort(reverse=True)
-            
+            filtered_files = day_log_files(self.log_dir, self.start_date, self.end_date)
             total_files = len(filtered_files)
             if total_files == 0:
                 self.error.emit("선택한 기간에 해당하는 분석할 .log 파일이 없습니다.")
                 return
 
-            for i, file_name in enumerate(filtered_files):
-                if not self.is_running:
-                    break
-                
+            totals = ChatStatsTotals(self.log_dir, self.top_k)
+            # 바뀌지 않은 날짜는 저장된 일별 집계 사용, 나머지는 프로세스 풀에서 집계 (chat_stats_cache)
+            day_stats_iter = iter_day_stats(self.log_dir, filtered_files, lambda: not self.is_running, self.parallel)
+            for i, (file_name, day_stats) in enumerate(day_stats_iter): # 오래된 날짜부터 순서대로 합침
                 self.progress.emit(i + 1, total_files, file_name)
-                
-                file_path = os.path.join(self.log_dir, file_name)
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-
-                prev_chat_date = None
-
-                for line in lines:
-                    try:
-                        chat_date_str = line.split("]")[0].split("[")[1]
-                        chat_date = datetime.strptime(chat_date_str, '%Y-%m-%d %H:%M:%S')
-
-                        # [NEW] 30분(1800초) 이상 공백 시 세션 분리 (방송 꺼짐 처리)
-                        if prev_chat_date:
-                            diff = (chat_date - prev_chat_date).total_seconds()
-                            if 0 <= diff <= 1800:
-                                elapsecondS += diff
-                        
-                        prev_chat_date = chat_date
-                        
-                        if "<" not in line: continue
-                        id_val, nick = getIDNick(line)
-                        if not id_val: continue
-
-                        if f"{id_val})> " in line:
-                            msg = line.split(f"{id_val})> ")[1].strip()
-                        elif f"{id_val}> " in line:
-                            msg = line.split(f"{id_val}> ")[1].strip()
-                        else:
-                            continue
-                        msgg = msg.replace(" ", "")
-                        if "🟥⭐" in msgg or "Cheer" in msgg: continue
-                        if msgg:
-                            result[msgg] = result.get(msgg, 0) + 1
-                    except (IndexError, ValueError):
-                        continue
-                
+                totals.add(day_stats, file_name)
 
-
-            if not self.is_running:
-                return
-
-            sorted_result = dict(sorted(result.items(), key=lambda item: item[1], reverse=True))
-            totchat = sum(sorted_result.values())
-            
-            final_data = {
-                "total_seconds": elapsecondS,
-                "total_chats": totchat,
-                "sorted_result": sorted_result
-            }
-            self.finished.emit(final_data)
+            if not self.is_running: return
+            self.finished.emit(self.make_result(totals))
         except Exception as e:
             self.error.emit(f"오류가 발생했습니다: {e}")
 
+    def make_result(self, totals):
+        return {
+            "totals": totals,
+            "frequency": totals.frequency_result(),
+            "users": totals.user_result(),
+        }
+
     def stop(self):
         self.is_running = False
 
-class CharCountWorker(QThread):
+class ChatTimelineWorker(QThread):
+    """기간 내 로그의 세션별 초당 채팅 수를 만들고 채팅 급증 구간을 찾는 작업 (chat_timeline)"""
     progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
-    def __init__(self, log_dir, start_date, end_date, target, is_emoticon=False):
+    def __init__(self, log_dir, start_date, end_date, min_score=SPIKE_MIN_SCORE, min_messages=SPIKE_MIN_MESSAGES):
         super().__init__()
         self.log_dir = log_dir
         self.start_date = start_date
         self.end_date = end_date
-        self.target = target
-        self.is_emoticon = is_emoticon
+        self.min_score = min_score
+        self.min_messages = min_messages
         self.is_running = True
 
     def run(self):
         try:
-            total_count = 0
-            total_chats = 0
-            total_chars = 0
-            elapsecondS = 0
-            
-            all_files = os.listdir(self.log_dir)
-            filtered_files = []
-            for f_name in all_files:
-                if f_name.endswith(".log") and "custom" not in f_name and "-" in f_name:
-                    try:
-                        date_str = f_name[:10]
-                        file_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        if self.start_date <= file_date <= self.end_date:
-                            filtered_files.append(f_name)
-                    except (ValueError, IndexError):
-                        continue
-            
-            filtered_files.sort(reverse=True)
+            filtered_files = day_log_files(self.log_dir, self.start_date, self.end_date)
             total_files = len(filtered_files)
-            
             if total_files == 0:
                 self.error.emit("선택한 기간에 해당하는 분석할 .log 파일이 없습니다.")
                 return
 
+            spikes = []
+            session_count = 0
+            total_chats = 0
+            peak_minute = (None, 0) # (분 시작 시각, 채팅 수)
             for i, file_name in enumerate(filtered_files):
-                if not self.is_running: break
-                
+                if not self.is_running: return
                 self.progress.emit(i + 1, total_files, file_name)
-                
-                file_path = os.path.join(self.log_dir, file_name)
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-
-                prev_chat_date = None
-
-                for line in lines:
-                    try:
-                        chat_date_str = line.split("]")[0].split("[")[1]
-                        chat_date = datetime.strptime(chat_date_str, '%Y-%m-%d %H:%M:%S')
-
-                        # [NEW] 30분(1800초) 이상 공백 시 세션 분리
-                        if prev_chat_date:
-                            diff = (chat_date - prev_chat_date).total_seconds()
-                            if 0 <= diff <= 1800:
-                                elapsecondS += diff
-                        
-                        prev_chat_date = chat_date
-                        
-                        if "<" not in line: continue
-                        id_val, nick = getIDNick(line)
-                        if not id_val: continue
-
-                        if f"{id_val})> " in line:
-                            msg = line.split(f"{id_val})> ")[1].strip()
-                        elif f"{id_val}> " in line:
-                            msg = line.split(f"{id_val}> ")[1].strip()
-                        else:
-                            continue
-                        
-                        if "🟥⭐" in msg or "Cheer" in msg: continue # 제외 로직 유지
-
-                        total_chats += 1
-                        
-                        # 띄어쓰기 제외한 전체 글자 수 집계
-                        msg_clean_for_total = msg.replace(" ", "")
-                        total_chars += len(msg_clean_for_total)
-
-                        # 이모티콘 모드
-                        if self.is_emoticon:
-                            # target이 '{:kane1Soak:}' 형태면 그대로 사용, 아니면 '{: :}'로 감싸기
-                            search_term = self.target
-                            if not (search_term.startswith("{:") and search_term.endswith(":}")):
-                                search_term = f"{{:{self.target}:}}"
-                            total_count += msg.count(search_term)
-                        else:
-                            # 텍스트 모드 (띄어쓰기 무시)
-                            msg_clean = msg.replace(" ", "")
-                            target_clean = self.target.replace(" ", "")
-                            
-                            if target_clean == '헉':
-                                total_count += msg_clean.count('헉')
-                                total_count += msg.count('{:lck_28:}') # 이모티콘은 원본 msg에서 찾음
-                            elif target_clean == '뭉':
-                                # '뭉', '뭉탱', '뭉탱이' -> '뭉' 글자 세면 포함됨
-                                total_count += msg_clean.count('뭉')
-                            elif target_clean == '뭉탱':
-                                total_count += msg_clean.count('뭉탱')
-                            elif target_clean == '뭉탱이':
-                                total_count += msg_clean.count('뭉탱이')
-                            else:
-                                total_count += msg_clean.count(target_clean)
-
-                    except (IndexError, ValueError):
-                        continue
-                
-
+                sessions, day_spikes = analyze_day(os.path.join(self.log_dir, file_name), self.min_score, self.min_messages)
+                spikes.extend(day_spikes)
+                session_count += len(sessions)
+                for session in sessions:
+                    total_chats += session.total
+                    per_minute = session.per_minute
+                    minute = int(per_minute.argmax())
+                    if per_minute[minute] > peak_minute[1]:
+                        peak_minute = (session.start + minute * 60, int(per_minute[minute]))
 
             if not self.is_running: return
-
-            final_data = {
-                "target": self.target,
-                "is_emoticon": self.is_emoticon,
-                "count": total_count,
-                "total_chats": total_chats,
-                "total_chars": total_chars,
-                "total_seconds": elapsecondS
-            }
-            self.finished.emit(final_data)
+            self.finished.emit({"spikes": spikes, "sessions": session_count, "total_chats": total_chats, "peak_minute": peak_minute})
         except Exception as e:
             self.error.emit(f"오류가 발생했습니다: {e}")
 
     def stop(self):
         self.is_running = False
 
+EMOTICON_PATTERN = re.compile(r"\{:[^{}:]+:\}")
+
+class RankTableModel(QAbstractTableModel):
+    """분석 결과 배열을 그대로 보관하는 순위표 모델 (QTableView 용)
+    - 화면에 보이는 셀만 data() 에서 문자열로 변환하므로 행이 많아도 바로 표시됩니다.
+    - 열 제목 클릭 정렬, 자동 스크롤용 순위 하이라이트, 보이는 행의 이모티콘 아이콘만 내려받기
+    rows 의 첫 번째 값은 순위여야 합니다."""
+    HIGHLIGHT_COLOR = QColor("#fff9c4")
+
+    def __init__(self, columns, rows, emoticons=None, parent=None):
+        """columns: [(제목, 표시 함수 또는 None, 오른쪽 정렬 여부)], rows: [(순위, 열1 값, ...)]"""
+        super().__init__(parent)
+        self._columns = columns
+        self._rows = rows
+        self._emoticons = emoticons or {}
+        self._icons = {} # 이모티콘 URL -> QIcon (None: 내려받는 중)
+        self._network = None
+        self._highlight_rank = None
+        self._rank_rows = None # 순위 -> 현재 행 번호 (정렬 후 다시 계산)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._columns[section][0]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            formatter = self._columns[column][1]
+            return formatter(row[column]) if formatter else str(row[column])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if self._columns[column][2]:
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        if role == Qt.ItemDataRole.BackgroundRole and row[0] == self._highlight_rank:
+            return QBrush(self.HIGHLIGHT_COLOR)
+        if role == Qt.ItemDataRole.FontRole and row[0] == self._highlight_rank:
+            font = QFont()
+            font.setBold(True)
+            return font
+        if role == Qt.ItemDataRole.DecorationRole and self._emoticons and isinstance(row[column], str):
+            return self._emoticon_icon(row[column])
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=lambda row: row[column], reverse=order == Qt.SortOrder.DescendingOrder)
+        self._rank_rows = None
+        self.layoutChanged.emit()
+
+    def row_of_rank(self, rank):
+        if self._rank_rows is None:
+            self._rank_rows = {row[0]: i for i, row in enumerate(self._rows)}
+        return self._rank_rows.get(rank)
+
+    def highlight_rank(self, rank):
+        """rank 행을 강조하고 해당 행 번호를 반환 (없으면 None)"""
+        last_columns = self.columnCount() - 1
+        for old_rank in (self._highlight_rank, rank):
+            row = self.row_of_rank(old_rank) if old_rank is not None else None
+            self._highlight_rank = rank
+            if row is not None:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_columns))
+        return self.row_of_rank(rank)
+
+    def _emoticon_icon(self, text):
+        match = EMOTICON_PATTERN.search(text)
+        url = self._emoticons.get(match.group(0)) if match else None
+        if not url: return None
+        if url not in self._icons:
+            self._icons[url] = None
+            if self._network is None:
+                self._network = QNetworkAccessManager(self)
+            reply = self._network.get(QNetworkRequest(QUrl(url)))
+            reply.finished.connect(lambda reply=reply, url=url: self._on_icon_loaded(reply, url))
+        return self._icons[url]
+
+    def _on_icon_loaded(self, reply, url):
+        pixmap = QPixmap()
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            pixmap.loadFromData(reply.readAll())
+        reply.deleteLater()
+        if pixmap.isNull(): return
+        self._icons[url] = QIcon(pixmap)
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, self.columnCount() - 1), [Qt.ItemDataRole.DecorationRole])
+
+def create_rank_table(model, stretch_column=1, parent=None):
+    """RankTableModel 을 보여주는 QTableView (고정 행 높이 -> 보이는 행만 그림)"""
+    table = QTableView(parent)
+    table.setModel(model)
+    table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    table.setAlternatingRowColors(True)
+    table.setIconSize(QSize(24, 24))
+    table.verticalHeader().hide()
+    table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    table.verticalHeader().setDefaultSectionSize(32)
+    header = table.horizontalHeader()
+    for column in range(model.columnCount()):
+        header.setSectionResizeMode(column, QHeaderView.ResizeMode.Stretch if column == stretch_column else QHeaderView.ResizeMode.ResizeToContents)
+    table.setSortingEnabled(True)
+    table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+    return table
+
+def export_html_file(parent, html_content, default_name):
+    """결과 HTML 을 파일로 저장 (HTML 내보내기 버튼)"""
+    path, _ = QFileDialog.getSaveFileName(parent, "HTML로 저장", default_name, "HTML (*.html)")
+    if not path: return
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+    except Exception as e:
+        QMessageBox.critical(parent, "파일 저장 오류", f"HTML을 저장하는 중 오류가 발생했습니다: {e}")
+
+RANK_HTML_STYLE = """
+                body { font-family: 'Pretendard JP', sans-serif; margin: 0; padding: 10px; }
+                table { width: 100%; border-collapse: collapse; }
+                th { background-color: #f2f2f2; padding: 10px; position: sticky; top: 0; z-index: 10; border-bottom: 2px solid #ddd; text-align: left;}
+                td { padding: 8px; border-bottom: 1px solid #ddd; }
+                tr { content-visibility: auto; contain-intrinsic-size: 30px; }
+                img.emoticon { height: 24px; vertical-align: middle; }
+                .rank-col { width: 60px; text-align: center; }
+                .count-col { width: 100px; text-align: right; }
+                .percent-col { width: 100px; text-align: right; }
+"""
+
 class ResultsDialog(QDialog):
     def __init__(self, result_data, rank_limit, parent=None):
         super().__init__(parent)
@@ -312,20 +302,14 @@ class ResultsDialog(QDialog):
         line2_layout.addWidget(self.chats_per_hour_label)
         summary_layout.addLayout(line2_layout)
 
+        button_layout = QHBoxLayout()
         self.scroll_button = QPushButton("자동 스크롤 시작")
         self.scroll_button.clicked.connect(self.toggle_auto_scroll)
-        layout.addWidget(self.scroll_button)
-
-        self.web_view = QWebEngineView()
-        self.web_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.web_view.hide()
-        self.web_view.loadFinished.connect(self.on_load_finished)
-        layout.addWidget(self.web_view)
-
-        self.loading_label = QLabel("로딩 중...", self)
-        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.loading_label.setStyleSheet("font-size: 16px; font-weight: bold; color: gray;")
-        layout.addWidget(self.loading_label)
+        self.export_button = QPushButton("HTML로 저장")
+        self.export_button.clicked.connect(lambda: export_html_file(self, self.build_html(), "chat_ranking.html"))
+        button_layout.addWidget(self.scroll_button)
+        button_layout.addWidget(self.export_button)
+        layout.addLayout(button_layout)
 
         self.scroll_timer = QTimer(self)
         self.scroll_timer.setSingleShot(True)
@@ -334,6 +318,7 @@ class ResultsDialog(QDialog):
         self.max_rows = 0
 
         self.populate_data(result_data, rank_limit)
+        layout.addWidget(self.table)
 
     def populate_data(self, result_data, rank_limit):
         total_seconds = result_data["total_seconds"]
@@ -358,45 +343,45 @@ class ResultsDialog(QDialog):
             self.chats_per_hour_label.setText("<b>시간당:</b> 0.000개")
 
         sorted_result = result_data["sorted_result"]
-        result_items = list(sorted_result.items())[:rank_limit]
-        self.max_rows = len(result_items)
+        errors = result_data.get("errors", {}) # 메모리 절약 모드: 항목별 최대 과대 추정치
+        if "max_error" in result_data:
+            self.total_chats_label.setText(f"<b>총 채팅 수:</b> {total_chats:,} (메모리 절약 모드, 최대 오차 ±{result_data['max_error']:,})")
+        self.max_rows = min(rank_limit, len(sorted_result))
+        self.total_chats = total_chats
+        self.errors = errors
+
+        # (순위, 채팅 내용, 횟수, 비율, 오차) - 표시 문자열은 모델에서 보이는 행만 만듦
+        self.rows = [(i + 1, key, value, (value / total_chats) * 100 if total_chats > 0 else 0, errors.get(key, 0))
+                     for i, (key, value) in enumerate(islice(sorted_result.items(), rank_limit))]
+        columns = [("순위", None, False), ("채팅 내용", None, False), ("횟수", "{:,}".format, True), ("비율 (%)", "{:.3f}%".format, True)]
+        if errors:
+            columns.append(("오차 (±)", "{:,}".format, True))
+        self.table_model = RankTableModel(columns, self.rows, self.emoticons, self)
+        self.table = create_rank_table(self.table_model, parent=self)
+        QTimer.singleShot(0, self.table.scrollToBottom)
+
+    def build_html(self):
+        """HTML 내보내기용 문서 (이모티콘은 이미지로 표시)"""
+        import html
+        def replace_emoticon(match):
+            url = self.emoticons.get(match.group(0))
+            return f'<img src="{url}" class="emoticon">' if url else match.group(0)
 
-        # HTML 생성
-        html_content = """
+        rows = []
+        for rank, key, value, percentage, error in sorted(self.rows):
+            rows.append(f"""
+                <tr>
+                    <td class="rank-col">{rank}</td>
+                    <td>{EMOTICON_PATTERN.sub(replace_emoticon, html.escape(key))}</td>
+                    <td class="count-col">{value:,}{f" (±{error:,})" if error else ""}</td>
+                    <td class="percent-col">{percentage:.3f}%</td>
+                </tr>""")
+        return f"""
         <!DOCTYPE html>
         <html>
         <head>
-            <style>
-                body { font-family: 'Pretendard JP', sans-serif; margin: 0; padding: 10px; }
-                table { width: 100%; border-collapse: collapse; }
-                th { background-color: #f2f2f2; padding: 10px; position: sticky; top: 0; z-index: 10; border-bottom: 2px solid #ddd; text-align: left;}
-                td { padding: 8px; border-bottom: 1px solid #ddd; }
-                tr { content-visibility: auto; contain-intrinsic-size: 30px; scroll-margin-top: 40px; }
-                tr.highlight { background-color: #fff9c4; font-weight: bold; }
-                img.emoticon { height: 24px; vertical-align: middle; }
-                .rank-col { width: 60px; text-align: center; }
-                .count-col { width: 100px; text-align: right; }
-                .percent-col { width: 100px; text-align: right; }
-            </style>
-            <script>
-                function highlightRow(index) {
-                    // 모든 하이라이트 제거
-                    var highlighted = document.querySelectorAll('tr.highlight');
-                    highlighted.forEach(function(row) {
-                        row.classList.remove('highlight');
-                    });
-                    
-                    var row = document.getElementById('row-' + index);
-                    if (row) {
-                        row.classList.add('highlight');
-                        row.scrollIntoView({behavior: "smooth", block: "start"});
-                    }
-                }
-                
-                function scrollToBottom() {
-                    window.scrollTo(0, document.body.scrollHeight);
-                }
-            </script>
+            <meta charset="utf-8">
+            <style>{RANK_HTML_STYLE}</style>
         </head>
         <body>
             <table>
@@ -408,45 +393,18 @@ class ResultsDialog(QDialog):
                         <th class="percent-col">비율 (%)</th>
                     </tr>
                 </thead>
-                <tbody>
-        """
-        
-        # 이모티콘 치환 및 행 생성
-        for i, (key, value) in enumerate(result_items):
-            percentage = (value / total_chats) * 100 if total_chats > 0 else 0
-            
-            # 이모티콘 치환
-            display_text = key
-            for code, url in self.emoticons.items():
-                if code in display_text:
-                    display_text = display_text.replace(code, f'<img src="{url}" class="emoticon">')
-            
-            html_content += f"""
-                <tr id="row-{i}">
-                    <td class="rank-col">{i+1}</td>
-                    <td>{display_text}</td>
-                    <td class="count-col">{value:,}</td>
-                    <td class="percent-col">{percentage:.3f}%</td>
-                </tr>
-            """
-            
-        html_content += """
+                <tbody>{"".join(rows)}
                 </tbody>
             </table>
         </body>
         </html>
         """
-        
-        self.web_view.setHtml(html_content)
-        
-    def on_load_finished(self, ok):
-        if ok:
-             QTimer.singleShot(100, lambda: self.web_view.page().runJavaScript("scrollToBottom()"))
-             QTimer.singleShot(200, self.show_webview)
 
-    def show_webview(self):
-        self.loading_label.hide()
-        self.web_view.show()
+    def show_rank(self, rank):
+        """자동 스크롤: rank 행을 강조하고 맨 위로 스크롤"""
+        row = self.table_model.highlight_rank(rank)
+        if row is not None:
+            self.table.scrollTo(self.table_model.index(row, 0), QAbstractItemView.ScrollHint.PositionAtTop)
 
     def toggle_auto_scroll(self):
         if self.scroll_timer.isActive():
@@ -460,10 +418,7 @@ class ResultsDialog(QDialog):
             self.highlight_and_schedule_next()
 
     def highlight_and_schedule_next(self):
-        row_index = self.current_scroll_rank - 1
-        
-        # JS 호출하여 하이라이트 및 스크롤
-        self.web_view.page().runJavaScript(f"highlightRow({row_index})")
+        self.show_rank(self.current_scroll_rank)
 
         interval = 100
         if 50 < self.current_scroll_rank <= 100:
@@ -485,7 +440,7 @@ class ResultsDialog(QDialog):
             self.scroll_button.setText("자동 스크롤 시작")
 
     def scroll_step(self):
-        if self.current_scroll_rank < 0:
+        if self.current_scroll_rank < 1:
             self.scroll_timer.stop()
             self.scroll_button.setText("자동 스크롤 시작")
             return
@@ -497,89 +452,39 @@ class ResultsDialog(QDialog):
 
 
 
-class UserCountWorker(QThread):
-    progress = pyqtSignal(int, int, str)
-    finished = pyqtSignal(dict)
-    error = pyqtSignal(str)
-
-    def __init__(self, log_dir, start_date, end_date):
-        super().__init__()
-        self.log_dir = log_dir
-        self.start_date = start_date
-        self.end_date = end_date
-        self.is_running = True
-
-    def run(self):
-        try:
-            user_counts = {} # {id: count}
-            user_nicks = {}  # {id: latest_nick}
-            total_chats = 0
-            
-            all_files = os.listdir(self.log_dir)
-            filtered_files = []
-            for f_name in all_files:
-                if f_name.endswith(".log") and "custom" not in f_name and "-" in f_name:
-                    try:
-                        date_str = f_name[:10]
-                        file_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        if self.start_date <= file_date <= self.end_date:
-                            filtered_files.append(f_name)
-                    except (ValueError, IndexError):
-                        continue
-            
-            filtered_files.sort() # 오름차순 (옛날 -> 최신)
-            total_files = len(filtered_files)
-            
-            if total_files == 0:
-                self.error.emit("선택한 기간에 해당하는 분석할 .log 파일이 없습니다.")
-                return
-
-            for i, file_name in enumerate(filtered_files):
-                if not self.is_running: break
-                self.progress.emit(i + 1, total_files, file_name)
-                
-                file_path = os.path.join(self.log_dir, file_name)
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line in f:
-                        if "<" not in line: continue
-                        id_val, nick = getIDNick(line)
-                        if not id_val: continue
-                        
-                        if f"{id_val})> " in line:
-                            msg = line.split(f"{id_val})> ")[1].strip()
-                        elif f"{id_val}> " in line:
-                            msg = line.split(f"{id_val}> ")[1].strip()
-                        else:
-                            continue
-                        
-                        if "🟥⭐" in msg or "Cheer" in msg: continue # 제외
-                        
-                        total_chats += 1
-                        user_counts[id_val] = user_counts.get(id_val, 0) + 1
-                        user_nicks[id_val] = nick # 계속 덮어씀 -> 마지막이 최신
-
-            if not self.is_running: return
-
-            # 결과 정렬 (채팅 수 내림차순)
-            sorted_users = sorted(user_counts.items(), key=lambda x: x[1], reverse=True)
-            
-            result_list = []
-            for uid, count in sorted_users:
-                nick = user_nicks.get(uid, "Unknown")
-                result_list.append((uid, count, nick))
-
-            final_data = {
-                "total_chats": total_chats,
-                "total_users": len(sorted_users),
-                "sorted_result": result_list
-            }
-            self.finished.emit(final_data)
+class SpikeResultDialog(QDialog):
+    """채팅 급증 구간 목록 (점수 순위, 시각 열로 정렬하면 시간순)"""
+    def __init__(self, result_data, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("채팅 급증 구간")
+        self.resize(800, 600)
+        self.setWindowIcon(QIcon(resource_path(r'.\resources\icon\icon_BCU.ico')))
 
-        except Exception as e:
-            self.error.emit(f"오류가 발생했습니다: {e}")
+        if parent:
+             geo = parent.geometry()
+             center = geo.center()
+             self.move(center - self.rect().center())
 
-    def stop(self):
-        self.is_running = False
+        layout = QVBoxLayout(self)
+        spikes = sorted(result_data["spikes"], key=lambda spike: spike.score, reverse=True)
+        peak_time, peak_count = result_data["peak_minute"]
+        summary = f"<b>방송 {result_data['sessions']:,}회 / 총 채팅 수:</b> {result_data['total_chats']:,} / <b>급증 구간:</b> {len(spikes):,}개"
+        if peak_time is not None:
+            summary += f"<br><b>분당 최고:</b> {to_datetime(peak_time).strftime('%Y-%m-%d %H:%M')} ({peak_count:,}개)"
+        summary_label = QLabel(summary)
+        layout.addWidget(summary_label)
+
+        rows = [(i + 1, spike.timestamp, spike.count, spike.baseline, spike.count / max(spike.baseline, 1.0), spike.score)
+                for i, spike in enumerate(spikes)]
+        columns = [("순위", None, False),
+                   ("시각", lambda ts: to_datetime(ts).strftime("%Y-%m-%d %H:%M:%S"), False),
+                   (f"{SPIKE_WINDOW_SECONDS}초 채팅 수", "{:,}".format, True),
+                   ("평소", "{:.1f}".format, True),
+                   ("배율", "x{:.1f}".format, True),
+                   ("점수", "{:.1f}".format, True)]
+        self.table_model = RankTableModel(columns, rows, parent=self)
+        self.table = create_rank_table(self.table_model, parent=self)
+        layout.addWidget(self.table)
 
 class ChatCounterWindow(QMainWindow):
     def __init__(self, parent=None):
@@ -599,6 +504,8 @@ class ChatCounterWindow(QMainWindow):
         self.analysis_result = None # General
         self.char_count_result = None # Specific
         self.user_count_result = None # User
+        self.stats_totals = None # 통합 분석 결과 (ChatStatsTotals) - 다시 읽지 않고 특정 단어 결과 계산
+        self.spike_result = None # 채팅 급증 구간
         
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -652,6 +559,11 @@ class ChatCounterWindow(QMainWindow):
         self.rank_limit_spinbox.setRange(1, 10000)
         self.rank_limit_spinbox.setValue(1000)
         freq_layout.addWidget(self.rank_limit_spinbox)
+        self.bounded_memory_check = QCheckBox("메모리 절약 (근사치)")
+        self.bounded_memory_check.setToolTip(
+            f"서로 다른 채팅을 모두 저장하지 않고 상위 (표시 개수 x {TOP_K_CAPACITY_FACTOR})개 카운터만 유지합니다.\n"
+            "채팅 종류가 아주 많은 긴 기간을 분석할 때 사용하세요. 횟수 옆에 최대 오차(±)가 표시됩니다.")
+        freq_layout.addWidget(self.bounded_memory_check)
         freq_layout.addStretch()
         mode_layout.addWidget(self.group_frequency)
 
@@ -666,22 +578,23 @@ class ChatCounterWindow(QMainWindow):
         type_layout = QHBoxLayout()
         self.spec_radio_text = QRadioButton("단어/문장")
         self.spec_radio_emote = QRadioButton("이모티콘")
+        self.spec_radio_multi = QRadioButton("여러 개 한 번에")
         self.spec_radio_text.setChecked(True)
         self.spec_radio_bg = QButtonGroup(self)
         self.spec_radio_bg.addButton(self.spec_radio_text)
         self.spec_radio_bg.addButton(self.spec_radio_emote)
+        self.spec_radio_bg.addButton(self.spec_radio_multi)
         self.spec_radio_text.toggled.connect(self.toggle_specific_input)
+        self.spec_radio_multi.toggled.connect(self.toggle_specific_input)
         type_layout.addWidget(self.spec_radio_text)
         type_layout.addWidget(self.spec_radio_emote)
+        type_layout.addWidget(self.spec_radio_multi)
         type_layout.addStretch()
         spec_layout.addLayout(type_layout)
         
         input_layout = QHBoxLayout()
         self.search_input = QLineEdit()
-        if self.internal_mode:
-            self.search_input.setPlaceholderText("검색할 단어 (예: 코, 헉, 뭉, 게이, 자숙)")
-        else:
-             self.search_input.setPlaceholderText("검색할 단어를 입력하세요.")
+        self.update_search_placeholder()
         self.selected_emote_btn = QPushButton("이모티콘 선택")
         self.selected_emote_btn.clicked.connect(self.open_emoticon_selector)
         self.selected_emote_label = QLabel("")
@@ -726,6 +639,28 @@ class ChatCounterWindow(QMainWindow):
         user_layout.addLayout(urank_layout)
         
         mode_layout.addWidget(self.group_user)
+
+        self.rb_spike = QRadioButton("채팅이 폭발한 순간은?")
+        self.rb_spike.toggled.connect(self.toggle_mode_ui)
+        mode_layout.addWidget(self.rb_spike)
+
+        self.group_spike = QWidget()
+        spike_layout = QHBoxLayout(self.group_spike)
+        spike_layout.setContentsMargins(20, 0, 0, 0)
+        spike_layout.addWidget(QLabel("민감도(점수):"))
+        self.spike_score_spinbox = QDoubleSpinBox()
+        self.spike_score_spinbox.setRange(1.0, 50.0)
+        self.spike_score_spinbox.setSingleStep(0.5)
+        self.spike_score_spinbox.setValue(SPIKE_MIN_SCORE)
+        self.spike_score_spinbox.setToolTip("낮을수록 작은 급증도 찾습니다. (직전 5분 평균과 비교한 표준 편차 단위)")
+        spike_layout.addWidget(self.spike_score_spinbox)
+        spike_layout.addWidget(QLabel(f"{SPIKE_WINDOW_SECONDS}초 최소 채팅 수:"))
+        self.spike_min_spinbox = QSpinBox()
+        self.spike_min_spinbox.setRange(1, 10000)
+        self.spike_min_spinbox.setValue(SPIKE_MIN_MESSAGES)
+        spike_layout.addWidget(self.spike_min_spinbox)
+        spike_layout.addStretch()
+        mode_layout.addWidget(self.group_spike)
         
         mode_group.setLayout(mode_layout)
         self.main_layout.addWidget(mode_group)
@@ -765,7 +700,7 @@ class ChatCounterWindow(QMainWindow):
         self.toggle_specific_input()
 
     def load_years(self):
-        """Scan log_dir for files like Chat_YYYY... and populate year_combo."""
+        """Populate year_combo with the years found in the log catalog."""
         self.year_combo.blockSignals(True)
         self.year_combo.clear()
         
@@ -774,22 +709,7 @@ class ChatCounterWindow(QMainWindow):
             self.year_combo.blockSignals(False)
             return
 
-        years = set()
-        try:
-            for f in os.listdir(self.log_dir):
-                if f.endswith(".log") and "custom" not in f and "-" in f:
-                    try:
-                        parts = f.replace("Chat_", "").split("-")
-                        if len(parts) >= 1:
-                            y = parts[0]
-                            if y.isdigit() and len(y) == 4:
-                                years.add(y)
-                    except:
-                        continue
-        except Exception as e:
-            print(f"Error scanning years: {e}")
-
-        sorted_years = sorted(list(years), reverse=True)
+        sorted_years = [str(y) for y in get_chat_log_catalog(self.log_dir).years()]
         self.year_combo.addItems([y + "년" for y in sorted_years])
         self.year_combo.addItem("직접 선택")
         
@@ -823,6 +743,7 @@ class ChatCounterWindow(QMainWindow):
         self.group_frequency.hide()
         self.group_specific.hide()
         self.group_user.hide()
+        self.group_spike.hide()
         
         is_result_ready = False
         
@@ -832,11 +753,15 @@ class ChatCounterWindow(QMainWindow):
             
         elif self.rb_specific.isChecked():
             self.group_specific.show()
-            if self.char_count_result: is_result_ready = True
+            if self.char_count_result or self.stats_totals: is_result_ready = True
             
         elif self.rb_user.isChecked():
             self.group_user.show()
             if self.user_count_result: is_result_ready = True
+
+        elif self.rb_spike.isChecked():
+            self.group_spike.show()
+            if self.spike_result: is_result_ready = True
             
         self.result_btn.setEnabled(is_result_ready)
 
@@ -846,25 +771,42 @@ class ChatCounterWindow(QMainWindow):
         self.selected_emote_btn.setVisible(is_emote)
         self.selected_emote_label.setVisible(is_emote)
         self.selected_emote_btn.setEnabled(is_emote) 
+        self.update_search_placeholder()
+
+    def update_search_placeholder(self):
+        if self.spec_radio_multi.isChecked():
+            self.search_input.setPlaceholderText("쉼표(,)로 구분 (비우면 모든 이모티콘)")
+        elif self.internal_mode:
+            self.search_input.setPlaceholderText("검색할 단어 (예: 코, 헉, 뭉, 게이, 자숙)")
+        else:
+            self.search_input.setPlaceholderText("검색할 단어를 입력하세요.")
 
     def on_start_clicked(self):
-        if self.rb_frequency.isChecked():
-            self.start_analysis()
-        elif self.rb_specific.isChecked():
-            self.start_char_count()
-        elif self.rb_user.isChecked():
-            self.start_user_analysis()
+        if self.rb_specific.isChecked() and not self.get_char_target():
+            return
+        if self.rb_spike.isChecked():
+            self.start_spike_analysis()
+            return
+        self.start_analysis()
 
     def on_result_clicked(self):
         if self.rb_frequency.isChecked():
             self.open_results_dialog()
             
         elif self.rb_specific.isChecked():
+            target = self.get_char_target()
+            if not target: return
+            res = self.char_count_result
+            if self.stats_totals and (not res or (res["target"], res["is_emoticon"]) != target):
+                self.char_count_result = self.stats_totals.char_count_result(*target) # 통합 분석 결과에서 바로 계산
             if not self.char_count_result: return
             self.open_char_results_dialog()
                 
         elif self.rb_user.isChecked():
             self.open_user_results_dialog()
+
+        elif self.rb_spike.isChecked() and self.spike_result:
+            SpikeResultDialog(self.spike_result, self).show()
     
     def open_char_results_dialog(self):
         if not self.char_count_result: return
@@ -872,7 +814,9 @@ class ChatCounterWindow(QMainWindow):
         
         target_url = ""
         target = res["target"]
-        if res.get("is_emoticon"):
+        if res.get("ranked") is not None:
+            pass # 순위표 (이모티콘 이미지는 대화상자에서 표시)
+        elif res.get("is_emoticon"):
              if self.selected_emote_data and self.selected_emote_data[0] == target:
                  target_url = self.selected_emote_data[1]
         elif target == '헉':
@@ -899,51 +843,39 @@ class ChatCounterWindow(QMainWindow):
              self.selected_emote_data = (name, url)
              self.selected_emote_label.setText(f"선택됨: {name}")
 
-    def start_char_count(self):
-        if not self.log_dir or not os.path.isdir(self.log_dir):
-            QMessageBox.warning(self, "경고", "로그 폴더가 설정되지 않았습니다.")
-            return
-
-        target = ""
+    def get_char_target(self):
+        """특정 단어/이모티콘 모드의 (대상, 이모티콘 여부). 입력이 없으면 경고 후 None
+        '여러 개 한 번에' 모드는 대상이 tuple (비우면 chat_emoticons.json 의 모든 이모티콘)"""
         is_emoticon = self.spec_radio_emote.isChecked()
 
+        if self.spec_radio_multi.isChecked():
+            targets = [t.strip() for t in self.search_input.text().split(",") if t.strip()]
+            if not targets:
+                targets = list(self.load_emoticons().keys())
+            if not targets:
+                QMessageBox.warning(self, "경고", "검색할 단어를 입력해주세요.")
+                return None
+            return tuple(dict.fromkeys(targets)), False
+
         if is_emoticon:
             if not self.selected_emote_data:
                 QMessageBox.warning(self, "경고", "이모티콘을 선택해주세요.")
-                return
-            target = self.selected_emote_data[0]
-        else:
-            target = self.search_input.text().strip()
-            if not target:
-                QMessageBox.warning(self, "경고", "검색할 단어를 입력해주세요.")
-                return
-        
-        self.start_btn.setEnabled(False)
-        self.result_btn.setEnabled(False)
-        self.reset_ui(specific=True)
-        self.char_count_result = None
-
-        start_date = self.start_date_edit.date().toPyDate()
-        end_date = self.end_date_edit.date().toPyDate()
-
-        self.char_worker = CharCountWorker(self.log_dir, start_date, end_date, target, is_emoticon)
-        self.char_worker.progress.connect(self.update_progress)
-        self.char_worker.finished.connect(self.on_char_count_finished)
-        self.char_worker.error.connect(self.on_char_count_error)
-        self.char_worker.start()
+                return None
+            return self.selected_emote_data[0], True
 
-    def on_char_count_finished(self, result_data):
-        self.start_btn.setEnabled(True)
-        self.result_btn.setEnabled(True)
-        self.char_count_result = result_data
-        
-        self.progress_label.setText("분석 완료! '결과 표시' 버튼으로 결과를 확인하세요.")
-        QMessageBox.information(self, "완료", "분석 완료! '결과 표시' 버튼으로 결과를 확인하세요.")
+        target = self.search_input.text().strip()
+        if not target:
+            QMessageBox.warning(self, "경고", "검색할 단어를 입력해주세요.")
+            return None
+        return target, False
 
-    def on_char_count_error(self, error_message):
-        self.start_btn.setEnabled(True)
-        self.progress_label.setText("오류 발생")
-        QMessageBox.critical(self, "오류", error_message)
+    def load_emoticons(self):
+        try:
+            with open(os.path.join(USERPATH, "BCU", "chat_emoticons.json"), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"이모티콘 로드 실패: {e}")
+            return {}
 
     def load_last_directory(self):
         parent = self.parent()
@@ -957,6 +889,7 @@ class ChatCounterWindow(QMainWindow):
             self.load_years()
 
     def start_analysis(self):
+        """기간 내 로그를 한 번 읽어 세 가지 분석 결과를 모두 만듭니다. (ChatStatsWorker)"""
         if not self.log_dir or not os.path.isdir(self.log_dir):
             QMessageBox.warning(self, "경고", "로그 폴더가 설정되지 않았습니다.")
             return
@@ -965,27 +898,74 @@ class ChatCounterWindow(QMainWindow):
         self.result_btn.setEnabled(False)
         self.reset_ui()
         self.analysis_result = None
+        self.char_count_result = None
+        self.user_count_result = None
+        self.stats_totals = None
 
         start_date = self.start_date_edit.date().toPyDate()
         end_date = self.end_date_edit.date().toPyDate()
 
-        self.worker = LogAnalyzerWorker(self.log_dir, start_date, end_date)
+        top_k = None
+        if self.bounded_memory_check.isChecked():
+            top_k = max(self.rank_limit_spinbox.value() * TOP_K_CAPACITY_FACTOR, TOP_K_MIN_CAPACITY)
+
+        self.worker = ChatStatsWorker(self.log_dir, start_date, end_date, self.use_parallel_analysis(), top_k)
         self.worker.progress.connect(self.update_progress)
         self.worker.finished.connect(self.analysis_finished)
         self.worker.error.connect(self.analysis_error)
         self.worker.start()
 
+    def start_spike_analysis(self):
+        """기간 내 로그에서 채팅 급증 구간을 찾습니다. (ChatTimelineWorker)"""
+        if not self.log_dir or not os.path.isdir(self.log_dir):
+            QMessageBox.warning(self, "경고", "로그 폴더가 설정되지 않았습니다.")
+            return
+
+        self.start_btn.setEnabled(False)
+        self.result_btn.setEnabled(False)
+        self.reset_ui()
+        self.spike_result = None
+
+        start_date = self.start_date_edit.date().toPyDate()
+        end_date = self.end_date_edit.date().toPyDate()
+
+        self.worker = ChatTimelineWorker(self.log_dir, start_date, end_date,
+                                         self.spike_score_spinbox.value(), self.spike_min_spinbox.value())
+        self.worker.progress.connect(self.update_progress)
+        self.worker.finished.connect(self.spike_analysis_finished)
+        self.worker.error.connect(self.analysis_error)
+        self.worker.start()
+
+    def spike_analysis_finished(self, result_data):
+        self.spike_result = result_data
+        self.progress_label.setText(f"분석 완료! 급증 구간 {len(result_data['spikes']):,}개")
+        self.start_btn.setEnabled(True)
+        self.toggle_mode_ui()
+        SpikeResultDialog(result_data, self).show()
+
+    def use_parallel_analysis(self):
+        """여러 날짜를 프로세스 풀에서 나누어 분석할지 여부 (BCU.ini chat_stats_parallel, 기본 사용)"""
+        settings = QSettings(os.path.join(USERPATH, "BCU", "BCU.ini"), QSettings.Format.IniFormat)
+        return settings.value('chat_stats_parallel', True, type=bool)
+
     def update_progress(self, current, total, filename):
         self.progress_bar.setMaximum(total)
         self.progress_bar.setValue(current)
         self.progress_label.setText(f"처리 중... ({current}/{total}): {filename}")
 
     def analysis_finished(self, result_data):
-        self.analysis_result = result_data
+        self.stats_totals = result_data["totals"]
+        self.analysis_result = result_data["frequency"]
+        self.user_count_result = result_data["users"]
+        if self.rb_specific.isChecked():
+            target = self.get_char_target()
+            if target:
+                self.char_count_result = self.stats_totals.char_count_result(*target)
+
         self.progress_label.setText("분석 완료! '결과 표시' 버튼으로 결과를 확인하세요.")
         self.start_btn.setEnabled(True)
-        self.result_btn.setEnabled(True)
-        self.save_results_to_file(result_data["sorted_result"], result_data["total_chats"])
+        self.toggle_mode_ui()
+        self.save_results_to_file(self.analysis_result["sorted_result"], self.analysis_result["total_chats"])
         QMessageBox.information(self, "완료", "분석 완료! '결과 표시' 버튼으로 결과를 확인하세요.")
 
     def open_results_dialog(self):
@@ -1018,32 +998,6 @@ class ChatCounterWindow(QMainWindow):
         self.progress_bar.setValue(0)
         self.progress_label.setText("대기 중...")
 
-    def start_user_analysis(self):
-        if not self.log_dir or not os.path.isdir(self.log_dir):
-            QMessageBox.warning(self, "경고", "로그 폴더가 설정되지 않았습니다.")
-            return
-
-        self.start_btn.setEnabled(False)
-        self.result_btn.setEnabled(False)
-        self.reset_ui(specific=True)
-        self.user_count_result = None
-
-        start_date = self.start_date_edit.date().toPyDate()
-        end_date = self.end_date_edit.date().toPyDate()
-
-        self.user_worker = UserCountWorker(self.log_dir, start_date, end_date)
-        self.user_worker.progress.connect(self.update_progress)
-        self.user_worker.finished.connect(self.on_user_analysis_finished)
-        self.user_worker.error.connect(self.on_user_analysis_error)
-        self.user_worker.start()
-
-    def on_user_analysis_finished(self, result_data):
-        self.start_btn.setEnabled(True)
-        self.result_btn.setEnabled(True)
-        self.user_count_result = result_data 
-        self.progress_label.setText("분석 완료! '결과 표시' 버튼으로 결과를 확인하세요.")
-        QMessageBox.information(self, "완료", "분석 완료! '결과 표시' 버튼으로 결과를 확인하세요.")
-
     def open_user_results_dialog(self):
         if not self.user_count_result:
             return
@@ -1057,11 +1011,6 @@ class ChatCounterWindow(QMainWindow):
         self.user_stats_dialog = UserStatsResultDialog(self.user_count_result, mask_type, limit, self)
         self.user_stats_dialog.show()
 
-    def on_user_analysis_error(self, error_message):
-        self.start_btn.setEnabled(True)
-        self.progress_label.setText("오류 발생")
-        QMessageBox.critical(self, "오류", error_message)
-
 class CharCountResultDialog(QDialog):
     def __init__(self, result_data, target_url, internal_mode=False, parent=None):
         super().__init__(parent)
@@ -1075,6 +1024,11 @@ class CharCountResultDialog(QDialog):
              center = geo.center()
              self.move(center - self.rect().center())
         
+        self.web_view = None
+        if result_data.get("ranked") is not None:
+            self.setup_ranked_table(result_data)
+            return
+
         self.web_view = QWebEngineView(self)
         self.web_view.setZoomFactor(0.75)
         self.web_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -1090,9 +1044,100 @@ class CharCountResultDialog(QDialog):
         self.populate_html(result_data, target_url)
 
     def closeEvent(self, event):
-        self.web_view.setUrl(QUrl("about:blank"))
+        if self.web_view is not None:
+            self.web_view.setUrl(QUrl("about:blank"))
         super().closeEvent(event)
 
+    def setup_ranked_table(self, data):
+        """여러 단어/이모티콘 횟수 순위표 (보이는 행만 그리는 표, HTML은 내보내기용)"""
+        emoticons = {}
+        try:
+            with open(os.path.join(USERPATH, "BCU", "chat_emoticons.json"), 'r', encoding='utf-8') as f:
+                emoticons = json.load(f)
+        except Exception as e:
+            print(f"이모티콘 로드 실패: {e}")
+
+        total_count = data["count"]
+        total_chats = data["total_chats"]
+        rows = [(i + 1, target, count,
+                 (count / total_count) * 100 if total_count > 0 else 0,
+                 count / total_chats if total_chats > 0 else 0)
+                for i, (target, count) in enumerate(data["ranked"])]
+
+        layout = QVBoxLayout(self)
+        header_layout = QHBoxLayout()
+        summary_label = QLabel(f"<b>총 채팅 수:</b> {total_chats:,} / 대상 {len(rows):,}개 합계: {total_count:,}")
+        export_button = QPushButton("HTML로 저장")
+        export_button.clicked.connect(lambda: export_html_file(self, self.build_ranked_html(data, emoticons), "chat_count_ranking.html"))
+        header_layout.addWidget(summary_label)
+        header_layout.addStretch()
+        header_layout.addWidget(export_button)
+        layout.addLayout(header_layout)
+
+        columns = [("순위", None, False), ("단어/이모티콘", None, False), ("횟수", "{:,}".format, True),
+                   ("비율 (%)", "{:.3f}%".format, True), ("채팅당", "{:.4f}".format, True)]
+        self.table_model = RankTableModel(columns, rows, emoticons=emoticons, parent=self)
+        self.table = create_rank_table(self.table_model, parent=self)
+        layout.addWidget(self.table)
+
+    def build_ranked_html(self, data, emoticons):
+        """여러 단어/이모티콘 순위표 HTML (내보내기용)"""
+        import html
+        total_count = data["count"]
+        total_chats = data["total_chats"]
+        rows = []
+        for i, (target, count) in enumerate(data["ranked"]):
+            percentage = (count / total_count) * 100 if total_count > 0 else 0
+            per_chat = count / total_chats if total_chats > 0 else 0
+            display_text = html.escape(target)
+            if target in emoticons:
+                display_text = f'<img src="{emoticons[target]}" class="emoticon"> {display_text}'
+            rows.append(f"""
+                <tr>
+                    <td class="rank-col">{i+1}</td>
+                    <td>{display_text}</td>
+                    <td class="count-col">{count:,}</td>
+                    <td class="percent-col">{percentage:.3f}%</td>
+                    <td class="percent-col">{per_chat:.4f}</td>
+                </tr>""")
+
+        html_content = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                body {{ font-family: 'Pretendard JP', sans-serif; margin: 0; padding: 10px; font-size: 18px; }}
+                .summary {{ padding: 10px; font-weight: bold; }}
+                table {{ width: 100%; border-collapse: collapse; }}
+                th {{ background-color: #f2f2f2; padding: 10px; position: sticky; top: 0; z-index: 10; border-bottom: 2px solid #ddd; text-align: left; }}
+                td {{ padding: 8px; border-bottom: 1px solid #ddd; }}
+                tr {{ content-visibility: auto; contain-intrinsic-size: 40px; }}
+                img.emoticon {{ height: 32px; vertical-align: middle; }}
+                .rank-col {{ width: 60px; text-align: center; }}
+                .count-col {{ width: 120px; text-align: right; }}
+                .percent-col {{ width: 120px; text-align: right; }}
+            </style>
+        </head>
+        <body>
+            <div class="summary">총 채팅 수: {total_chats:,} / 대상 {len(data["ranked"]):,}개 합계: {total_count:,}</div>
+            <table>
+                <thead>
+                    <tr>
+                        <th class="rank-col">순위</th>
+                        <th>단어/이모티콘</th>
+                        <th class="count-col">횟수</th>
+                        <th class="percent-col">비율 (%)</th>
+                        <th class="percent-col">채팅당</th>
+                    </tr>
+                </thead>
+                <tbody>{"".join(rows)}
+                </tbody>
+            </table>
+        </body>
+        </html>
+        """
+        return html_content
+
     def populate_html(self, data, target_url):
         import json
         target = data["target"]
@@ -1515,33 +1560,37 @@ class UserStatsResultDialog(QDialog):
         line1_layout.addWidget(self.total_users_label)
         summary_layout.addLayout(line1_layout)
 
+        button_layout = QHBoxLayout()
         self.scroll_button = QPushButton("자동 스크롤 시작")
         self.scroll_button.clicked.connect(self.toggle_auto_scroll)
-        layout.addWidget(self.scroll_button)
-
-        self.web_view = QWebEngineView(self)
-        self.web_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.web_view.hide()
-        self.web_view.loadFinished.connect(self.on_load_finished)
-        layout.addWidget(self.web_view)
-
-        self.loading_label = QLabel("로딩 중...", self)
-        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.loading_label.setStyleSheet("font-size: 16px; font-weight: bold; color: gray;")
-        layout.addWidget(self.loading_label)
+        self.export_button = QPushButton("HTML로 저장")
+        self.export_button.clicked.connect(lambda: export_html_file(self, self.build_html(), "user_ranking.html"))
+        button_layout.addWidget(self.scroll_button)
+        button_layout.addWidget(self.export_button)
+        layout.addLayout(button_layout)
 
         self.scroll_timer = QTimer(self)
         self.scroll_timer.setSingleShot(True)
         self.scroll_timer.timeout.connect(self.scroll_step)
         self.current_scroll_rank = 0
         self.max_rows = 0
+        self.rows = []
 
+        self.table_model = None
         self.populate_data(result_data, mask_type, limit)
+        if self.table_model is not None:
+            layout.addWidget(self.table)
+
+    @staticmethod
+    def mask_nickname(nickname, mask_type):
+        if mask_type == "full":
+            return "*****"
+        if mask_type == "half":
+            return nickname[0] + "*" * (len(nickname) - 1) if len(nickname) > 1 else "*"
+        return nickname
 
     def populate_data(self, result_data, mask_type, limit):
-        import json
         import traceback
-        import html
         
         try:
             total_chats = result_data.get("total_chats", 0)
@@ -1551,45 +1600,40 @@ class UserStatsResultDialog(QDialog):
             self.total_chats_label.setText(f"<b>총 채팅 수:</b> {total_chats:,}개")
             self.total_users_label.setText(f"<b>참여 유저:</b> {total_users:,}명")
             
-            has_more = False
-            if len(user_list) > limit:
-                user_list = user_list[:limit]
-            
-            self.max_rows = len(user_list)
+            self.mask_type = mask_type
+            # (순위, 닉네임, 채팅수, 점유율) - 닉네임 가리기는 모델에서 보이는 행만 적용
+            self.rows = [(i + 1, nickname, count, (count / total_chats) * 100 if total_chats > 0 else 0)
+                         for i, (user_id, count, nickname) in enumerate(islice(user_list, limit))]
+            self.max_rows = len(self.rows)
+
+            columns = [("순위", None, False), ("닉네임", lambda nickname: self.mask_nickname(nickname, mask_type), False),
+                       ("채팅수", "{:,}".format, True), ("점유율 (%)", "{:.3f}%".format, True)]
+            self.table_model = RankTableModel(columns, self.rows, parent=self)
+            self.table = create_rank_table(self.table_model, parent=self)
+            QTimer.singleShot(0, self.table.scrollToBottom)
+        except Exception as e:
+            traceback.print_exc()
+            QMessageBox.critical(self, "오류", f"결과 표시 중 오류가 발생했습니다: {e}")
+            return
 
-            html_content = """
+    def build_html(self):
+        """HTML 내보내기용 문서"""
+        import html
+        rows = []
+        for rank, nickname, count, percentage in sorted(self.rows):
+            rows.append(f"""
+                    <tr>
+                        <td class="rank-col">{rank}</td>
+                        <td>{html.escape(self.mask_nickname(nickname, self.mask_type))}</td>
+                        <td class="count-col">{count:,}</td>
+                        <td class="percent-col">{percentage:.3f}%</td>
+                    </tr>""")
+        return f"""
             <!DOCTYPE html>
             <html>
             <head>
-                <style>
-                    body { font-family: 'Pretendard JP', sans-serif; margin: 0; padding: 10px; }
-                    table { width: 100%; border-collapse: collapse; }
-                    th { background-color: #f2f2f2; padding: 10px; position: sticky; top: 0; z-index: 10; border-bottom: 2px solid #ddd; text-align: left;}
-                    td { padding: 8px; border-bottom: 1px solid #ddd; }
-                    tr { content-visibility: auto; contain-intrinsic-size: 30px; scroll-margin-top: 40px; }
-                    tr.highlight { background-color: #fff9c4; font-weight: bold; }
-                    .rank-col { width: 60px; text-align: center; }
-                    .count-col { width: 100px; text-align: right; }
-                    .percent-col { width: 100px; text-align: right; }
-                </style>
-                <script>
-                    function highlightRow(index) {
-                        var highlighted = document.querySelectorAll('tr.highlight');
-                        highlighted.forEach(function(row) {
-                            row.classList.remove('highlight');
-                        });
-                        
-                        var row = document.getElementById('row-' + index);
-                        if (row) {
-                            row.classList.add('highlight');
-                            row.scrollIntoView({behavior: "smooth", block: "start"});
-                        }
-                    }
-                    
-                    function scrollToBottom() {
-                        window.scrollTo(0, document.body.scrollHeight);
-                    }
-                </script>
+                <meta charset="utf-8">
+                <style>{RANK_HTML_STYLE}</style>
             </head>
             <body>
                 <table>
@@ -1601,51 +1645,12 @@ class UserStatsResultDialog(QDialog):
                             <th class="percent-col">점유율 (%)</th>
                         </tr>
                     </thead>
-                    <tbody>
-            """
-            
-            for i, (user_id, count, nickname) in enumerate(user_list):
-                percentage = (count / total_chats) * 100 if total_chats > 0 else 0
-                
-                display_name = nickname
-                if mask_type == "full":
-                    display_name = "*****"
-                elif mask_type == "half":
-                    if len(nickname) > 1:
-                        display_name = nickname[0] + "*" * (len(nickname) - 1)
-                    else:
-                        display_name = "*"
-                
-                html_content += f"""
-                    <tr id="row-{i}">
-                        <td class="rank-col">{i+1}</td>
-                        <td>{html.escape(display_name)}</td>
-                        <td class="count-col">{count:,}</td>
-                        <td class="percent-col">{percentage:.3f}%</td>
-                    </tr>
-                """
-                
-            html_content += """
+                    <tbody>{"".join(rows)}
                     </tbody>
                 </table>
             </body>
             </html>
             """
-            
-            self.web_view.setHtml(html_content)
-        except Exception as e:
-            traceback.print_exc()
-            QMessageBox.critical(self, "오류", f"HTML 생성 중 오류가 발생했습니다: {e}")
-            return
-
-    def on_load_finished(self, ok):
-        if ok:
-             QTimer.singleShot(100, lambda: self.web_view.page().runJavaScript("scrollToBottom()"))
-             QTimer.singleShot(200, self.show_webview)
-
-    def show_webview(self):
-        self.loading_label.hide()
-        self.web_view.show()
 
     def toggle_auto_scroll(self):
         if self.scroll_timer.isActive():
@@ -1658,9 +1663,9 @@ class UserStatsResultDialog(QDialog):
             self.highlight_and_schedule_next()
 
     def highlight_and_schedule_next(self):
-        row_index = self.current_scroll_rank - 1
-        
-        self.web_view.page().runJavaScript(f"highlightRow({row_index})")
+        row = self.table_model.highlight_rank(self.current_scroll_rank)
+        if row is not None:
+            self.table.scrollTo(self.table_model.index(row, 0), QAbstractItemView.ScrollHint.PositionAtTop)
 
         interval = 100
         if 50 < self.current_scroll_rank <= 100:
@@ -1683,6 +1688,10 @@ class UserStatsResultDialog(QDialog):
             self.scroll_button.setText("자동 스크롤 완료")
             self.scroll_timer.stop()
 
+    def closeEvent(self, event):
+        self.scroll_timer.stop()
+        super().closeEvent(event)
+
 
 
 class EmoticonSelectorDialog(QDialog):
@@ -20,6 +20,7 @@ from PyQt6.QtCore import QSizeF
 from app.resources import resource_path
 from app.constants import USERPATH, VERSION, BUILDNUMBER
 from app.ui_widgets import QToggle
+from app.services.video_meta_service import get_video_meta_service
 from PyQt6.QtWidgets import QSlider, QGridLayout
 
 
@@ -1240,6 +1241,7 @@ class OverlayWebPage(QWebEnginePage):
 
 class ChzzkOverlay(QMainWindow):
     closed = pyqtSignal()
+    video_type_detected = pyqtSignal(str, str) # video_id, "shorts"/"normal" (작업 스레드 -> GUI)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1297,6 +1299,8 @@ class ChzzkOverlay(QMainWindow):
         
         # 비디오 시작 신호 연결
         page.video_started_signal.connect(self.on_video_started)
+        self.current_video_id = None
+        self.video_type_detected.connect(self.apply_video_type)
         # 해상도 감지 신호 연결 (Auto-Rotation)
         page.resolution_detected_signal.connect(self.on_resolution_detected)
         
@@ -1362,23 +1366,11 @@ class ChzzkOverlay(QMainWindow):
                 print("[Overlay] Not a YouTube video, skipping YouTube-specific orientation logic.")
                 return
 
-            # parent().main_window.remote_tab 에 접근하여 영상 타입 확인
-            # parent는 VideoDonationTab 등의 탭일 가능성이 큼
+            # 영상 타입 확인은 작업 스레드에서 (캐시된 영상은 바로 적용)
             if self.parent() and hasattr(self.parent(), 'main_window'):
-                remote_tab = self.parent().main_window.remote_tab
-                if hasattr(remote_tab, 'get_youtube_video_type'):
-                    video_type = remote_tab.get_youtube_video_type(video_id)
-                    print(f"[Overlay] Detected Video Type: {video_type}")
-                    if video_type == "shorts":
-                        # 쇼츠면 세로 모드여야 함 (is_portrait가 True여야 함)
-                        if not self.is_portrait:
-                            print("[Overlay] Switching to Portrait Mode (Auto)")
-                            self.set_orientation(True)
-                    elif video_type == "normal": # normal
-                        # 일반 영상이면 가로 모드여야 함 (is_portrait가 False여야 함)
-                        if self.is_portrait:
-                            print("[Overlay] Switching to Landscape Mode (Auto)")
-                            self.set_orientation(False)
+                self.current_video_id = video_id
+                api_key = self.parent().main_window.settings_tab.youtube_api_key.text().strip()
+                get_video_meta_service().youtube_type_async(video_id, api_key, lambda video_type: self.video_type_detected.emit(video_id, video_type))
         except Exception as e:
             print(f"[Overlay] Auto-Orientation Error: {e}")
             try:
@@ -1388,6 +1380,21 @@ class ChzzkOverlay(QMainWindow):
             except Exception as e:
                 print(f"[Overlay] Auto-Orientation Error: {e}")
 
+    def apply_video_type(self, video_id, video_type):
+        """video_meta_service 가 확인한 영상 타입에 맞춰 방향 전환"""
+        if video_id != self.current_video_id: return # 그 사이 다음 영상이 시작됨
+        print(f"[Overlay] Detected Video Type: {video_type}")
+        if video_type == "shorts":
+            # 쇼츠면 세로 모드여야 함 (is_portrait가 True여야 함)
+            if not self.is_portrait:
+                print("[Overlay] Switching to Portrait Mode (Auto)")
+                self.set_orientation(True)
+        elif video_type == "normal": # normal
+            # 일반 영상이면 가로 모드여야 함 (is_portrait가 False여야 함)
+            if self.is_portrait:
+                print("[Overlay] Switching to Landscape Mode (Auto)")
+                self.set_orientation(False)
+
     def refresh_page(self, url: str = "", is_ui: bool = False):
         # 인자가 제공되지 않으면 parent에서 가져옴
         if not url:
@@ -6,13 +6,14 @@ from PyQt6.QtWidgets import (QCheckBox,
                              QComboBox, QGridLayout,
                              QHBoxLayout, QLabel, QLineEdit, QListWidget,
                              QPushButton, QSpinBox, QVBoxLayout, QWidget,
-                             QGroupBox, QFormLayout, QAbstractItemView)
-from PyQt6.QtGui import QPen, QPainterPath, QFontMetrics, QFont, QIcon, QDrag, QColor, QBrush, QPainter, QColor
+                             QGroupBox, QFormLayout, QAbstractItemView, QPlainTextEdit)
+from PyQt6.QtGui import QPen, QPainterPath, QFontMetrics, QFont, QIcon, QDrag, QColor, QBrush, QPainter, QColor, QTextCursor
 from PyQt6.QtCore import QRect, Qt, QMimeData, QUrl, QPoint, pyqtProperty, QPropertyAnimation, QEasingCurve, QSettings, QTimer
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile
 from PyQt6.QtWebEngineCore import QWebEngineSettings
 from datetime import datetime, timedelta
+from collections import deque
 
 from app.resources import resource_path
 from app.constants import USERPATH
@@ -470,6 +471,99 @@ class TestOverlayDialog(QWidget):
 
 
 
+CHAT_VIEW_MAX_LINES = 50
+
+
+class ChatView(QPlainTextEdit):
+    """
+    최근 max_lines 줄만 유지하는 채팅 표시창 (읽기 전용, 줄 추가만 함)
+    - 문서 전체를 다시 만들지 않고 끝에 줄을 붙이며, 오래된 줄은 QPlainTextEdit 최대 블록 수로 자동 삭제됩니다.
+    - 스크롤을 위로 올리면 화면을 멈추고 새 채팅은 따로 모아둡니다. (맨 아래로 내리거나 '새 채팅' 버튼을 누르면 이어서 표시)
+    - 기존 QTextEdit 처럼 setText()/append() 도 사용할 수 있습니다.
+    """
+    def __init__(self, max_lines=CHAT_VIEW_MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.max_lines = max(1, int(max_lines))
+        self.setMaximumBlockCount(self.max_lines)
+        self.frozen = False
+        self.pending = deque(maxlen=self.max_lines) # 멈춘 동안 들어온 줄
+        self.pending_count = 0
+
+        self.new_chat_button = QPushButton(self)
+        self.new_chat_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.new_chat_button.clicked.connect(self.scroll_to_bottom)
+        self.new_chat_button.hide()
+        self.verticalScrollBar().actionTriggered.connect(lambda action: QTimer.singleShot(0, self.on_user_scroll))
+        self.verticalScrollBar().valueChanged.connect(lambda value: self.frozen and self.is_at_bottom() and self.resume())
+
+    def is_at_bottom(self):
+        bar = self.verticalScrollBar()
+        return bar.value() >= bar.maximum() - 1
+
+    def append_lines(self, lines):
+        """줄 목록을 한 번에 추가 (멈춘 상태면 모아둠)"""
+        if not lines: return
+        if self.frozen:
+            self.pending.extend(lines)
+            self.pending_count += len(lines)
+            self.new_chat_button.setText(f"▼ 새 채팅 {self.pending_count}개")
+            self.new_chat_button.adjustSize()
+            self.place_new_chat_button()
+            self.new_chat_button.show()
+            return
+        self._insert_lines(lines)
+
+    def _insert_lines(self, lines):
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        if not self.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText("\n".join(lines))
+        cursor.endEditBlock()
+        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+    def append(self, text):
+        self.append_lines([text])
+
+    def setText(self, text):
+        """내용을 text 로 바꾸고 멈춤 상태를 해제"""
+        self.pending.clear()
+        self.pending_count = 0
+        self.frozen = False
+        self.new_chat_button.hide()
+        self.setPlainText(text)
+        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+    def on_user_scroll(self):
+        """사용자가 스크롤바/마우스 휠로 스크롤함 -> 맨 아래가 아니면 화면 멈춤"""
+        if not self.frozen and not self.is_at_bottom():
+            self.frozen = True
+
+    def scroll_to_bottom(self):
+        self.resume()
+        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+    def resume(self):
+        """멈춘 동안 모아둔 줄을 표시하고 자동 스크롤을 다시 시작"""
+        self.frozen = False
+        self.new_chat_button.hide()
+        pending, self.pending = list(self.pending), deque(maxlen=self.max_lines)
+        self.pending_count = 0
+        if pending: self._insert_lines(pending)
+
+    def place_new_chat_button(self):
+        viewport = self.viewport().geometry()
+        button = self.new_chat_button
+        button.move(viewport.right() - button.width() - 8, viewport.bottom() - button.height() - 8)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.new_chat_button.isVisible(): self.place_new_chat_button()
+
+
 class VoteBar(QWidget):
     def __init__(self, total_votes, voters, parent=None):
         super().__init__(parent)
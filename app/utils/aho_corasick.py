@@ -0,0 +1,76 @@
+"""
+여러 단어/이모티콘을 한 번에 세는 Aho-Corasick 자동자
+
+채팅 통계의 '여러 개 한 번에' 모드에서 사용합니다.
+메시지를 한 글자씩 한 번만 훑으면서 등록한 모든 패턴의 등장 횟수를 셉니다.
+횟수는 패턴마다 str.count 와 같이 겹치지 않게(왼쪽부터) 셉니다.
+"""
+
+from collections import deque
+
+
+class MultiPatternCounter:
+    def __init__(self, patterns):
+        """patterns: {패턴 문자열: 결과 이름} - 여러 패턴을 같은 이름으로 합산할 수 있음"""
+        self.labels = []
+        self._goto = [{}]   # 노드별 {글자: 다음 노드}
+        self._fail = [0]
+        self._out = [()]    # 노드별 ((패턴 번호, 패턴 길이), ...) - 실패 링크의 출력 포함
+        self._pattern_labels = []
+        for pattern, label in patterns.items():
+            if not pattern: continue
+            self._add(pattern, label)
+        self._build()
+
+    def _add(self, pattern, label):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        pattern_id = len(self._pattern_labels)
+        self._pattern_labels.append(label)
+        self._out[node] = self._out[node] + ((pattern_id, len(pattern)),)
+        if label not in self.labels:
+            self.labels.append(label)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = fail if fail != nxt else 0
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def count(self, text, weight=1, counts=None):
+        """text 에서 찾은 패턴 수 * weight 를 counts({결과 이름: 횟수})에 더해서 반환"""
+        if counts is None:
+            counts = dict.fromkeys(self.labels, 0)
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        pattern_labels = self._pattern_labels
+        last_end = {} # 패턴 번호 -> 마지막으로 센 위치의 끝 (겹치는 등장은 세지 않음)
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                for pattern_id, length in out[node]:
+                    if i + 1 - length >= last_end.get(pattern_id, 0):
+                        last_end[pattern_id] = i + 1
+                        label = pattern_labels[pattern_id]
+                        counts[label] += weight
+        return counts
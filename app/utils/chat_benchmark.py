@@ -0,0 +1,175 @@
+"""
+채팅 로그 검색/분석 벤치마크 (화면 없이 실행)
+
+가상 채팅 로그(chat_corpus)를 만들거나 기존 로그 폴더를 사용해 채팅부검 검색과 채팅 통계 작업 시간을 측정합니다.
+- 검색: 파일 목록, 색인 생성/동기화, 아이디 찾기(search_id), 유저/채팅 내용 검색(ChatLogSearchWorker)
+- 분석: 채팅 통계(ChatStatsWorker, 캐시 없음/있음), 특정 단어/여러 이모티콘 횟수, 채팅 급증 구간(ChatTimelineWorker)
+- 각 항목은 repeat 번 실행한 가장 빠른 시간을 기록합니다.
+  --save 로 결과를 저장하고 --compare 로 이전 결과보다 tolerance 이상 느려진 항목을 표시합니다. (느려진 항목이 있으면 종료 코드 1)
+- 명령줄: python -m app.utils.chat_benchmark [--log-dir 폴더 | --days 30] [--repeat 3] [--save result.json] [--compare baseline.json]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+from datetime import date, datetime, timedelta
+
+from app.utils.chat_corpus import ChatCorpusGenerator
+
+DEFAULT_TOLERANCE = 0.25 # 25% 이상 느려지면 회귀
+MIN_REGRESSION_SECONDS = 0.005 # 이보다 작은 차이는 측정 오차로 봄
+
+
+def run_worker(worker):
+    """QThread 작업을 현재 스레드에서 실행하고 finished/error 결과를 반환"""
+    result = {}
+    worker.finished.connect(lambda data: result.update(data))
+    worker.error.connect(lambda message: result.update(error=message))
+    worker.run()
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    return result
+
+
+def busiest_users(log_dir, file_names, count=5):
+    """가장 채팅이 많은 유저 닉네임 (검색 대상)"""
+    from app.services.chat_stats_cache import load_day_stats
+    users = {}
+    for file_name in file_names:
+        for user_id, (chats, nick) in load_day_stats(log_dir, file_name)["users"].items():
+            total = users.get(user_id, (0, nick))[0] + chats
+            users[user_id] = (total, nick)
+    return [nick for total, nick in sorted(users.values(), reverse=True)[:count]]
+
+
+def build_cases(log_dir):
+    """(이름, 준비 함수 또는 None, 측정 함수) 목록"""
+    from app.services.chat_log_catalog import get_chat_log_catalog
+    from app.services.chat_log_index import get_chat_log_index
+    from app.services.chat_stats_cache import STATS_DIR_NAME
+    from app.tabs.chat_log_search_tab import ChatLogSearchWorker
+    from app.ui_chat_counter import ChatStatsWorker, ChatTimelineWorker
+    from app.utils.chat_corpus import load_emoticon_names
+
+    catalog = get_chat_log_catalog(log_dir)
+    file_names = catalog.names()
+    dated = catalog.files(start_date=date.min)
+    start_date, end_date = dated[0].date, dated[-1].date
+    chat_index = get_chat_log_index(log_dir)
+    stats_dir = os.path.join(log_dir, STATS_DIR_NAME)
+    cutoff = datetime.combine(end_date, datetime.min.time()) - timedelta(hours=72)
+    nicks = busiest_users(log_dir, file_names[-3:])
+    totals_holder = {}
+
+    def clear_stats_cache():
+        shutil.rmtree(stats_dir, ignore_errors=True)
+
+    def stats(parallel):
+        result = run_worker(ChatStatsWorker(log_dir, start_date, end_date, parallel))
+        totals_holder["totals"] = result["totals"]
+        return result
+
+    def search(search_type, search, limit):
+        return run_worker(ChatLogSearchWorker(log_dir, search_type, search, False, limit, cutoff))
+
+    emoticons = tuple(load_emoticon_names()[:100])
+    return [
+        ("catalog.scan", catalog.invalidate, lambda: catalog.names()),
+        ("index.rebuild", None, lambda: chat_index.rebuild()),
+        ("index.sync", None, lambda: chat_index.sync()),
+        ("search_id", None, lambda: [chat_index.sync() and chat_index.find_user(nick) for nick in nicks]),
+        ("search_log.user_100", None, lambda: search("아이디/닉네임", nicks[0], 100)),
+        ("search_log.user_all", None, lambda: search("아이디/닉네임", nicks[0], None)),
+        ("search_log.content", None, lambda: search("채팅 내용", "레전드", 100)),
+        ("stats.cold_serial", clear_stats_cache, lambda: stats(False)),
+        ("stats.cold_parallel", clear_stats_cache, lambda: stats(True)),
+        ("stats.warm", None, lambda: stats(True)),
+        ("stats.char_count", None, lambda: totals_holder["totals"].char_count_result("ㅋ")),
+        ("stats.multi_count", None, lambda: totals_holder["totals"].multi_count_result(emoticons)),
+        ("timeline.spikes", None, lambda: run_worker(ChatTimelineWorker(log_dir, start_date, end_date))),
+    ]
+
+
+def run_benchmarks(log_dir, repeat=3, only=None):
+    """{항목 이름: 가장 빠른 시간(초)}"""
+    results = {}
+    for name, setup, func in build_cases(log_dir):
+        if only and not any(name.startswith(prefix) for prefix in only): continue
+        best = None
+        for _ in range(repeat):
+            if setup: setup()
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+        print(f"{name:<22} {best * 1000:10.1f} ms")
+    return results
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """이전 결과와 비교해 느려진 항목 이름 목록을 반환"""
+    regressions = []
+    print(f"\n{'name':<22} {'before':>10} {'after':>10} {'change':>8}")
+    for name, seconds in results.items():
+        before = baseline.get(name)
+        if before is None: continue
+        change = (seconds - before) / before if before > 0 else 0.0
+        mark = ""
+        if change > tolerance and seconds - before > MIN_REGRESSION_SECONDS:
+            mark = "  << REGRESSION"
+            regressions.append(name)
+        print(f"{name:<22} {before * 1000:8.1f}ms {seconds * 1000:8.1f}ms {change * 100:+7.1f}%{mark}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="채팅 로그 검색/분석 벤치마크")
+    parser.add_argument("--log-dir", help="기존 로그 폴더 (없으면 가상 로그를 임시 폴더에 생성)")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--chats-per-hour", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="이름이 이 값으로 시작하는 항목만 실행 (예: stats search_log)")
+    parser.add_argument("--save", help="결과를 JSON 으로 저장")
+    parser.add_argument("--compare", help="이전 결과 JSON 과 비교")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    temp_dir = None
+    log_dir = args.log_dir
+    if not log_dir:
+        temp_dir = tempfile.mkdtemp(prefix="bcu_chat_bench_")
+        log_dir = temp_dir
+        generator = ChatCorpusGenerator(args.users, args.chats_per_hour, seed=args.seed)
+        started = time.perf_counter()
+        files = generator.write(log_dir, date(2025, 1, 1), args.days)
+        print(f"[ChatBenchmark] {len(files)} log files generated in {time.perf_counter() - started:.1f}s ({log_dir})")
+
+    try:
+        results = run_benchmarks(log_dir, args.repeat, args.only)
+    finally:
+        if temp_dir:
+            from app.services.chat_log_index import get_chat_log_index
+            get_chat_log_index(temp_dir).close()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n[ChatBenchmark] {len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+가상 채팅 로그 생성기 (벤치마크/검증용)
+
+Chatroom_Connector 가 기록하는 것과 같은 형식의 일별 로그 파일(YYYY-MM-DD_#<채널 아이디>.log)을 만듭니다.
+- 유저 활동량과 채팅 문구는 Zipf 분포를 따르며 (소수의 유저/문구가 대부분을 차지), 이모티콘과 후원/구독 이벤트 줄을 섞습니다.
+- 방송은 하루 한 번(방송 쉬는 날 포함), 방송 중 가끔 채팅이 몰리는 순간(급증)이 있습니다.
+- 같은 seed 면 항상 같은 로그가 만들어집니다.
+- 명령줄: python -m app.utils.chat_corpus <출력 폴더> [--days 90] [--users 5000] [--chats-per-hour 3000] [--seed 1]
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+from bisect import bisect
+from itertools import accumulate
+from datetime import date, datetime, timedelta
+
+DEFAULT_CHANNEL_ID = "0123456789abcdef0123456789abcdef"
+DEFAULT_EMOTICONS = ["{:d_1:}", "{:d_2:}", "{:d_33:}", "{:d_47:}", "{:lck_28:}"]
+_SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후김이박최정강윤장임한"
+_PHRASES = [
+    "ㅋㅋㅋ", "ㅋㅋㅋㅋㅋ", "ㅋㅋ", "ㅎㅇ", "ㅎㅇㅎㅇ", "헉", "와", "오", "ㄷㄷ", "ㄷㄷㄷ", "?", "??", "!!!",
+    "ㅠㅠ", "ㅜㅜ", "굿", "나이스", "ㄱㄱ", "ㅇㅇ", "아니", "진짜", "미쳤다", "개웃기네", "이게 되네",
+    "클립각", "ㅋㅋㅋㅋ 뭐야", "안녕하세요", "하이요", "오늘 방송 재밌다", "저녁 먹었어요?", "이거 몇 판째임",
+    "다음 게임 뭐해요", "ㅋㅋㅋ 레전드", "방금 그거 뭐임", "ㄹㅇ", "인정", "ㄴㄴ", "가보자고", "화이팅", "수고하셨습니다",
+]
+
+
+class ZipfSampler:
+    """0 ~ n-1 을 Zipf(s) 분포로 뽑음 (0 이 가장 자주 나옴)"""
+    def __init__(self, n, s, rng):
+        self._cum = list(accumulate(1.0 / (rank ** s) for rank in range(1, n + 1)))
+        self._total = self._cum[-1]
+        self._rng = rng
+
+    def sample(self):
+        return bisect(self._cum, self._rng.random() * self._total)
+
+
+def load_emoticon_names():
+    """앱 기본 chat_emoticons.json 의 이모티콘 이름 (없으면 기본 목록)"""
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "chat_emoticons.json")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return list(json.load(f).keys()) or DEFAULT_EMOTICONS
+    except Exception:
+        return DEFAULT_EMOTICONS
+
+
+class ChatCorpusGenerator:
+    def __init__(self, users=5000, chats_per_hour=3000, zipf_s=1.1, emoticon_rate=0.15, event_rate=0.004,
+                 spike_per_hour=2.0, channel_id=DEFAULT_CHANNEL_ID, seed=1):
+        self.rng = random.Random(seed)
+        self.channel_id = channel_id
+        self.chats_per_hour = chats_per_hour
+        self.emoticon_rate = emoticon_rate
+        self.event_rate = event_rate
+        self.spike_per_hour = spike_per_hour
+        self.users = [(self._nickname(), "%032x" % self.rng.getrandbits(128)) for _ in range(users)]
+        self.user_sampler = ZipfSampler(users, zipf_s, self.rng)
+        self.phrase_sampler = ZipfSampler(len(_PHRASES), zipf_s, self.rng)
+        self.emoticons = load_emoticon_names()
+        self.emoticon_sampler = ZipfSampler(len(self.emoticons), zipf_s, self.rng)
+
+    def _nickname(self):
+        return "".join(self.rng.choice(_SYLLABLES) for _ in range(self.rng.randint(2, 6))) + (str(self.rng.randint(1, 999)) if self.rng.random() < 0.3 else "")
+
+    def random_message(self):
+        """Zipf 분포로 고른 채팅 문구 (가끔 이모티콘 포함)"""
+        rng = self.rng
+        msg = _PHRASES[self.phrase_sampler.sample()]
+        if rng.random() < self.emoticon_rate:
+            emoticon = self.emoticons[self.emoticon_sampler.sample()]
+            msg = emoticon * rng.randint(1, 3) if rng.random() < 0.5 else f"{msg} {emoticon}"
+        return msg
+
+    def _event(self, time_str, nick, user_id):
+        """후원/구독 이벤트 줄 (chat_connector 와 같은 형식)"""
+        rng = self.rng
+        kind = rng.random()
+        if kind < 0.5:
+            if rng.random() < 0.2:
+                nick, user_id = "익명의 후원자", f"anon{time_str[11:].replace(':', '')}"
+            return f"[{time_str}] <{nick} ({user_id})> 🟥⭐ 일반후원 {rng.choice((1000, 1000, 2000, 5000, 10000))}치즈 후원! ⭐🟥 후원 메시지: {self.random_message()}"
+        if kind < 0.6:
+            return f"[{time_str}] <{nick} ({user_id})> 🟥⭐ 영상후원 {rng.choice((3000, 5000, 10000))}치즈 후원! ⭐🟥 영상 제목: {self.random_message()}"
+        if kind < 0.9:
+            return f"[{time_str}] <{nick} ({user_id})> 🟥⭐ {nick}님이 {rng.randint(1, 2)}티어 {rng.randint(1, 36)}개월 정기구독을 갱신하였습니다! ⭐🟥 기념 메시지: {self.random_message()}"
+        return f"[{time_str}] <{nick} ({user_id})> 🟥⭐ {nick}님이 1티어 구독권 {rng.choice((1, 5, 10))}개를 선물했습니다! ⭐🟥"
+
+    def day_lines(self, day, start_hour=None, hours=None):
+        """하루 방송의 로그 줄 (시간순)"""
+        rng = self.rng
+        if start_hour is None: start_hour = rng.uniform(17, 21)
+        if hours is None: hours = rng.uniform(2, 6)
+        start = datetime.combine(day, datetime.min.time()) + timedelta(hours=start_hour)
+        duration = int(hours * 3600)
+        # 급증 구간: (시작 초, 길이, 배율)
+        spikes = [(rng.randrange(duration), rng.randint(5, 20), rng.uniform(4, 12))
+                  for _ in range(int(hours * self.spike_per_hour))]
+        base_rate = self.chats_per_hour / 3600.0
+        lines = []
+        second = 0.0
+        while True:
+            rate = base_rate
+            for spike_start, spike_len, factor in spikes:
+                if spike_start <= second < spike_start + spike_len:
+                    rate *= factor
+            second += rng.expovariate(rate)
+            if second >= duration: break
+            now = start + timedelta(seconds=int(second))
+            time_str = now.strftime("%Y-%m-%d %H:%M:%S")
+            nick, user_id = self.users[self.user_sampler.sample()]
+            if rng.random() < self.event_rate:
+                lines.append(self._event(time_str, nick, user_id))
+            else:
+                lines.append(f"[{time_str}] <{nick} ({user_id})> {self.random_message()}")
+        return lines
+
+    def write(self, out_dir, start_date, days, off_day_rate=0.15, progress_callback=None):
+        """start_date 부터 days 일의 로그 파일을 쓰고 파일명 목록을 반환 (방송 쉬는 날은 파일 없음)"""
+        os.makedirs(out_dir, exist_ok=True)
+        written = []
+        pending = {} # 파일명 -> 아직 쓰지 않은 줄 목록
+        for i in range(days):
+            day = start_date + timedelta(days=i)
+            if self.rng.random() >= off_day_rate:
+                for line in self.day_lines(day): # 자정을 넘긴 줄은 ChatLogWriter 처럼 다음 날짜 파일에 기록
+                    pending.setdefault(f"{line[1:11]}_#{self.channel_id}.log", []).append(line)
+            for file_name in sorted(name for name in pending if name[:10] <= day.isoformat()):
+                with open(os.path.join(out_dir, file_name), "w", encoding="UTF8") as f:
+                    f.write("\n".join(pending.pop(file_name)) + "\n")
+                written.append(file_name)
+            if progress_callback: progress_callback(i + 1, days, day.isoformat())
+        for file_name in sorted(pending):
+            with open(os.path.join(out_dir, file_name), "w", encoding="UTF8") as f:
+                f.write("\n".join(pending[file_name]) + "\n")
+            written.append(file_name)
+        return sorted(set(written))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="가상 채팅 로그 생성")
+    parser.add_argument("out_dir")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--start", default=None, help="시작 날짜 YYYY-MM-DD (기본: 오늘 - days)")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--chats-per-hour", type=int, default=3000)
+    parser.add_argument("--zipf", type=float, default=1.1)
+    parser.add_argument("--channel", default=DEFAULT_CHANNEL_ID)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    start = date.fromisoformat(args.start) if args.start else date.today() - timedelta(days=args.days)
+    generator = ChatCorpusGenerator(args.users, args.chats_per_hour, args.zipf, channel_id=args.channel, seed=args.seed)
+    files = generator.write(args.out_dir, start, args.days, progress_callback=lambda i, total, day: print(f"[{i}/{total}] {day}", end="\r"))
+    print(f"\n[ChatCorpus] {len(files)} files written to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
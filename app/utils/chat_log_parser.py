@@ -0,0 +1,109 @@
+"""
+채팅 로그 한 줄 파서
+
+[YYYY-MM-DD HH:MM:SS] <닉네임 (아이디)> 메시지 형식의 줄을 한 번에 분해합니다.
+- 시간은 strptime 대신 고정 위치의 숫자를 읽어 초 단위 정수로 변환합니다. (날짜별 0시 값은 캐시)
+- 채팅 통계(ui_chat_counter), 채팅부검 탭, 채팅 로그 색인이 모두 이 파서를 사용합니다.
+- 마이크로 벤치마크: python -m app.utils.chat_log_parser [로그 파일]
+"""
+
+import sys
+import time
+import calendar
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+EVENT_MARK = "🟥⭐" # 후원/구독 등 이벤트 줄 표시
+
+_EPOCH = datetime(1970, 1, 1)
+_day_seconds = {} # {"YYYY-MM-DD": 해당 날짜 0시의 초 단위 시간}
+
+
+class ChatRecord(NamedTuple):
+    timestamp: int # 로그에 기록된 시각 (초 단위, 시간대 변환 없음)
+    nick: str
+    id: str
+    msg: str
+    is_event: bool
+
+
+def decode_timestamp(text, start=0):
+    """text[start:start+19] 의 'YYYY-MM-DD HH:MM:SS'를 초 단위 정수로 변환. 형식이 아니면 None"""
+    day_key = text[start:start + 10]
+    try:
+        day = _day_seconds.get(day_key)
+        if day is None:
+            day = calendar.timegm((int(text[start:start + 4]), int(text[start + 5:start + 7]), int(text[start + 8:start + 10]), 0, 0, 0, 0, 0, 0))
+            _day_seconds[day_key] = day
+        return day + int(text[start + 11:start + 13]) * 3600 + int(text[start + 14:start + 16]) * 60 + int(text[start + 17:start + 19])
+    except ValueError:
+        return None
+
+
+def line_timestamp(line):
+    """[YYYY-MM-DD HH:MM:SS] 로 시작하는 줄의 시각. 형식이 아니면 None"""
+    if line[:1] != "[" or line[20:21] != "]": return None
+    return decode_timestamp(line, 1)
+
+
+def to_datetime(timestamp):
+    """decode_timestamp 결과를 datetime 으로 변환"""
+    return _EPOCH + timedelta(seconds=timestamp)
+
+
+def parse_line(line):
+    """로그 한 줄을 ChatRecord 로 변환. 채팅 형식이 아니면 None
+    아이디가 없는 줄(<닉네임> 메시지)은 닉네임을 아이디로 사용합니다."""
+    if line[:1] != "[" or line[20:23] != "] <": return None
+    meta_end = line.find(")> ", 23)
+    if meta_end != -1:
+        id_start = line.rfind(" (", 23, meta_end)
+        if id_start == -1: return None
+        nick = line[23:id_start]
+        id_val = line[id_start + 2:meta_end]
+        msg_start = meta_end + 3
+    else:
+        meta_end = line.find("> ", 23)
+        if meta_end == -1: return None
+        nick = id_val = line[23:meta_end]
+        msg_start = meta_end + 2
+    timestamp = decode_timestamp(line, 1)
+    if timestamp is None: return None
+    msg = line[msg_start:].rstrip("\r\n")
+    return ChatRecord(timestamp, nick, id_val, msg, EVENT_MARK in msg)
+
+
+def _legacy_parse(line):
+    """이전 방식 (split + strptime) - 벤치마크 비교용"""
+    chat_date = datetime.strptime(line.split("]")[0].split("[")[1], "%Y-%m-%d %H:%M:%S")
+    id_start = line.find(" (") + 2
+    id_end = line.find(")> ")
+    id_val = line[id_start:id_end]
+    nick = line[line.find("] <") + 3:id_start - 2]
+    msg = line.split(f"{id_val})> ")[1].strip()
+    return chat_date, nick, id_val, msg, EVENT_MARK in line
+
+
+def _benchmark(lines, repeat=5):
+    for name, func in (("legacy", _legacy_parse), ("parse_line", parse_line)):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for line in lines:
+                try:
+                    func(line)
+                except (IndexError, ValueError):
+                    pass
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:>10}: {best * 1000:8.1f} ms, {len(lines) / best:12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "r", encoding="utf-8", errors="ignore") as f:
+            sample = [line.rstrip("\n") for line in f]
+    else:
+        sample = [f"[2025-01-{1 + i // 86400 % 28:02d} {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}] <닉네임{i % 500} (user{i % 500:04x})> 채팅 메시지 {i} ㅋㅋㅋ" for i in range(200000)]
+    print(f"{len(sample):,} lines")
+    _benchmark(sample)
@@ -0,0 +1,112 @@
+"""
+채팅 이벤트 재생기 (화면 없이 실행)
+
+ChatEventRecorder 로 녹화한 파일을 실제 방송과 같은 경로(MessageBatcher -> BetterCheeseUtil.message_batch)로 다시 흘려보내고
+처리량과 지연 시간(이벤트 전달 ~ message_batch 처리 완료)을 측정합니다.
+- 재생 속도: 1 (녹화 그대로), N (N배속), 0 (최대 속도)
+- Qt offscreen 플랫폼에서 실행하므로 창이 뜨지 않습니다.
+- 명령줄: python -m app.utils.chat_replay <녹화 파일.jsonl.gz> [--speed 1] [--limit 10000]
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+
+def percentile(sorted_values, ratio):
+    if not sorted_values: return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * ratio))]
+
+
+def replay(window, events, speed=1.0, timeout=None):
+    """events [(경과 초, ChatEvent), ...] 를 window.message_batcher 로 재생하고 결과 dict 를 반환"""
+    from PyQt6.QtCore import QCoreApplication, QEventLoop
+
+    app = QCoreApplication.instance()
+    batcher = window.message_batcher
+    pushed = {} # id(event) -> 전달 시각
+    latencies = []
+
+    def on_batch(batch): # message_batch 다음에 연결되어 처리 완료 후 호출됨
+        now = time.perf_counter()
+        for event in batch:
+            latencies.append(now - pushed.pop(id(event), now))
+    batcher.batch.connect(on_batch)
+
+    feeding_done = threading.Event()
+    def feed(): # 커넥터 스레드 역할
+        start = time.perf_counter()
+        for offset, event in events:
+            if speed > 0:
+                wait = start + offset / speed - time.perf_counter()
+                if wait > 0: time.sleep(wait)
+            pushed[id(event)] = time.perf_counter()
+            batcher.push(event)
+        feeding_done.set()
+
+    started = time.perf_counter()
+    threading.Thread(target=feed, name="ChatReplay", daemon=True).start()
+    try:
+        while not (feeding_done.is_set() and len(latencies) >= len(events)):
+            app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 50)
+            if timeout and time.perf_counter() - started > timeout:
+                print(f"[ChatReplay] Timed out after {timeout}s ({len(latencies)}/{len(events)} events handled)")
+                break
+    finally:
+        batcher.batch.disconnect(on_batch)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "events": len(latencies),
+        "seconds": round(elapsed, 3),
+        "events_per_second": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        "latency_p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "latency_p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "latency_p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "latency_max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        "batcher": batcher.stats(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="녹화한 채팅 이벤트 재생 벤치마크")
+    parser.add_argument("capture")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0: 최대 속도)")
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 이 개수만 재생")
+    parser.add_argument("--timeout", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    from app.services.chat_event_recorder import read_capture
+
+    header, events = read_capture(args.capture)
+    if args.limit: events = events[:args.limit]
+    if not events:
+        print("[ChatReplay] No events in capture")
+        return 1
+    span = events[-1][0] - events[0][0]
+    print(f"[ChatReplay] {len(events)} events over {span:.1f}s (channel {header.get('channel', '?')}, recorded {header.get('started', '?')})")
+    if events[0][0] > 0: # 첫 이벤트까지 기다리지 않음
+        first = events[0][0]
+        events = [(offset - first, event) for offset, event in events]
+
+    app = QApplication(sys.argv)
+    from app.main_window import BetterCheeseUtil
+    window = BetterCheeseUtil()
+    result = replay(window, events, args.speed, args.timeout)
+
+    batcher = result.pop("batcher")
+    for key, value in result.items():
+        print(f"{key:<20} {value}")
+    print(f"{'batches':<20} {batcher['batches']} (avg wait {batcher['avg_latency_ms']}ms, max wait {batcher['max_latency_ms']}ms)")
+    window.close()
+    app.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""
+채팅 폭주 부하 테스트 (화면 없이 실행)
+
+ChatSimulator 로 채팅/치즈후원/영상후원/미션 이벤트를 초당 N개씩 만들어 BetterCheeseUtil 의 메시지 처리 경로
+(MessageBatcher -> message_batch)에 흘려보내고, 초당 몇 개까지 밀리지 않고 처리하는지 측정합니다.
+- 닉네임/아이디는 chat_corpus 와 같은 Zipf 분포 유저 목록을 사용하고, 일부 채팅/후원은 "!투표 3" 같은 투표 명령입니다.
+- 단계마다 (--rates) seconds 초 동안 부하를 주고 다음을 출력합니다.
+  처리량, 지연 시간(p50/p95/max), GUI 스레드 점유율(batch 처리 시간 / 경과 시간), 끊긴 프레임 수(16ms 타이머 기준), 탭별 처리 시간
+- 처리량이 목표의 95% 미만이거나 p95 지연이 1초를 넘으면 "밀림"으로 보고 멈춥니다.
+- 명령줄: python -m app.utils.chat_storm [--rates 50 100 200 400 800] [--seconds 5] [--vote] [--pick]
+"""
+
+import os
+import sys
+import time
+import types
+import argparse
+import threading
+from datetime import datetime, timedelta
+
+from app.utils.chat_corpus import ChatCorpusGenerator
+from app.utils.chat_replay import percentile
+
+FRAME_MS = 16
+MAX_P95_LATENCY = 1.0 # 초
+MIN_HANDLED_RATIO = 0.95
+DRAIN_SECONDS = 3.0 # 부하가 끝난 후 남은 이벤트 처리를 기다리는 최대 시간
+
+# (보고 이름, 메인 윈도우 속성, 처리 함수 이름) - message_batch 가 호출하는 탭별 처리기
+TAB_HANDLERS = [
+    ("chatroom", "chatroom_tab", "append_result_chats"),
+    ("video", "video_donation_tab", "process_videodonation"),
+    ("remote", "remote_tab", "process_donation_message"),
+    ("vote", "vote_tab", "process_vote_messages"),
+    ("pick", "pick_tab", "process_pick_messages"),
+]
+
+
+class ChatStormGenerator:
+    """ChatSimulator 에 가상 이벤트를 넣어 test_message(ChatEvent)를 발생시킴"""
+    def __init__(self, simulator, users=2000, donation_ratio=0.01, video_ratio=0.002, mission_ratio=0.001,
+                 vote_ratio=0.05, vote_options=4, seed=1):
+        self.simulator = simulator
+        self.corpus = ChatCorpusGenerator(users, seed=seed)
+        self.rng = self.corpus.rng
+        self.donation_ratio = donation_ratio
+        self.video_ratio = video_ratio
+        self.mission_ratio = mission_ratio
+        self.vote_ratio = vote_ratio
+        self.vote_options = vote_options
+
+    def _vote_or_message(self, vote_ratio):
+        if self.rng.random() < vote_ratio:
+            return f"!투표 {self.rng.randint(1, self.vote_options)}"
+        return self.corpus.random_message()
+
+    def fire(self):
+        """이벤트 한 건 발생"""
+        rng = self.rng
+        nick, user_id = self.corpus.users[self.corpus.user_sampler.sample()]
+        now = datetime.now() - timedelta(hours=9) # ChatSimulator 가 한국 시간으로 바꿈
+        profile = types.SimpleNamespace(nickname=nick, user_id_hash=user_id, tier=rng.choice((1, 1, 1, 2)))
+        roll = rng.random()
+
+        if roll < self.donation_ratio:
+            extras = types.SimpleNamespace(is_anonymous=rng.random() < 0.1, pay_amount=rng.choice((1000, 1000, 2000, 5000, 10000)), donation_type='CHAT')
+            self.simulator.on_donation(types.SimpleNamespace(profile=profile, time=now, extras=extras, content=self._vote_or_message(0.3)))
+            return
+        roll -= self.donation_ratio
+        if roll < self.video_ratio:
+            extras = types.SimpleNamespace(is_anonymous=False, pay_amount=rng.choice((3000, 5000, 10000)), donation_type='VIDEO')
+            self.simulator.on_donation(types.SimpleNamespace(profile=profile, time=now, extras=extras, content=self.corpus.random_message()))
+            return
+        roll -= self.video_ratio
+        if roll < self.mission_ratio:
+            cheese = rng.choice((1000, 5000, 10000))
+            mission = types.SimpleNamespace(is_anonymous=rng.random() < 0.1, nickname=nick, user_id_hash=user_id, pay_amount=cheese,
+                                            total_pay_amount=cheese * rng.randint(1, 5), participation_count=rng.randint(1, 10),
+                                            success=rng.random() < 0.7, mission_text=self.corpus.random_message())
+            rng.choice((self.simulator.on_mission_pending, self.simulator.on_mission_update_cost, self.simulator.on_mission_completed))(mission)
+            return
+        self.simulator.on_chat(types.SimpleNamespace(profile=profile, time=now, content=self._vote_or_message(self.vote_ratio)))
+
+
+class HandlerTimer:
+    """탭 처리 함수를 감싸 호출 시간 합계를 잼 (측정이 끝나면 restore)"""
+    def __init__(self, window):
+        self.window = window
+        self.totals = {name: 0.0 for name, _, _ in TAB_HANDLERS}
+        for name, tab_name, method_name in TAB_HANDLERS:
+            tab = getattr(window, tab_name)
+            setattr(tab, method_name, self._wrap(name, getattr(tab, method_name)))
+
+    def _wrap(self, name, func):
+        def timed(*args):
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.totals[name] += time.perf_counter() - started
+        return timed
+
+    def reset(self):
+        for name in self.totals: self.totals[name] = 0.0
+
+    def restore(self):
+        for name, tab_name, method_name in TAB_HANDLERS:
+            tab = getattr(self.window, tab_name)
+            if method_name in vars(tab): delattr(tab, method_name)
+
+
+class FrameMonitor:
+    """GUI 스레드에서 FRAME_MS 타이머가 늦게 울린 만큼을 끊긴 프레임으로 셈"""
+    def __init__(self):
+        from PyQt6.QtCore import QTimer
+        self.timer = QTimer()
+        self.timer.timeout.connect(self._tick)
+        self.reset()
+
+    def reset(self):
+        self.last = time.perf_counter()
+        self.frames = 0
+        self.dropped = 0
+        self.longest_ms = 0.0
+
+    def _tick(self):
+        now = time.perf_counter()
+        interval_ms = (now - self.last) * 1000
+        self.last = now
+        self.frames += 1
+        self.dropped += max(0, int(interval_ms / FRAME_MS) - 1)
+        self.longest_ms = max(self.longest_ms, interval_ms)
+
+    def start(self):
+        self.reset()
+        self.timer.start(FRAME_MS)
+
+    def stop(self):
+        self.timer.stop()
+
+
+def run_step(window, generator, rate, seconds, handler_timer, frame_monitor):
+    """rate(초당 이벤트)로 seconds 초 동안 부하를 주고 결과 dict 를 반환"""
+    from PyQt6.QtCore import QCoreApplication, QEventLoop, Qt
+
+    app = QCoreApplication.instance()
+    batcher = window.message_batcher
+    pushed = {} # id(event) -> 발생 시각
+    latencies = []
+
+    def on_event(event): # 발생 스레드 (batcher.push 보다 먼저 연결됨)
+        pushed[id(event)] = time.perf_counter()
+
+    def on_batch(batch): # message_batch 처리 후
+        now = time.perf_counter()
+        for event in batch:
+            started = pushed.pop(id(event), None)
+            if started is not None: latencies.append(now - started)
+
+    total = int(rate * seconds)
+    feeding_done = threading.Event()
+    def feed():
+        start = time.perf_counter()
+        for i in range(total):
+            wait = start + i / rate - time.perf_counter()
+            if wait > 0: time.sleep(wait)
+            generator.fire()
+        feeding_done.set()
+
+    generator.simulator.test_message.connect(on_event, Qt.ConnectionType.DirectConnection)
+    generator.simulator.test_message.connect(batcher.push, Qt.ConnectionType.DirectConnection)
+    batcher.batch.connect(on_batch)
+    handler_timer.reset()
+    handle_before = batcher.total_handle_ms
+    frame_monitor.start()
+    started = time.perf_counter()
+    threading.Thread(target=feed, name="ChatStorm", daemon=True).start()
+    try:
+        while not feeding_done.is_set() or (len(latencies) < total and time.perf_counter() - started < seconds + DRAIN_SECONDS):
+            app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 50)
+        batcher.flush()
+    finally:
+        elapsed = time.perf_counter() - started
+        frame_monitor.stop()
+        generator.simulator.test_message.disconnect(on_event)
+        generator.simulator.test_message.disconnect(batcher.push)
+        batcher.batch.disconnect(on_batch)
+
+    latencies.sort()
+    handled = len(latencies)
+    return {
+        "rate": rate,
+        "handled_per_second": round(handled / elapsed, 1) if elapsed > 0 else 0.0,
+        "handled": handled,
+        "offered": total,
+        "latency_p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "latency_p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "latency_max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+        "saturation": round((batcher.total_handle_ms - handle_before) / 1000 / elapsed, 3) if elapsed > 0 else 0.0,
+        "dropped_frames": frame_monitor.dropped,
+        "longest_frame_ms": round(frame_monitor.longest_ms, 1),
+        "handler_ms_per_second": {name: round(seconds_spent * 1000 / elapsed, 1) for name, seconds_spent in handler_timer.totals.items()},
+    }
+
+
+def falls_behind(result):
+    return result["handled"] < result["offered"] * MIN_HANDLED_RATIO or result["latency_p95_ms"] > MAX_P95_LATENCY * 1000
+
+
+def start_vote_and_pick(window, vote, pick, vote_options):
+    """투표/추첨 모집을 시작해 투표/추첨 처리기도 부하를 받게 함"""
+    from PyQt6.QtWidgets import QTableWidgetItem
+    try:
+        if vote:
+            for i in range(vote_options):
+                window.vote_tab.result_table_vote.setItem(i, 1, QTableWidgetItem(f"항목 {i + 1}"))
+            window.vote_tab.toggle_button_vote.click()
+        if pick:
+            window.pick_tab.toggle_button_pick.click()
+    except Exception as e:
+        print(f"[ChatStorm] Failed to start vote/pick: {e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="채팅 폭주 부하 테스트")
+    parser.add_argument("--rates", type=int, nargs="+", default=[50, 100, 200, 400, 800, 1600])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--vote", action="store_true", help="투표를 시작한 상태로 측정")
+    parser.add_argument("--pick", action="store_true", help="추첨 모집을 시작한 상태로 측정")
+    parser.add_argument("--vote-options", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--all", action="store_true", help="밀리기 시작해도 모든 단계 실행")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    from app.main_window import BetterCheeseUtil
+    from app.utils.simulator import ChatSimulator
+
+    window = BetterCheeseUtil()
+    start_vote_and_pick(window, args.vote, args.pick, args.vote_options)
+    generator = ChatStormGenerator(ChatSimulator(window), users=args.users, vote_options=args.vote_options, seed=args.seed)
+    handler_timer = HandlerTimer(window)
+    frame_monitor = FrameMonitor()
+
+    sustained = 0
+    print(f"{'rate':>6} {'handled/s':>10} {'p50':>8} {'p95':>8} {'max':>8} {'busy':>6} {'drop':>5}  handlers (ms/s)")
+    try:
+        for rate in args.rates:
+            result = run_step(window, generator, rate, args.seconds, handler_timer, frame_monitor)
+            handlers = " ".join(f"{name}={ms}" for name, ms in result["handler_ms_per_second"].items() if ms)
+            behind = falls_behind(result)
+            print(f"{rate:>6} {result['handled_per_second']:>10} {result['latency_p50_ms']:>6}ms {result['latency_p95_ms']:>6}ms "
+                  f"{result['latency_max_ms']:>6}ms {result['saturation'] * 100:>5.0f}% {result['dropped_frames']:>5}  {handlers}"
+                  + ("  << BEHIND" if behind else ""))
+            if behind:
+                if not args.all: break
+            else:
+                sustained = max(sustained, rate)
+    finally:
+        handler_timer.restore()
+
+    print(f"\n[ChatStorm] Highest rate handled without falling behind: {sustained} events/s")
+    window.close()
+    app.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Space-Saving 상위 K개 빈도 추정
+
+채팅 통계의 '메모리 절약' 모드에서 서로 다른 메시지 수와 관계없이 capacity 개의 카운터만 유지합니다.
+- 카운터가 가득 차면 가장 작은 카운터를 새 항목에 넘겨주고, 넘겨받은 값을 오차(error)로 기록합니다.
+- 추정값 count 는 실제 횟수 이상이고 count - error 는 실제 횟수 이하입니다. (오차 <= 전체 횟수 / capacity)
+"""
+
+import heapq
+
+
+class SpaceSaving:
+    def __init__(self, capacity):
+        self.capacity = max(1, int(capacity))
+        self.total = 0
+        self._counts = {} # 항목 -> 추정 횟수
+        self._errors = {} # 항목 -> 최대 과대 추정치
+        self._heap = []   # (추정 횟수, 항목) - 항목당 하나, 증가분은 꺼낼 때 반영
+
+    def __len__(self):
+        return len(self._counts)
+
+    def update(self, item, weight=1):
+        self.total += weight
+        counts = self._counts
+        if item in counts:
+            counts[item] += weight
+            return
+        if len(counts) < self.capacity:
+            counts[item] = weight
+            self._errors[item] = 0
+            heapq.heappush(self._heap, (weight, item))
+            return
+        min_item, min_count = self._pop_min()
+        del counts[min_item]
+        del self._errors[min_item]
+        counts[item] = min_count + weight
+        self._errors[item] = min_count
+        heapq.heappush(self._heap, (min_count + weight, item))
+
+    def _pop_min(self):
+        heap = self._heap
+        counts = self._counts
+        while True:
+            count, item = heapq.heappop(heap)
+            current = counts[item]
+            if current == count:
+                return item, count
+            heapq.heappush(heap, (current, item)) # 늘어난 횟수로 다시 넣음
+
+    @property
+    def max_error(self):
+        """어떤 항목이든 추정 오차의 상한"""
+        return self.total // self.capacity if len(self._counts) >= self.capacity else 0
+
+    def top(self, n=None):
+        """[(항목, 추정 횟수, 오차)] 를 추정 횟수 내림차순으로 반환"""
+        items = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        if n is not None:
+            items = items[:n]
+        return [(item, count, self._errors[item]) for item, count in items]
@@ -34,9 +34,11 @@ from app.constants import GLOBALFONTSIZE
 from app.resources import resource_path
 from app.constants import GLOBALFONTSIZE, USERPATH
 import shutil
+import multiprocessing
 from engineio.async_drivers import gevent ## [삭제 금지] pyinstaller exe 생성 시 오류 방지를 위해 필요
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support() # pyinstaller exe 에서 채팅 통계 프로세스 풀 사용 시 필요
     # Ensure chat_emoticons.json exists in user directory
     user_json_path = os.path.join(USERPATH, "BCU", "chat_emoticons.json")
     if not os.path.exists(user_json_path):